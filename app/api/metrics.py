@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.api.storage.database import Database
+from app.api.storage.redis import RedisManager
+from app.core.dependencies.common import get_database, get_cache
+from app.core.metrics import registry, db_pool_connections, cache_events
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+)
+async def metrics_endpoint(
+    db: Database = Depends(get_database),
+    cache: RedisManager = Depends(get_cache),
+):
+    """Метрики процесса в текстовом формате Prometheus."""
+    stats = db.get_pool_stats()
+    for state in ("size", "in_use", "idle"):
+        db_pool_connections.set(stats[state], "primary", state)
+    for replica in stats.get("replicas", []):
+        for state in ("size", "in_use"):
+            db_pool_connections.set(replica[state], replica["host"], state)
+
+    for event, value in cache.stats.items():
+        cache_events.set(value, event)
+
+    return PlainTextResponse(
+        registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,198 @@
+import math
+import time
+import asyncio
+from uuid import uuid4
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+from fastapi import Request
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+
+from app.api.storage.redis import RedisManager
+from app.api.v1.exceptions import TooManyRequestsException
+from app.core.dependencies.common import cache
+from app.core.settings import settings
+from app.core.logging import logger
+from app.core.metrics import rate_limit_redis_failures
+
+# Скользящее окно на отсортированном множестве: очистка устаревших
+# отметок, подсчёт и запись новой отметки выполняются атомарно за один
+# запрос. Возвращает 0, если запрос разрешён, иначе время до освобождения
+# места в окне (мс).
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local member = ARGV[3]
+
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+redis.call("ZREMRANGEBYSCORE", key, "-inf", now - window)
+if redis.call("ZCARD", key) < limit then
+    redis.call("ZADD", key, now, member)
+    redis.call("PEXPIRE", key, window)
+    return 0
+end
+
+local oldest = redis.call("ZRANGE", key, 0, 0, "WITHSCORES")
+return math.max(1, tonumber(oldest[2]) + window - now)
+"""
+
+RATE_UNITS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """
+    Разбирает ограничение вида "10/minute".
+
+    Args:
+        rate (str): Ограничение: количество запросов и единица времени.
+
+    Returns:
+        Tuple[int, int]: Количество запросов и размер окна в секундах.
+    """
+    count, _, unit = rate.partition("/")
+    unit = unit.strip().rstrip("s")
+    if unit not in RATE_UNITS:
+        raise ValueError(f"Неизвестная единица времени в ограничении: {rate}")
+    return int(count), RATE_UNITS[unit]
+
+
+class LocalTokenBucket:
+    """
+    Резервный ограничитель на случай недоступного Redis.
+
+    Хранит по корзине токенов на ключ в памяти воркера, число ключей
+    ограничено (вытесняются давно не использованные).
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def hit(self, key: str, limit: int, window: int) -> float:
+        """
+        Регистрирует запрос.
+
+        Returns:
+            float: 0, если запрос разрешён, иначе время ожидания в секундах.
+        """
+        now = time.monotonic()
+        rate = limit / window
+        tokens, updated_at = self._buckets.get(key, (float(limit), now))
+        tokens = min(float(limit), tokens + (now - updated_at) * rate)
+
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / rate
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.maxsize:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class RateLimiter:
+    """
+    Ограничитель частоты запросов на основе скользящего окна в Redis.
+
+    Attributes:
+        cache (RedisManager): Менеджер Redis.
+    """
+
+    def __init__(self, cache: RedisManager):
+        self.cache = cache
+        self._script = None
+        self._fallback = LocalTokenBucket(settings.RATE_LIMIT_LOCAL_MAXSIZE)
+
+    def _get_script(self):
+        """Возвращает скрипт, зарегистрированный для текущего клиента Redis."""
+        if self._script is None or self._script.registered_client is not self.cache.client:
+            self._script = self.cache.client.register_script(SLIDING_WINDOW_SCRIPT)
+        return self._script
+
+    async def hit(self, key: str, limit: int, window: int) -> float:
+        """
+        Регистрирует запрос и проверяет ограничение.
+
+        Если Redis не ответил за RATE_LIMIT_REDIS_TIMEOUT, запрос
+        пропускается без проверки. Если соединения с Redis нет,
+        используется локальная корзина токенов воркера.
+
+        Args:
+            key (str): Ключ ограничения.
+            limit (int): Допустимое количество запросов в окне.
+            window (int): Размер окна в секундах.
+
+        Returns:
+            float: 0, если запрос разрешён, иначе время ожидания в секундах.
+        """
+        try:
+            retry_after_ms = await asyncio.wait_for(
+                self._get_script()(keys=[key], args=[window * 1000, limit, uuid4().hex]),
+                timeout=settings.RATE_LIMIT_REDIS_TIMEOUT
+            )
+            return retry_after_ms / 1000
+        except (asyncio.TimeoutError, RedisTimeoutError):
+            rate_limit_redis_failures.inc("skipped")
+            logger.debug(f"Redis не ответил ограничителю запросов, запрос пропущен: {key}")
+            return 0.0
+        except (RedisConnectionError, OSError) as e:
+            rate_limit_redis_failures.inc("local")
+            logger.warning(f"Ограничитель запросов переключён на локальный режим: {e!r}")
+            return self._fallback.hit(key, limit, window)
+
+    def limit(self, rate: str) -> Callable:
+        """
+        Создаёт dependency, ограничивающую частоту запросов к маршруту.
+
+        Лимит считается отдельно для каждого маршрута и клиента.
+
+        Пример:
+            @router.get("", dependencies=[Depends(get_rate_limiter().limit("60/minute"))])
+
+        Args:
+            rate (str): Ограничение вида "10/minute".
+
+        Returns:
+            Callable: Dependency для FastAPI.
+        """
+        limit, window = parse_rate(rate)
+
+        async def dependency(request: Request) -> None:
+            if not settings.RATE_LIMIT_ENABLED:
+                return
+
+            route = request.scope.get("route")
+            path = route.path if route else request.url.path
+            client = request.client.host if request.client else "unknown"
+            key = f"ratelimit:{request.method}:{path}:{client}"
+
+            retry_after = await self.hit(key, limit, window)
+            if retry_after:
+                logger.warning(f"Превышен лимит запросов {rate}: {key}")
+                raise TooManyRequestsException(math.ceil(retry_after)).to_http()
+
+        return dependency
+
+
+rate_limiter = RateLimiter(cache)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Возвращает ограничитель частоты запросов.
+
+    Returns:
+        RateLimiter: Ограничитель частоты запросов.
+    """
+    return rate_limiter
@@ -1,95 +1,573 @@
+import time
+import asyncio
+import itertools
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
 import aiomysql
-from typing import List, Optional
+import pymysql
+from pymysql.constants import ER
 
 from app.core.settings import settings
-from app.core.logging import logger
+from app.core.logging import logger, db_logger
+from app.core.metrics import db_query_duration, db_pool_acquire_wait
+
+
+# Время последней записи в текущем запросе (контекст задачи asyncio).
+_last_write_at: ContextVar[Optional[float]] = ContextVar("last_write_at", default=None)
+
+# Ошибки соединения, после которых реплика выводится из ротации. Таймаут
+# ожидания соединения (подкласс OSError) обрабатывается отдельно: при
+# занятом пуле он означает нагрузку, а не отказ реплики.
+REPLICA_ERRORS = (
+    pymysql.err.OperationalError,
+    pymysql.err.InterfaceError,
+    OSError,
+)
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """
+    Направляет чтения блока на основной сервер, как после записи.
+
+    Действует в пределах MYSQL_READ_YOUR_WRITES_WINDOW от входа в блок.
+    """
+    token = _last_write_at.set(time.monotonic())
+    try:
+        yield
+    finally:
+        _last_write_at.reset(token)
+
+
+def record_query(started: float, name: Optional[str], query: str, args: Sequence) -> None:
+    """
+    Учитывает длительность запроса в метриках.
+
+    Запрос, выполнявшийся дольше LOG_SLOW_QUERY_MS, логируется целиком.
+
+    Args:
+        started (float): Время начала запроса (time.perf_counter()).
+        name (Optional[str]): Имя запроса для метрик. По умолчанию — первое
+            слово запроса (select, insert, ...).
+        query (str): SQL-запрос.
+        args (Sequence): Параметры запроса.
+    """
+    elapsed = time.perf_counter() - started
+    db_query_duration.observe(elapsed, name or query.split(None, 1)[0].lower())
+
+    elapsed_ms = elapsed * 1000
+    if settings.LOG_SLOW_QUERY_MS and elapsed_ms >= settings.LOG_SLOW_QUERY_MS:
+        logger.opt(depth=1).warning("Медленный запрос ({:.1f} мс): {} | Аргументы: {}", elapsed_ms, query, args)
+
+
+def parse_hosts(hosts: str) -> List[Tuple[str, int]]:
+    """
+    Разбирает список серверов вида "host1:3306,host2".
+
+    Args:
+        hosts (str): Серверы через запятую, порт по умолчанию MYSQL_PORT.
+
+    Returns:
+        List[Tuple[str, int]]: Пары (хост, порт).
+    """
+    result = []
+    for item in hosts.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, port = item.partition(":")
+        result.append((host, int(port) if port else settings.MYSQL_PORT))
+    return result
 
 
 class Database:
     
     def __init__(self):
         self.pool = None
+        self.replicas: List[Tuple[str, int]] = parse_hosts(settings.MYSQL_REPLICA_HOSTS)
+        self.replica_pools: List[aiomysql.Pool] = []
+        self.replica_healthy: List[bool] = []
+        self._replica_order = itertools.count()
+        self._health_check_task: Optional[asyncio.Task] = None
+        self.stats: Dict[str, float] = {
+            "acquire_count": 0,
+            "acquire_wait_total": 0.0,
+            "acquire_wait_max": 0.0,
+            "acquire_timeouts": 0,
+            "replica_reads": 0,
+            "replica_failovers": 0,
+            "replica_acquire_timeouts": 0,
+        }
+
+    async def _create_pool(self, host: str, port: int, minsize: int) -> aiomysql.Pool:
+        """Создание пула соединений с сервером MySQL."""
+        return await aiomysql.create_pool(
+            host=host,
+            port=port,
+            user=settings.MYSQL_USER,
+            password=settings.MYSQL_PASSWORD,
+            db=settings.MYSQL_DATABASE,
+            autocommit=True,
+            minsize=minsize,
+            maxsize=settings.MYSQL_POOL_MAXSIZE,
+            pool_recycle=settings.MYSQL_POOL_RECYCLE,
+            connect_timeout=settings.MYSQL_CONNECT_TIMEOUT
+        )
 
     async def connect(self):
-        """Создание пула соединений с базой данных."""
+        """Создание пулов соединений с основным сервером и репликами."""
         try:
             logger.info("Подключение к базе данных...")
             logger.info(
                 f"Подключение к базе данных: host={settings.MYSQL_HOST}, "
-                f"port={settings.MYSQL_PORT}, user={settings.MYSQL_USER}"
+                f"port={settings.MYSQL_PORT}, user={settings.MYSQL_USER}, "
+                f"pool={settings.MYSQL_POOL_MINSIZE}..{settings.MYSQL_POOL_MAXSIZE}"
             )
-            self.pool = await aiomysql.create_pool(
-                host=settings.MYSQL_HOST,
-                port=settings.MYSQL_PORT,
-                user=settings.MYSQL_USER,
-                password=settings.MYSQL_PASSWORD,
-                db=settings.MYSQL_DATABASE,
-                autocommit=True,
-                maxsize=10
+            self.pool = await self._create_pool(
+                settings.MYSQL_HOST, settings.MYSQL_PORT, settings.MYSQL_POOL_MINSIZE
             )
             logger.success("Успешное подключение к базе данных.")
         except Exception as e:
             logger.error(f"Ошибка при подключении к базе данных: {e}")
             raise
 
+        self.replica_pools = []
+        self.replica_healthy = []
+        for host, port in self.replicas:
+            try:
+                pool = await self._create_pool(host, port, settings.MYSQL_POOL_MINSIZE)
+                healthy = True
+                logger.success(f"Успешное подключение к реплике {host}:{port}.")
+            except Exception as e:
+                # Пул без начальных соединений: реплика вернётся в ротацию
+                # после успешной проверки доступности.
+                pool = await self._create_pool(host, port, 0)
+                healthy = False
+                logger.error(f"Ошибка при подключении к реплике {host}:{port}: {e}")
+            self.replica_pools.append(pool)
+            self.replica_healthy.append(healthy)
+
+        if (
+            self.replica_pools
+            and self._health_check_task is None
+            and settings.MYSQL_REPLICA_HEALTH_CHECK_INTERVAL > 0
+        ):
+            self._health_check_task = asyncio.create_task(self._check_replicas())
+
     async def close(self):
         """Закрытие соединений с базой данных."""
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            try:
+                await self._health_check_task
+            except asyncio.CancelledError:
+                pass
+            self._health_check_task = None
+
         try:
             if self.pool:
-                logger.info("Закрытие соединений с базой данных...")
-                self.pool.close()
-                await self.pool.wait_closed()
+                logger.info(f"Закрытие соединений с базой данных... Статистика пула: {self.get_pool_stats()}")
+                for pool in [self.pool, *self.replica_pools]:
+                    pool.close()
+                    await pool.wait_closed()
                 logger.success("Соединения с базой данных закрыты.")
         except Exception as e:
             logger.error(f"Ошибка при закрытии соединений с базой данных: {e}")
 
-    async def fetch(self, query: str, *args) -> List[dict]:
-        """Выполнение запроса, возвращающего результаты (например SELECT)."""
+    async def _ping(self, pool: aiomysql.Pool):
+        """Проверка доступности сервера запросом SELECT 1."""
+        async with self.acquire(pool) as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute("SELECT 1")
+
+    async def _check_replicas(self):
+        """
+        Периодическая проверка реплик.
+
+        Недоступные реплики выводятся из ротации чтения, восстановившиеся
+        возвращаются в неё.
+        """
+        while True:
+            await asyncio.sleep(settings.MYSQL_REPLICA_HEALTH_CHECK_INTERVAL)
+            for index, pool in enumerate(self.replica_pools):
+                try:
+                    await asyncio.wait_for(
+                        self._ping(pool),
+                        timeout=settings.MYSQL_POOL_ACQUIRE_TIMEOUT
+                    )
+                    healthy = True
+                except asyncio.TimeoutError as e:
+                    if self._pool_busy(pool):
+                        # Все соединения заняты: реплика перегружена, но доступна.
+                        continue
+                    healthy = False
+                    if self.replica_healthy[index]:
+                        logger.error(f"Реплика {self._replica_name(index)} не отвечает: {e!r}")
+                except Exception as e:
+                    healthy = False
+                    if self.replica_healthy[index]:
+                        logger.error(f"Реплика {self._replica_name(index)} недоступна: {e}")
+
+                if healthy and not self.replica_healthy[index]:
+                    logger.success(f"Реплика {self._replica_name(index)} возвращена в ротацию.")
+                self.replica_healthy[index] = healthy
+
+    @staticmethod
+    def _pool_busy(pool: aiomysql.Pool) -> bool:
+        """Все соединения пула открыты и заняты запросами."""
+        return pool.size >= pool.maxsize and pool.freesize == 0
+
+    def _replica_name(self, index: int) -> str:
+        """Адрес реплики для логов и статистики."""
+        host, port = self.replicas[index]
+        return f"{host}:{port}"
+
+    def _pool_name(self, pool: aiomysql.Pool) -> str:
+        """Имя пула для метрик: primary или адрес реплики."""
+        if pool is self.pool:
+            return "primary"
+        return self._replica_name(self.replica_pools.index(pool))
+
+    def _mark_write(self):
+        """Запоминает время записи для чтения своих записей с основного сервера."""
+        _last_write_at.set(time.monotonic())
+
+    def _read_replica(self) -> Optional[int]:
+        """
+        Выбирает реплику для чтения по кругу среди доступных.
+
+        Returns:
+            Optional[int]: Индекс реплики или None, если читать нужно
+                с основного сервера: реплик нет, все недоступны или в текущем
+                запросе недавно была запись.
+        """
+        if not self.replica_pools:
+            return None
+
+        last_write_at = _last_write_at.get()
+        if (
+            last_write_at is not None
+            and time.monotonic() - last_write_at < settings.MYSQL_READ_YOUR_WRITES_WINDOW
+        ):
+            return None
+
+        healthy = [index for index, ok in enumerate(self.replica_healthy) if ok]
+        if not healthy:
+            return None
+        return healthy[next(self._replica_order) % len(healthy)]
+
+    @asynccontextmanager
+    async def acquire(self, pool: Optional[aiomysql.Pool] = None) -> AsyncIterator[aiomysql.Connection]:
+        """
+        Получение соединения из пула с учётом времени ожидания.
+
+        Ожидание ограничено MYSQL_POOL_ACQUIRE_TIMEOUT, время ожидания и
+        таймауты учитываются в stats. Получение соединения выполняется
+        отдельной задачей под shield: если таймаут или отмена совпадут
+        с выдачей соединения, оно вернётся в пул, а не потеряется.
+
+        Args:
+            pool (Optional[aiomysql.Pool]): Пул реплики. По умолчанию пул
+                основного сервера.
+        """
+        pool = pool or self.pool
+        started = time.perf_counter()
+        acquiring = asyncio.ensure_future(pool.acquire())
         try:
-            logger.info(f"Выполнение запроса: {query} | Аргументы: {args}")
-            async with self.pool.acquire() as connection:
-                async with connection.cursor(aiomysql.DictCursor) as cursor:
-                    await cursor.execute(query, args)
-                    result = await cursor.fetchall()
-                    logger.info(f"Запрос выполнен успешно. Получено строк: {len(result)}")
+            connection = await asyncio.wait_for(
+                asyncio.shield(acquiring),
+                timeout=settings.MYSQL_POOL_ACQUIRE_TIMEOUT
+            )
+        except BaseException as e:
+            acquiring.add_done_callback(lambda task: self._release_abandoned(pool, task))
+            acquiring.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                self.stats["acquire_timeouts"] += 1
+                logger.error(
+                    f"Не удалось получить соединение из пула за "
+                    f"{settings.MYSQL_POOL_ACQUIRE_TIMEOUT} сек.: {self.get_pool_stats()}"
+                )
+            raise
+
+        wait = time.perf_counter() - started
+        db_pool_acquire_wait.observe(wait, self._pool_name(pool))
+        self.stats["acquire_count"] += 1
+        self.stats["acquire_wait_total"] += wait
+        self.stats["acquire_wait_max"] = max(self.stats["acquire_wait_max"], wait)
+
+        try:
+            yield connection
+        finally:
+            await pool.release(connection)
+
+    @staticmethod
+    def _release_abandoned(pool: aiomysql.Pool, task: asyncio.Future):
+        """Возвращает в пул соединение, полученное после таймаута или отмены ожидания."""
+        if not task.cancelled() and task.exception() is None:
+            pool.release(task.result())
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Состояние пулов соединений.
+
+        Returns:
+            Dict[str, Any]: Размер пула основного сервера, занятые и свободные
+                соединения, статистика ожидания соединений и состояние реплик.
+        """
+        if not self.pool:
+            return dict(self.stats)
+
+        return {
+            "minsize": self.pool.minsize,
+            "maxsize": self.pool.maxsize,
+            "size": self.pool.size,
+            "in_use": self.pool.size - self.pool.freesize,
+            "idle": self.pool.freesize,
+            **self.stats,
+            "replicas": [
+                {
+                    "host": self._replica_name(index),
+                    "healthy": self.replica_healthy[index],
+                    "size": pool.size,
+                    "in_use": pool.size - pool.freesize,
+                }
+                for index, pool in enumerate(self.replica_pools)
+            ],
+        }
+
+    async def _fetch(
+        self,
+        pool: Optional[aiomysql.Pool],
+        query: str,
+        args: tuple,
+        name: Optional[str]
+    ) -> List[dict]:
+        """Выполнение SELECT на соединении из указанного пула."""
+        async with self.acquire(pool) as connection:
+            async with connection.cursor(aiomysql.DictCursor) as cursor:
+                started = time.perf_counter()
+                await cursor.execute(query, args)
+                result = await cursor.fetchall()
+                record_query(started, name, query, args)
+                return result
+
+    async def fetch(self, query: str, *args, name: Optional[str] = None) -> List[dict]:
+        """
+        Выполнение запроса, возвращающего результаты (например SELECT).
+
+        Запросы распределяются по доступным репликам. При ошибке соединения
+        реплика выводится из ротации, а запрос повторяется на основном сервере.
+        Если соединение реплики не получено за MYSQL_POOL_ACQUIRE_TIMEOUT,
+        запрос тоже повторяется на основном сервере, но реплика с занятым
+        пулом остаётся в ротации: таймаут вызван нагрузкой, а не отказом.
+        name — имя запроса в метриках.
+        """
+        try:
+            db_logger.debug("Выполнение запроса: {} | Аргументы: {}", query, args)
+            replica = self._read_replica()
+            if replica is not None:
+                try:
+                    result = await self._fetch(self.replica_pools[replica], query, args, name)
+                    self.stats["replica_reads"] += 1
+                    db_logger.debug("Запрос выполнен успешно. Получено строк: {}", len(result))
                     return result
+                except asyncio.TimeoutError:
+                    self.stats["replica_acquire_timeouts"] += 1
+                    if not self._pool_busy(self.replica_pools[replica]):
+                        # Соединения свободны, но новое не установлено — реплика не отвечает.
+                        self.replica_healthy[replica] = False
+                        self.stats["replica_failovers"] += 1
+                    logger.warning(
+                        f"Нет соединения с репликой {self._replica_name(replica)} за "
+                        f"{settings.MYSQL_POOL_ACQUIRE_TIMEOUT} сек. "
+                        f"Запрос повторяется на основном сервере."
+                    )
+                except REPLICA_ERRORS as e:
+                    self.replica_healthy[replica] = False
+                    self.stats["replica_failovers"] += 1
+                    logger.error(
+                        f"Реплика {self._replica_name(replica)} выведена из ротации: {e}. "
+                        f"Запрос повторяется на основном сервере."
+                    )
+            result = await self._fetch(None, query, args, name)
+            db_logger.debug("Запрос выполнен успешно. Получено строк: {}", len(result))
+            return result
         except Exception as e:
             logger.error(f"Ошибка при выполнении запроса: {e}")
             raise
 
-    async def execute(self, query: str, *args) -> Optional[int]:
-        """Выполнение запроса без возвращаемых результатов (например INSERT, UPDATE, DELETE)."""
+    async def stream(
+        self,
+        query: str,
+        *args,
+        batch_size: int = 1000,
+        name: Optional[str] = None
+    ) -> AsyncIterator[List[dict]]:
+        """
+        Потоковое чтение результатов запроса серверным курсором.
+
+        Строки читаются из MySQL пачками по мере обработки, поэтому расход
+        памяти не зависит от размера результата. Соединение занято, пока
+        результат не прочитан; при досрочном завершении оно закрывается,
+        а не возвращается в пул, чтобы не дочитывать оставшиеся строки.
+
+        Args:
+            query (str): SQL-запрос.
+            *args: Параметры запроса.
+            batch_size (int): Количество строк в пачке.
+            name (Optional[str]): Имя запроса в метриках.
+
+        Yields:
+            List[dict]: Очередная пачка строк.
+        """
+        db_logger.debug("Потоковое выполнение запроса: {} | Аргументы: {}", query, args)
+        replica = self._read_replica()
+        pool = self.replica_pools[replica] if replica is not None else None
+        rows_total = 0
+        async with self.acquire(pool) as connection:
+            cursor = await connection.cursor(aiomysql.SSDictCursor)
+            exhausted = False
+            try:
+                started = time.perf_counter()
+                await cursor.execute(query, args)
+                record_query(started, name, query, args)
+                while rows := await cursor.fetchmany(batch_size):
+                    rows_total += len(rows)
+                    yield rows
+                exhausted = True
+                db_logger.debug("Потоковый запрос выполнен. Получено строк: {}", rows_total)
+            except Exception as e:
+                logger.error(f"Ошибка при потоковом выполнении запроса: {e}")
+                raise
+            finally:
+                if exhausted:
+                    await cursor.close()
+                else:
+                    connection.close()
+
+    async def _execute(self, query: str, args: tuple, name: Optional[str]) -> Tuple[int, int]:
+        """Выполнение запроса на основном сервере. Возвращает ID последней вставленной записи и число затронутых строк."""
         try:
-            logger.info(f"Выполнение запроса: {query} | Аргументы: {args}")
-            async with self.pool.acquire() as connection:
+            db_logger.debug("Выполнение запроса: {} | Аргументы: {}", query, args)
+            self._mark_write()
+            async with self.acquire() as connection:
                 async with connection.cursor() as cursor:
+                    started = time.perf_counter()
                     await cursor.execute(query, args)
-                    lastrowid = cursor.lastrowid
-                    logger.info(f"Запрос выполнен успешно. ID последней вставленной записи: {lastrowid}")
-                    return lastrowid
+                    record_query(started, name, query, args)
+                    db_logger.debug(
+                        "Запрос выполнен успешно. ID последней вставленной записи: {}, затронуто строк: {}",
+                        cursor.lastrowid, cursor.rowcount
+                    )
+                    return cursor.lastrowid, cursor.rowcount
+        except pymysql.err.IntegrityError as e:
+            # Нарушение уникальности — ожидаемый исход, его обрабатывает вызывающий код.
+            if e.args and e.args[0] == ER.DUP_ENTRY:
+                db_logger.debug("Запись уже существует: {}", e)
+            else:
+                logger.error(f"Ошибка при выполнении запроса: {e}")
+            raise
         except Exception as e:
             logger.error(f"Ошибка при выполнении запроса: {e}")
             raise
 
-    async def start_transaction(self):
-        """Начало транзакции."""
-        logger.info("Начало транзакции...")
-        async with self.pool.acquire() as connection:
-            connection.autocommit(False)
-            self._connection = connection
-
-    async def commit_transaction(self):
-        """Фиксация транзакции."""
-        if hasattr(self, '_connection'):
-            logger.info("Фиксация транзакции...")
-            await self._connection.commit()
-            self._connection.autocommit(True)
-            self._connection = None
-
-    async def rollback_transaction(self):
-        """Откат транзакции."""
-        if hasattr(self, '_connection'):
-            logger.info("Откат транзакции...")
-            await self._connection.rollback()
-            self._connection.autocommit(True)
-            self._connection = None
\ No newline at end of file
+    async def execute(self, query: str, *args, name: Optional[str] = None) -> Optional[int]:
+        """Выполнение запроса без возвращаемых результатов (например INSERT, UPDATE, DELETE)."""
+        lastrowid, _ = await self._execute(query, args, name)
+        return lastrowid
+
+    async def execute_rowcount(self, query: str, *args, name: Optional[str] = None) -> int:
+        """Выполнение запроса изменения данных (например UPDATE, DELETE). Возвращает количество затронутых строк."""
+        _, rowcount = await self._execute(query, args, name)
+        return rowcount
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator["Transaction"]:
+        """
+        Транзакция на одном соединении пула основного сервера.
+
+        Соединение удерживается на всё время блока, при успешном выходе
+        транзакция фиксируется, при исключении — откатывается. Каждый вызов
+        получает своё соединение, поэтому конкурентные запросы не влияют
+        друг на друга.
+
+        Пример:
+            async with db.transaction() as tx:
+                await tx.executemany(query, rows)
+                await tx.execute(other_query, value)
+
+        Yields:
+            Transaction: Транзакция.
+        """
+        self._mark_write()
+        async with self.acquire() as connection:
+            db_logger.debug("Начало транзакции...")
+            await connection.begin()
+            try:
+                yield Transaction(connection)
+            except BaseException:
+                logger.warning("Откат транзакции...")
+                try:
+                    await connection.rollback()
+                except Exception as e:
+                    logger.error(f"Ошибка при откате транзакции: {e}")
+                raise
+            else:
+                db_logger.debug("Фиксация транзакции...")
+                await connection.commit()
+
+
+class Transaction:
+    """
+    Транзакция, выполняющая запросы на одном соединении.
+
+    Создаётся через Database.transaction().
+
+    Attributes:
+        connection (aiomysql.Connection): Соединение транзакции.
+    """
+
+    def __init__(self, connection: aiomysql.Connection):
+        self.connection = connection
+
+    async def fetch(self, query: str, *args, name: Optional[str] = None) -> List[dict]:
+        """Выполнение запроса, возвращающего результаты (например SELECT)."""
+        db_logger.debug("Выполнение запроса в транзакции: {} | Аргументы: {}", query, args)
+        async with self.connection.cursor(aiomysql.DictCursor) as cursor:
+            started = time.perf_counter()
+            await cursor.execute(query, args)
+            result = await cursor.fetchall()
+            record_query(started, name, query, args)
+            return result
+
+    async def execute(self, query: str, *args, name: Optional[str] = None) -> Optional[int]:
+        """Выполнение запроса без возвращаемых результатов. Возвращает ID последней вставленной записи."""
+        db_logger.debug("Выполнение запроса в транзакции: {} | Аргументы: {}", query, args)
+        async with self.connection.cursor() as cursor:
+            started = time.perf_counter()
+            await cursor.execute(query, args)
+            record_query(started, name, query, args)
+            return cursor.lastrowid
+
+    async def executemany(
+        self,
+        query: str,
+        args: Sequence[Sequence],
+        name: Optional[str] = None
+    ) -> int:
+        """
+        Выполнение запроса для набора параметров.
+
+        Вставки вида INSERT ... VALUES объединяются драйвером в один запрос.
+
+        Returns:
+            int: Количество затронутых строк.
+        """
+        db_logger.debug("Пакетное выполнение запроса в транзакции: {} | Строк: {}", query, len(args))
+        async with self.connection.cursor() as cursor:
+            started = time.perf_counter()
+            rowcount = await cursor.executemany(query, args)
+            record_query(started, name, query, f"{len(args)} строк")
+            return rowcount
@@ -0,0 +1,84 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class LocalCache:
+    """
+    Внутрипроцессный LRU-кэш с ограничением размера и TTL.
+
+    Используется как первый уровень перед Redis: горячие ключи отдаются
+    из памяти воркера без сетевого запроса.
+
+    Attributes:
+        maxsize (int): Максимальное количество ключей в кэше.
+        ttl (float): Максимальное время жизни записи в секундах.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0):
+        """
+        Инициализирует LocalCache.
+
+        Args:
+            maxsize (int): Максимальное количество ключей в кэше.
+            ttl (float): Максимальное время жизни записи в секундах.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Получает значение по ключу, если оно есть и не устарело.
+
+        Args:
+            key (str): Ключ.
+
+        Returns:
+            Optional[str]: Значение, если ключ найден, иначе None.
+        """
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        """
+        Сохраняет значение, вытесняя самые старые ключи при переполнении.
+
+        Args:
+            key (str): Ключ.
+            value (str): Значение.
+            ttl (Optional[float]): Время жизни в секундах. Не может превышать
+                TTL локального кэша.
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, *keys: str):
+        """
+        Удаляет ключи из кэша.
+
+        Args:
+            *keys (str): Ключи.
+        """
+        for key in keys:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Очищает кэш."""
+        self._data.clear()
@@ -1,16 +1,87 @@
+import json
+import time
+import asyncio
+from uuid import uuid4
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    Optional,
+    Iterable,
+    Callable,
+    Awaitable,
+    AsyncIterator,
+    Dict,
+    List,
+    Tuple,
+    Union,
+)
+
 import redis.asyncio as redis
-from typing import Optional
 
+from app.api.storage.local_cache import LocalCache
+from app.api.storage.database import primary_reads
 from app.core.settings import settings
-from app.core.logging import logger
+from app.core.logging import logger, cache_logger
+from app.core.metrics import cache_requests, cache_operation_duration, key_prefix
+
+
+# Ключ существует MYSQL_READ_YOUR_WRITES_WINDOW секунд после увеличения
+# версий кэша. Пока он есть, загрузки в кэш читают основной сервер БД:
+# реплика может ещё не получить запись, вызвавшую инвалидацию.
+INVALIDATED_KEY = "cache:invalidated"
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class CachePipeline:
+    """
+    Пакет команд Redis, собираемый в RedisManager.pipeline.
+
+    Команды передаются пайплайну redis-py, результаты выполнения доступны
+    в атрибуте results после выхода из блока.
+
+    Attributes:
+        results (List[Any]): Результаты команд в порядке добавления.
+    """
+
+    def __init__(self, pipe):
+        self._pipe = pipe
+        self.results: List[Any] = []
+
+    def __getattr__(self, name: str):
+        return getattr(self._pipe, name)
+
+    def mark_invalidated(self):
+        """
+        Отмечает инвалидацию версий кэша после записи в БД.
+
+        Команда добавляется последней, чтобы не сдвигать результаты
+        остальных команд пакета.
+        """
+        window_ms = int(settings.MYSQL_READ_YOUR_WRITES_WINDOW * 1000)
+        if window_ms > 0:
+            self._pipe.set(INVALIDATED_KEY, 1, px=window_ms)
 
 
 class RedisManager:
     """
     Менеджер для работы с Redis.
 
+    При включённом LOCAL_CACHE_ENABLED перед Redis работает локальный
+    LRU-кэш воркера. Изменения ключей рассылаются остальным воркерам и
+    репликам через Redis pub/sub, чтобы они удалили устаревшие копии.
+
     Attributes:
         client (Optional[redis.Redis]): Клиент Redis, используемый для операций.
+        local (Optional[LocalCache]): Локальный кэш воркера.
+        instance_id (str): Идентификатор экземпляра для фильтрации своих сообщений.
+        stats (Dict[str, int]): Счётчики get_or_set: попадания, промахи,
+            устаревшие попадания и фоновые обновления.
     """
 
     def __init__(self):
@@ -19,8 +90,29 @@ class RedisManager:
 
         Args:
             client (Optional[redis.Redis]): Клиент Redis, используемый для операций.
+            local (Optional[LocalCache]): Локальный кэш воркера.
         """
         self.client: Optional[redis.Redis] = None
+        self.local: Optional[LocalCache] = None
+        if settings.LOCAL_CACHE_ENABLED:
+            self.local = LocalCache(
+                maxsize=settings.LOCAL_CACHE_MAXSIZE,
+                ttl=settings.LOCAL_CACHE_TTL,
+            )
+        self.instance_id = uuid4().hex
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._release_lock_script = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._refresh_slots = asyncio.Semaphore(settings.CACHE_REFRESH_CONCURRENCY)
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "stale_hits": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "refresh_skipped": 0,
+        }
 
     async def connect(self):
         """Устанавливает соединение с Redis."""
@@ -39,6 +131,11 @@ class RedisManager:
 
             self.client = redis.Redis(**connection_kwargs)
             await self.client.ping()
+            self._release_lock_script = self.client.register_script(RELEASE_LOCK_SCRIPT)
+
+            if self.local is not None:
+                await self._start_invalidation_listener()
+
             logger.success("Успешное подключение к Redis.")
         except Exception as e:
             logger.error(f"Ошибка при подключении к Redis: {e}")
@@ -49,40 +146,179 @@ class RedisManager:
         if self.client:
             try:
                 logger.info("Закрытие соединения с Redis...")
+                for task in list(self._inflight.values()):
+                    task.cancel()
+                await self._stop_invalidation_listener()
                 await self.client.aclose()
                 logger.success("Соединение с Redis закрыто.")
             except Exception as e:
                 logger.error(f"Ошибка при закрытии Redis: {e}")
 
+    async def _start_invalidation_listener(self):
+        """Подписывается на канал инвалидации и запускает его обработку."""
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+        self._listener_task = asyncio.create_task(self._listen_invalidations())
+
+    async def _stop_invalidation_listener(self):
+        """Останавливает обработку канала инвалидации."""
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        if self._pubsub:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+        if self.local is not None:
+            self.local.clear()
+
+    async def _listen_invalidations(self):
+        """Удаляет из локального кэша ключи, изменённые другими экземплярами."""
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Пока подписка не восстановлена, сообщения могут теряться.
+                logger.error(f"Ошибка в канале инвалидации Redis: {e}")
+                self.local.clear()
+                await asyncio.sleep(1)
+
+    def _apply_invalidation(self, data: str):
+        """
+        Применяет сообщение об инвалидации к локальному кэшу.
+
+        Args:
+            data (str): Сообщение в формате {"origin": ..., "keys": [...] | null}.
+        """
+        try:
+            message = json.loads(data)
+        except ValueError:
+            logger.warning(f"Невалидное сообщение инвалидации: {data}")
+            return
+
+        if message.get("origin") == self.instance_id:
+            return
+
+        keys = message.get("keys")
+        if keys is None:
+            self.local.clear()
+        else:
+            self.local.delete(*keys)
+
+    def _invalidation_message(self, keys: Optional[Iterable[str]]) -> str:
+        """
+        Формирует сообщение об инвалидации для остальных экземпляров.
+
+        Args:
+            keys (Optional[Iterable[str]]): Изменённые ключи. None — сбросить всё.
+
+        Returns:
+            str: Сообщение для публикации в канал.
+        """
+        return json.dumps({
+            "origin": self.instance_id,
+            "keys": list(keys) if keys is not None else None,
+        })
+
     async def clear_cache(self):
         """Очищает весь кэш Redis."""
         if self.client:
             try:
                 await self.client.flushdb()
+                if self.local is not None:
+                    self.local.clear()
+                    await self.client.publish(
+                        settings.CACHE_INVALIDATION_CHANNEL,
+                        self._invalidation_message(None),
+                    )
                 logger.info("Кэш Redis успешно очищен.")
             except Exception as e:
                 logger.error(f"Ошибка при очистке кэша Redis: {e}")
 
-    async def get(self, key: str) -> Optional[str]:
+    async def get(self, key: str, expire: Optional[float] = None) -> Optional[str]:
         """
-        Получает значение из Redis по ключу.
+        Получает значение по ключу: сначала из локального кэша, затем из Redis.
 
         Args:
             key (str): Ключ в хранилище.
+            expire (Optional[float]): Время жизни значения в локальном кэше.
+                По умолчанию LOCAL_CACHE_TTL.
 
         Returns:
             Optional[str]: Значение, если ключ найден, иначе None.
         """
+        prefix = key_prefix(key)
+        if self.local is not None:
+            value = self.local.get(key)
+            if value is not None:
+                cache_requests.inc(prefix, "local_hit")
+                return value
+
         try:
+            started = time.perf_counter()
             value = await self.client.get(key)
+            cache_operation_duration.observe(time.perf_counter() - started, "get", prefix)
+            cache_requests.inc(prefix, "hit" if value is not None else "miss")
             if value is not None:
-                logger.info(f"Ключ {key} найден в Redis.")
+                cache_logger.debug("Ключ {} найден в Redis.", key)
+                if self.local is not None:
+                    self.local.set(key, value, expire)
                 return value
-            logger.info(f"Ключ {key} не найден в Redis.")
+            cache_logger.debug("Ключ {} не найден в Redis.", key)
         except Exception as e:
             logger.error(f"Ошибка при получении ключа {key} из Redis: {e}")
             return None
 
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        Получает значения нескольких ключей за один запрос к Redis.
+
+        Ключи, найденные в локальном кэше, в Redis не запрашиваются.
+
+        Args:
+            keys (List[str]): Ключи.
+
+        Returns:
+            List[Optional[str]]: Значения в порядке ключей (None для отсутствующих).
+        """
+        values: List[Optional[str]] = [None] * len(keys)
+        missing: List[int] = []
+
+        for index, key in enumerate(keys):
+            if self.local is not None:
+                values[index] = self.local.get(key)
+            if values[index] is None:
+                missing.append(index)
+            else:
+                cache_requests.inc(key_prefix(key), "local_hit")
+
+        if not missing:
+            return values
+
+        try:
+            started = time.perf_counter()
+            fetched = await self.client.mget([keys[index] for index in missing])
+            cache_operation_duration.observe(
+                time.perf_counter() - started, "mget", key_prefix(keys[missing[0]])
+            )
+            for index, value in zip(missing, fetched):
+                values[index] = value
+                cache_requests.inc(key_prefix(keys[index]), "hit" if value is not None else "miss")
+                if value is not None and self.local is not None:
+                    self.local.set(keys[index], value)
+            cache_logger.debug("Из Redis запрошено ключей: {}.", len(missing))
+        except Exception as e:
+            logger.error(f"Ошибка при получении ключей {keys} из Redis: {e}")
+        return values
+
     async def set(self, key: str, value: str, expire: int = 3600):
         """
         Сохраняет значение в Redis.
@@ -93,41 +329,388 @@ class RedisManager:
             expire (int, optional): Время жизни в секундах. По умолчанию 3600.
         """
         try:
-            await self.client.set(key, value, ex=expire)
-            logger.info(f"Ключ {key} сохранён в Redis (TTL={expire} сек.).")
+            async with self.pipeline(keys=[key]) as pipe:
+                pipe.set(key, value, ex=expire)
+            if self.local is not None:
+                self.local.set(key, value, expire)
+            cache_logger.debug("Ключ {} сохранён в Redis (TTL={} сек.).", key, expire)
         except Exception as e:
             logger.error(f"Ошибка при сохранении ключа {key} в Redis: {e}")
 
-    async def delete(self, key: str):
+    async def mset(self, mapping: Dict[str, str], expire: Union[int, Dict[str, int]] = 3600):
         """
-        Удаляет ключ из Redis.
+        Сохраняет несколько значений за один запрос к Redis.
 
         Args:
-            key (str): Ключ.
+            mapping (Dict[str, str]): Ключи и значения.
+            expire (Union[int, Dict[str, int]], optional): Время жизни в секундах,
+                общее или отдельно для каждого ключа. По умолчанию 3600.
         """
+        if not mapping:
+            return
+
         try:
-            await self.client.delete(key)
-            logger.info(f"Ключ {key} удалён из Redis.")
+            async with self.pipeline(keys=mapping) as pipe:
+                for key, value in mapping.items():
+                    ttl = expire[key] if isinstance(expire, dict) else expire
+                    pipe.set(key, value, ex=ttl)
+
+            if self.local is not None:
+                for key, value in mapping.items():
+                    ttl = expire[key] if isinstance(expire, dict) else expire
+                    self.local.set(key, value, ttl)
+            cache_logger.debug("В Redis сохранено ключей: {}.", len(mapping))
         except Exception as e:
-            logger.error(f"Ошибка при удалении ключа {key} из Redis: {e}")
+            logger.error(f"Ошибка при сохранении ключей {list(mapping)} в Redis: {e}")
 
-    async def increment(self, key: str, expire: int = 1800) -> int:
+    async def delete(self, *keys: str):
+        """
+        Удаляет ключи из Redis за один запрос.
+
+        Args:
+            *keys (str): Ключи.
+        """
+        if not keys:
+            return
+
+        try:
+            async with self.pipeline(keys=keys) as pipe:
+                pipe.delete(*keys)
+            cache_logger.debug("Ключи {} удалены из Redis.", keys)
+        except Exception as e:
+            logger.error(f"Ошибка при удалении ключей {', '.join(keys)} из Redis: {e}")
+
+    async def increment(self, key: str, expire: Optional[int] = 1800) -> int:
         """
         Увеличивает значение ключа. Если ключа нет, создаёт его со значением 1.
 
+        INCR и EXPIRE выполняются атомарно (MULTI/EXEC) за один запрос.
+
         Args:
             key (str): Ключ.
-            expire (int, optional): TTL в секундах. По умолчанию 1800.
+            expire (Optional[int], optional): TTL в секундах. По умолчанию 1800.
+                None — ключ хранится без ограничения по времени.
 
         Returns:
             int: Новое значение ключа.
         """
         try:
-            value = await self.client.incr(key)
-            await self.client.expire(key, expire)
-            logger.info(f"Значение ключа {key} увеличено до {value}.")
+            async with self.pipeline(transaction=True, keys=[key]) as pipe:
+                pipe.incr(key)
+                if expire is not None:
+                    pipe.expire(key, expire)
+            value = pipe.results[0]
+            cache_logger.debug("Значение ключа {} увеличено до {}.", key, value)
             return value
         except Exception as e:
             logger.error(f"Ошибка при увеличении значения ключа {key}: {e}")
             return 0
-    
\ No newline at end of file
+
+    @asynccontextmanager
+    async def pipeline(
+        self,
+        transaction: bool = False,
+        keys: Iterable[str] = ()
+    ) -> AsyncIterator["CachePipeline"]:
+        """
+        Собирает команды в пакет и отправляет их за один запрос при выходе из блока.
+
+        Пример:
+            async with cache.pipeline(keys=[key]) as pipe:
+                pipe.delete(key)
+                pipe.incr(counter)
+            value = pipe.results[1]
+
+        Args:
+            transaction (bool, optional): Выполнить пакет атомарно (MULTI/EXEC).
+            keys (Iterable[str], optional): Ключи, изменяемые пакетом. Они удаляются
+                из локального кэша всех экземпляров.
+
+        Yields:
+            CachePipeline: Пакет команд.
+        """
+        keys = list(keys)
+        async with self.client.pipeline(transaction=transaction) as pipe:
+            batch = CachePipeline(pipe)
+            yield batch
+
+            if keys and self.local is not None:
+                pipe.publish(
+                    settings.CACHE_INVALIDATION_CHANNEL,
+                    self._invalidation_message(keys),
+                )
+            started = time.perf_counter()
+            batch.results = await pipe.execute()
+            cache_operation_duration.observe(
+                time.perf_counter() - started,
+                "pipeline",
+                key_prefix(keys[0]) if keys else ""
+            )
+
+            if keys and self.local is not None:
+                self.local.delete(*keys)
+
+    async def acquire_lock(self, key: str, token: str, expire: float) -> bool:
+        """
+        Захватывает короткоживущую блокировку (SET NX PX).
+
+        Если Redis недоступен, блокировка считается захваченной, чтобы
+        запросы не ждали её освобождения.
+
+        Args:
+            key (str): Ключ блокировки.
+            token (str): Уникальный токен владельца.
+            expire (float): Время жизни блокировки в секундах.
+
+        Returns:
+            bool: True, если блокировка захвачена.
+        """
+        try:
+            acquired = await self.client.set(key, token, nx=True, px=int(expire * 1000))
+            return bool(acquired)
+        except Exception as e:
+            logger.error(f"Ошибка при захвате блокировки {key}, продолжаем без неё: {e}")
+            return True
+
+    async def release_lock(self, key: str, token: str):
+        """
+        Освобождает блокировку, если она всё ещё принадлежит владельцу токена.
+
+        Args:
+            key (str): Ключ блокировки.
+            token (str): Токен владельца.
+        """
+        try:
+            await self._release_lock_script(keys=[key], args=[token])
+        except Exception as e:
+            logger.error(f"Ошибка при освобождении блокировки {key}: {e}")
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[str]],
+        expire: int = 3600,
+        soft_expire: Optional[int] = None
+    ) -> str:
+        """
+        Получает значение из кэша, а при промахе вычисляет его один раз.
+
+        Конкурентные промахи по одному ключу внутри воркера ждут одного
+        вычисления (single-flight). Между воркерами вычисление защищено
+        короткой блокировкой в Redis: остальные ждут, пока значение
+        появится в кэше.
+
+        Если задан soft_expire, запись после него считается устаревшей:
+        она сразу возвращается, а обновление запускается в фоне. Ожидание
+        загрузки происходит только после истечения expire.
+
+        Args:
+            key (str): Ключ.
+            loader (Callable[[], Awaitable[str]]): Функция вычисления значения.
+            expire (int, optional): Время жизни в секундах. По умолчанию 3600.
+            soft_expire (Optional[int], optional): Время свежести записи в секундах.
+
+        Returns:
+            str: Значение из кэша или результат loader.
+        """
+        data = await self.get(key)
+        if data is not None:
+            value, fresh = self._unpack(data, soft_expire)
+            if fresh:
+                self.stats["hits"] += 1
+            else:
+                self.stats["stale_hits"] += 1
+                self._schedule_refresh(key, loader, expire, soft_expire)
+            return value
+
+        self.stats["misses"] += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._load_with_lock(key, loader, expire, soft_expire)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget_inflight(key, task))
+
+        # shield: отмена одного ожидающего не должна прерывать общее вычисление.
+        data = await asyncio.shield(task)
+        if data is None:
+            # Фоновое обновление не получило значения — вычисляем сами.
+            data = await self._load_with_lock(key, loader, expire, soft_expire)
+        return self._unpack(data, soft_expire)[0]
+
+    @staticmethod
+    def _pack(value: str, soft_expire: Optional[int]) -> str:
+        """Добавляет к значению момент, до которого оно считается свежим."""
+        if soft_expire is None:
+            return value
+        return f"{time.time() + soft_expire:.3f}|{value}"
+
+    @staticmethod
+    def _unpack(data: str, soft_expire: Optional[int]) -> Tuple[str, bool]:
+        """
+        Разбирает запись кэша.
+
+        Returns:
+            Tuple[str, bool]: Значение и признак того, что оно ещё свежее.
+        """
+        if soft_expire is None:
+            return data, True
+
+        fresh_until, _, value = data.partition("|")
+        try:
+            return value, float(fresh_until) > time.time()
+        except ValueError:
+            return data, False
+
+    def _forget_inflight(self, key: str, task: asyncio.Task):
+        """Удаляет завершённое вычисление из списка выполняющихся."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[str]],
+        expire: int,
+        soft_expire: int
+    ):
+        """
+        Запускает фоновое обновление устаревшей записи.
+
+        Обновление пропускается, если ключ уже вычисляется или все слоты
+        фоновых обновлений (CACHE_REFRESH_CONCURRENCY) заняты.
+        """
+        if key in self._inflight:
+            return
+        if self._refresh_slots.locked():
+            self.stats["refresh_skipped"] += 1
+            return
+
+        task = asyncio.create_task(self._refresh(key, loader, expire, soft_expire))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._forget_inflight(key, task))
+
+    async def _refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[str]],
+        expire: int,
+        soft_expire: int
+    ) -> Optional[str]:
+        """
+        Обновляет запись в фоне под блокировкой Redis.
+
+        Returns:
+            Optional[str]: Новая запись кэша или None, если значение получить
+                не удалось (ошибка загрузки или ключ обновляет другой экземпляр).
+        """
+        async with self._refresh_slots:
+            lock_key = f"lock:{key}"
+            token = uuid4().hex
+
+            if not await self.acquire_lock(lock_key, token, settings.CACHE_LOCK_TTL):
+                # Запись уже обновляет другой экземпляр.
+                try:
+                    return await self.client.get(key)
+                except Exception as e:
+                    cache_logger.debug("Не удалось прочитать ключ {} во время обновления: {}", key, e)
+                    return None
+
+            try:
+                data = self._pack(await self._load(loader), soft_expire)
+                await self.set(key, data, expire)
+                self.stats["refreshes"] += 1
+                return data
+            except Exception as e:
+                self.stats["refresh_errors"] += 1
+                logger.error(f"Ошибка фонового обновления ключа {key}: {e}")
+                return None
+            finally:
+                await self.release_lock(lock_key, token)
+
+    async def _recently_invalidated(self) -> bool:
+        """Проверяет, увеличивались ли версии кэша за MYSQL_READ_YOUR_WRITES_WINDOW."""
+        try:
+            return bool(await self.client.exists(INVALIDATED_KEY))
+        except Exception as e:
+            cache_logger.debug("Не удалось проверить отметку инвалидации: {}", e)
+            return False
+
+    async def _load(self, loader: Callable[[], Awaitable[str]]) -> str:
+        """
+        Вычисляет значение для кэша.
+
+        Сразу после инвалидации реплики могут отставать, а результат загрузки
+        сохранится под новой версией до истечения TTL. Поэтому в окне
+        MYSQL_READ_YOUR_WRITES_WINDOW после инвалидации загрузка читает
+        основной сервер БД. Без реплик отметка не проверяется.
+        """
+        if settings.MYSQL_REPLICA_HOSTS and await self._recently_invalidated():
+            with primary_reads():
+                return await loader()
+        return await loader()
+
+    async def _load_with_lock(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[str]],
+        expire: int,
+        soft_expire: Optional[int]
+    ) -> str:
+        """
+        Вычисляет значение под блокировкой Redis и сохраняет его в кэш.
+
+        Args:
+            key (str): Ключ.
+            loader (Callable[[], Awaitable[str]]): Функция вычисления значения.
+            expire (int): Время жизни в секундах.
+            soft_expire (Optional[int]): Время свежести записи в секундах.
+
+        Returns:
+            str: Запись кэша (вычисленная или дождавшаяся).
+        """
+        lock_key = f"lock:{key}"
+        token = uuid4().hex
+
+        acquired = await self.acquire_lock(lock_key, token, settings.CACHE_LOCK_TTL)
+        if not acquired:
+            data = await self._wait_for_key(key, lock_key)
+            if data is not None:
+                return data
+            logger.warning(f"Не дождались значения ключа {key}, вычисляем самостоятельно.")
+
+        try:
+            data = self._pack(await self._load(loader), soft_expire)
+            await self.set(key, data, expire)
+            return data
+        finally:
+            if acquired:
+                await self.release_lock(lock_key, token)
+
+    async def _wait_for_key(self, key: str, lock_key: str) -> Optional[str]:
+        """
+        Ожидает, пока другой экземпляр вычислит значение ключа.
+
+        Args:
+            key (str): Ключ значения.
+            lock_key (str): Ключ блокировки вычисления.
+
+        Returns:
+            Optional[str]: Значение или None, если блокировка исчезла без результата.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.CACHE_LOCK_TTL
+
+        while loop.time() < deadline:
+            await asyncio.sleep(settings.CACHE_LOCK_POLL_INTERVAL)
+            try:
+                value = await self.client.get(key)
+                if value is not None:
+                    return value
+                if not await self.client.exists(lock_key):
+                    return None
+            except Exception as e:
+                logger.error(f"Ошибка при ожидании ключа {key}: {e}")
+                return None
+        return None
@@ -0,0 +1,104 @@
+from collections import deque
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+
+# Загрузка пачки ID статей тега: ID меньше before (все, если None)
+# по убыванию, не больше limit штук.
+FetchPostings = Callable[[Optional[int], int], Awaitable[List[int]]]
+
+
+class PostingList:
+    """
+    Отсортированный по убыванию список ID статей одного тега.
+
+    ID читаются пачками по индексу (tag_id, article_id): каждая пачка —
+    поиск по ключу индекса и чтение следующих batch_size записей, поэтому
+    стоимость чтения не зависит от общего числа статей с тегом.
+
+    Attributes:
+        batch_size (int): Размер пачки.
+    """
+
+    def __init__(self, fetch: FetchPostings, before: Optional[int] = None, batch_size: int = 100):
+        self.batch_size = batch_size
+        self._fetch = fetch
+        self._before = before
+        self._buffer: deque = deque()
+        self._exhausted = False
+
+    async def _refill(self):
+        batch = await self._fetch(self._before, self.batch_size)
+        self._buffer.extend(batch)
+        self._exhausted = len(batch) < self.batch_size
+        if batch:
+            self._before = batch[-1]
+
+    async def peek(self) -> Optional[int]:
+        """Текущий (наибольший непрочитанный) ID или None, если список исчерпан."""
+        if not self._buffer and not self._exhausted:
+            await self._refill()
+        return self._buffer[0] if self._buffer else None
+
+    async def seek(self, target: int) -> Optional[int]:
+        """
+        Пропускает ID больше target и возвращает текущий ID.
+
+        Если target меньше всех ID пачки, следующая пачка читается сразу
+        с target, без чтения пропускаемых записей.
+        """
+        while self._buffer and self._buffer[0] > target:
+            self._buffer.popleft()
+        if not self._buffer and not self._exhausted:
+            self._before = target + 1
+            await self._refill()
+        return self._buffer[0] if self._buffer else None
+
+    def pop(self):
+        """Переходит к следующему ID."""
+        self._buffer.popleft()
+
+
+async def intersect(postings: Sequence[PostingList], limit: int) -> List[int]:
+    """
+    Пересечение списков ID (статьи со всеми тегами) по убыванию.
+
+    Списки продвигаются поочерёдно к текущему кандидату (leapfrog), поэтому
+    выгоднее передавать первым самый короткий список.
+    """
+    result: List[int] = []
+    candidate = await postings[0].peek()
+
+    while candidate is not None and len(result) < limit:
+        for posting in postings:
+            head = await posting.seek(candidate)
+            if head is None:
+                return result
+            if head < candidate:
+                candidate = head
+                break
+        else:
+            result.append(candidate)
+            for posting in postings:
+                posting.pop()
+            candidate = await postings[0].peek()
+
+    return result
+
+
+async def union(postings: Sequence[PostingList], limit: int) -> List[int]:
+    """Объединение списков ID (статьи с любым из тегов) по убыванию без повторов."""
+    result: List[int] = []
+
+    while len(result) < limit:
+        heads = [await posting.peek() for posting in postings]
+        present = [head for head in heads if head is not None]
+        if not present:
+            break
+
+        top = max(present)
+        result.append(top)
+        for posting, head in zip(postings, heads):
+            if head == top:
+                posting.pop()
+
+    return result
@@ -0,0 +1,183 @@
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from app.api.storage.database import Database
+
+
+class ArticleRepository:
+    """Репозиторий для работы со статьями в базе данных."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    async def get_articles_page(self, limit: int, offset: int) -> List[dict]:
+        """
+        Получить страницу статей от новых к старым.
+
+        Смещение отсчитывается во вложенном запросе только по индексу
+        (created_at, id), строки с текстом читаются лишь для статей страницы.
+
+        Returns:
+            List[dict]: Статьи страницы.
+        """
+        query = """
+        SELECT a.id, a.title, a.content, a.created_at, a.updated_at
+        FROM articles a
+        JOIN (
+            SELECT id
+            FROM articles
+            ORDER BY created_at DESC, id DESC
+            LIMIT %s OFFSET %s
+        ) page ON page.id = a.id
+        ORDER BY a.created_at DESC, a.id DESC
+        """
+        return await self.db.fetch(query, limit, offset, name="articles.get_articles_page")
+
+    async def get_articles_count(self) -> int:
+        """Получить общее количество статей."""
+        result = await self.db.fetch(
+            "SELECT COUNT(*) AS count FROM articles", name="articles.get_articles_count"
+        )
+        return result[0]["count"] if result else 0
+
+    async def get_articles_watermark(self) -> dict:
+        """
+        Получить отметку изменения статей: количество, наибольший ID и updated_at.
+
+        MAX читаются по одной записи индексов, COUNT(*) — по наименьшему индексу таблицы.
+        """
+        query = """
+        SELECT COUNT(*) AS count, MAX(id) AS max_id, MAX(updated_at) AS updated_at
+        FROM articles
+        """
+        result = await self.db.fetch(query, name="articles.get_articles_watermark")
+        return result[0]
+
+    async def get_articles_by_ids(self, article_ids: Sequence[int]) -> List[dict]:
+        """Получить статьи по списку ID одним запросом (порядок не гарантируется)."""
+        if not article_ids:
+            return []
+        query = f"""
+        SELECT id, title, content, created_at, updated_at
+        FROM articles
+        WHERE id IN ({", ".join(["%s"] * len(article_ids))})
+        """
+        return await self.db.fetch(query, *article_ids, name="articles.get_articles_by_ids")
+
+    async def search_articles(
+        self,
+        query: str,
+        limit: int,
+        offset: int
+    ) -> Tuple[List[dict], Optional[int]]:
+        """
+        Найти статьи по индексу FULLTEXT с ранжированием по релевантности.
+
+        Returns:
+            Tuple[List[dict], Optional[int]]: Статьи по убыванию релевантности
+                и количество найденных статей. None, если страница пуста.
+        """
+        sql = """
+        SELECT
+            id, title, content, created_at, updated_at,
+            COUNT(*) OVER () AS total
+        FROM articles
+        WHERE MATCH(title, content) AGAINST (%s IN NATURAL LANGUAGE MODE)
+        ORDER BY MATCH(title, content) AGAINST (%s IN NATURAL LANGUAGE MODE) DESC, id DESC
+        LIMIT %s OFFSET %s
+        """
+        rows = await self.db.fetch(
+            sql, query, query, limit, offset, name="articles.search_articles"
+        )
+        total = rows[0]["total"] if rows else None
+        for row in rows:
+            del row["total"]
+        return rows, total
+
+    async def search_articles_count(self, query: str) -> int:
+        """Получить количество статей, найденных по индексу FULLTEXT."""
+        sql = """
+        SELECT COUNT(*) AS count
+        FROM articles
+        WHERE MATCH(title, content) AGAINST (%s IN NATURAL LANGUAGE MODE)
+        """
+        result = await self.db.fetch(sql, query, name="articles.search_articles_count")
+        return result[0]["count"] if result else 0
+
+    def stream_articles_updated_since(
+        self,
+        since: Optional[datetime],
+        batch_size: int = 1000
+    ) -> AsyncIterator[List[dict]]:
+        """Потоково получить статьи, изменённые начиная с since (все, если since не задан)."""
+        where_clause = "WHERE updated_at >= %s" if since else ""
+        query = f"""
+        SELECT id, title, content, updated_at
+        FROM articles
+        {where_clause}
+        ORDER BY updated_at, id
+        """
+        args = (since,) if since else ()
+        return self.db.stream(
+            query, *args, batch_size=batch_size, name="articles.stream_articles_updated_since"
+        )
+
+    async def get_tag_article_ids(
+        self,
+        tag_id: int,
+        before: Optional[int],
+        limit: int
+    ) -> List[int]:
+        """
+        Получить ID статей тега по убыванию, начиная с ID меньше before.
+
+        Запрос читает только индекс (tag_id, article_id) и не зависит от
+        общего числа статей с тегом.
+        """
+        query = f"""
+        SELECT article_id
+        FROM article_tags
+        WHERE tag_id = %s {"AND article_id < %s" if before is not None else ""}
+        ORDER BY article_id DESC
+        LIMIT %s
+        """
+        args = (tag_id, before, limit) if before is not None else (tag_id, limit)
+        rows = await self.db.fetch(query, *args, name="articles.get_tag_article_ids")
+        return [row["article_id"] for row in rows]
+
+    async def get_tag_usage_counts(self, tag_ids: Sequence[int]) -> Dict[int, int]:
+        """Получить количество статей существующих тегов по их ID."""
+        if not tag_ids:
+            return {}
+        query = f"""
+        SELECT id, usage_count
+        FROM tags
+        WHERE id IN ({", ".join(["%s"] * len(tag_ids))})
+        """
+        rows = await self.db.fetch(query, *tag_ids, name="articles.get_tag_usage_counts")
+        return {row["id"]: row["usage_count"] for row in rows}
+
+    async def get_tags_for_articles(self, article_ids: Sequence[int]) -> Dict[int, List[dict]]:
+        """
+        Получить теги нескольких статей одним запросом.
+
+        Returns:
+            Dict[int, List[dict]]: Теги (id, name) по ID статьи, отсортированные
+                по названию. Статьи без тегов в словарь не попадают.
+        """
+        if not article_ids:
+            return {}
+
+        query = f"""
+        SELECT at.article_id, t.id, t.name
+        FROM article_tags at
+        JOIN tags t ON t.id = at.tag_id
+        WHERE at.article_id IN ({", ".join(["%s"] * len(article_ids))})
+        ORDER BY t.name
+        """
+        rows = await self.db.fetch(query, *article_ids, name="articles.get_tags_for_articles")
+
+        tags: Dict[int, List[dict]] = {}
+        for row in rows:
+            tags.setdefault(row["article_id"], []).append({"id": row["id"], "name": row["name"]})
+        return tags
@@ -0,0 +1,90 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.api.v1.tags.schemas import DateTimeIso
+
+
+class ArticleTag(BaseModel):
+    """Схема тега в составе статьи."""
+
+    id: int = Field(..., description="Уникальный идентификатор тега")
+    name: str = Field(..., description="Название тега")
+
+
+class Article(BaseModel):
+    """Схема для отображения информации о статье."""
+
+    id: int = Field(..., description="Уникальный идентификатор статьи")
+    title: str = Field(..., description="Заголовок статьи")
+    content: str = Field(..., description="Текст статьи")
+    created_at: DateTimeIso = Field(..., description="Дата и время создания статьи")
+    updated_at: DateTimeIso = Field(..., description="Дата и время последнего обновления статьи")
+    tags: list[ArticleTag] = Field(default_factory=list, description="Теги статьи")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": 1,
+                "title": "Асинхронный Python",
+                "content": "Текст статьи",
+                "created_at": "2023-01-01T00:00:00",
+                "updated_at": "2023-01-01T00:00:00",
+                "tags": [{"id": 1, "name": "python"}]
+            }
+        }
+    )
+
+
+class ArticleList(BaseModel):
+    """Схема для списка статей."""
+
+    items: list[Article] = Field(..., description="Список статей")
+    total: int = Field(..., description="Общее количество статей")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {
+                        "id": 1,
+                        "title": "Асинхронный Python",
+                        "content": "Текст статьи",
+                        "created_at": "2023-01-01T00:00:00",
+                        "updated_at": "2023-01-01T00:00:00",
+                        "tags": [{"id": 1, "name": "python"}]
+                    }
+                ],
+                "total": 1
+            }
+        }
+    )
+
+
+class ArticleFeed(BaseModel):
+    """Схема для ленты статей по тегам с keyset-пагинацией."""
+
+    items: list[Article] = Field(..., description="Список статей")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Курсор следующей страницы (null, если страница последняя)"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {
+                        "id": 1,
+                        "title": "Асинхронный Python",
+                        "content": "Текст статьи",
+                        "created_at": "2023-01-01T00:00:00",
+                        "updated_at": "2023-01-01T00:00:00",
+                        "tags": [{"id": 1, "name": "python"}]
+                    }
+                ],
+                "next_cursor": None
+            }
+        }
+    )
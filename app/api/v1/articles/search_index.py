@@ -0,0 +1,131 @@
+import math
+import re
+import heapq
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+
+# Слова короче innodb_ft_min_token_size (3 по умолчанию) и стоп-слова
+# InnoDB (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD) индекс FULLTEXT
+# не хранит. Индекс в памяти отбрасывает те же слова, поэтому результаты
+# поиска не зависят от ARTICLE_SEARCH_BACKEND.
+MIN_TOKEN_SIZE = 3
+
+TOKEN_PATTERN = re.compile(rf"\w{{{MIN_TOKEN_SIZE},}}")
+
+STOPWORDS = frozenset({
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en",
+    "for", "from", "how", "i", "in", "is", "it", "la", "of", "on", "or",
+    "that", "the", "this", "to", "was", "what", "when", "where", "who",
+    "will", "with", "und", "www",
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Разбивает текст на слова в нижнем регистре без коротких слов и стоп-слов."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class ArticleSearchIndex:
+    """
+    Инвертированный индекс статей в памяти воркера с ранжированием BM25.
+
+    Для каждого слова хранится список статей с частотой слова в статье,
+    поэтому поиск перебирает только статьи, содержащие слова запроса.
+    Индекс пополняется инкрементально: изменённые статьи переиндексируются
+    по отметке updated_at.
+
+    Attributes:
+        k1 (float): Насыщение частоты слова.
+        b (float): Нормализация по длине статьи.
+        watermark (Optional[datetime]): Наибольший updated_at проиндексированных статей.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.watermark: Optional[datetime] = None
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._terms: Dict[int, Dict[str, int]] = {}
+        self._lengths: Dict[int, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    @property
+    def ready(self) -> bool:
+        """Индекс построен хотя бы один раз."""
+        return self.watermark is not None
+
+    def add(self, article_id: int, title: str, content: str) -> bool:
+        """
+        Добавляет статью в индекс или переиндексирует её.
+
+        Returns:
+            bool: True, если слова статьи в индексе изменились.
+        """
+        tokens = tokenize(title) + tokenize(content)
+        terms: Dict[str, int] = {}
+        for token in tokens:
+            terms[token] = terms.get(token, 0) + 1
+
+        if self._terms.get(article_id) == terms:
+            return False
+        self.remove(article_id)
+
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[article_id] = frequency
+        self._terms[article_id] = terms
+        self._lengths[article_id] = len(tokens)
+        self._total_length += len(tokens)
+        return True
+
+    def remove(self, article_id: int):
+        """Удаляет статью из индекса."""
+        terms = self._terms.pop(article_id, None)
+        if terms is None:
+            return
+
+        for term in terms:
+            postings = self._postings[term]
+            del postings[article_id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(article_id)
+
+    def search(self, query: str, limit: int, offset: int = 0) -> Tuple[List[int], int]:
+        """
+        Ищет статьи по словам запроса.
+
+        Args:
+            query (str): Строка поиска.
+            limit (int): Максимальное количество результатов.
+            offset (int): Смещение.
+
+        Returns:
+            Tuple[List[int], int]: ID статей по убыванию релевантности и общее
+                количество найденных статей.
+        """
+        terms = set(tokenize(query))
+        if not terms or not self._lengths:
+            return [], 0
+
+        documents = len(self._lengths)
+        average_length = self._total_length / documents
+        scores: Dict[int, float] = {}
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (documents - len(postings) + 0.5) / (len(postings) + 0.5))
+            for article_id, frequency in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[article_id] / average_length)
+                scores[article_id] = (
+                    scores.get(article_id, 0.0)
+                    + idf * frequency * (self.k1 + 1) / (frequency + norm)
+                )
+
+        top = heapq.nlargest(offset + limit, scores.items(), key=lambda item: (item[1], item[0]))
+        return [article_id for article_id, _ in top[offset:]], len(scores)
@@ -0,0 +1,368 @@
+import time
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+from app.api.v1.articles.repositories import ArticleRepository
+from app.api.v1.articles.search_index import ArticleSearchIndex
+from app.api.v1.articles.postings import PostingList, intersect, union
+from app.api.storage.redis import RedisManager
+
+from app.api.v1.articles.schemas import Article, ArticleList, ArticleFeed
+from app.api.v1.exceptions import ServiceException, TagNotFoundException
+from app.api.v1.pagination import encode_cursor, decode_cursor
+from app.api.v1.conditional import make_etag
+
+from app.core.settings import settings
+from app.core.logging import logger
+
+
+# Версия пространства ключей списков статей. Увеличивается при смене
+# тегов статей и при изменении строк статей (см. sync_list_version).
+ARTICLE_LIST_VERSION_KEY = "article:list:version"
+
+# Последняя отметка строк статей, учтённая в версии списков.
+ARTICLE_ROWS_WATERMARK_KEY = "article:rows:watermark"
+
+# Версия результатов поиска по индексу в памяти. Увеличивается, когда
+# синхронизация добавляет в индекс изменённые статьи.
+ARTICLE_SEARCH_VERSION_KEY = "article:search:version"
+
+
+class ArticleService:
+    """Сервис для работы со статьями с кэшированием."""
+
+    def __init__(
+        self,
+        article_repo: ArticleRepository,
+        cache: RedisManager,
+        search_index: ArticleSearchIndex
+    ):
+        self.article_repo = article_repo
+        self.cache = cache
+        self.search_index = search_index
+        self.cache_prefix = "article:"
+        self.cache_ttl = 3600 # 1 час
+        self.cache_soft_ttl = 300 # 5 минут
+
+    async def _get_cache_key(self, key: str) -> str:
+        """Генерирует ключ для кэша."""
+        return f"{self.cache_prefix}{key}"
+
+    async def _get_list_version(self) -> int:
+        """Возвращает текущую версию пространства ключей списков статей."""
+        version = await self.cache.get(ARTICLE_LIST_VERSION_KEY)
+        return int(version) if version else 0
+
+    async def _get_search_version(self) -> int:
+        """Возвращает текущую версию результатов поиска."""
+        version = await self.cache.get(ARTICLE_SEARCH_VERSION_KEY)
+        return int(version) if version else 0
+
+    async def _bump_version(self, key: str) -> None:
+        """Увеличивает версию пространства ключей."""
+        # Отсутствующая версия начинается с текущего времени в мс,
+        # чтобы не повторять уже выданные значения.
+        initial_version = time.time_ns() // 1_000_000
+        try:
+            async with self.cache.pipeline(keys=[key]) as pipe:
+                pipe.set(key, initial_version, nx=True)
+                pipe.incr(key)
+        except Exception as e:
+            logger.error(f"Ошибка увеличения версии {key}: {str(e)}")
+
+    async def _hydrate(self, articles: List[dict]) -> List[Article]:
+        """Дополняет статьи тегами, загруженными одним запросом на всю страницу."""
+        tags = await self.article_repo.get_tags_for_articles(
+            [article["id"] for article in articles]
+        )
+        return [
+            Article(**article, tags=tags.get(article["id"], []))
+            for article in articles
+        ]
+
+    async def _load_article_list(self, limit: int, offset: int, version: int) -> str:
+        """
+        Загружает страницу статей из БД и сериализует её для кэша.
+
+        Страница читается одним запросом, теги всех статей страницы — вторым,
+        независимо от размера страницы. Общее количество известно без подсчёта
+        на последней странице, иначе оно кэшируется до смены версии списков,
+        и COUNT(*) выполняется один раз на версию.
+        """
+        count_key = await self._get_cache_key(f"count:v{version}")
+        articles = await self.article_repo.get_articles_page(limit, offset)
+
+        if len(articles) < limit and (articles or not offset):
+            total = offset + len(articles)
+        elif cached_count := await self.cache.get(count_key):
+            total = int(cached_count)
+        else:
+            total = await self.article_repo.get_articles_count()
+            await self.cache.set(count_key, str(total), self.cache_ttl)
+
+        result = ArticleList(items=await self._hydrate(articles), total=total)
+        return result.model_dump_json()
+
+    async def get_list_etag(self, *params) -> Optional[str]:
+        """
+        Получить ETag страницы списка статей без загрузки самой страницы.
+
+        Возвращает None, если версия списков неизвестна (ещё не создана
+        или недоступен Redis): тогда ETag нельзя связать с содержимым.
+        """
+        version = await self._get_list_version()
+        if not version:
+            return None
+        return make_etag("articles", version, *params)
+
+    async def get_articles(self, limit: int = 20, offset: int = 0) -> ArticleList:
+        """Получить список статей от новых к старым."""
+        try:
+            validated_limit = min(limit, 100)
+
+            version = await self._get_list_version()
+            cache_key = await self._get_cache_key(
+                f"list:v{version}:{validated_limit}:{offset}"
+            )
+
+            cached_data = await self.cache.get_or_set(
+                cache_key,
+                lambda: self._load_article_list(validated_limit, offset, version),
+                self.cache_ttl,
+                self.cache_soft_ttl
+            )
+
+            try:
+                return ArticleList.model_validate_json(cached_data)
+            except Exception as e:
+                logger.warning(f"Невалидные данные в кэше: {str(e)}")
+                await self.cache.delete(cache_key)
+
+            cached_data = await self._load_article_list(validated_limit, offset, version)
+            return ArticleList.model_validate_json(cached_data)
+
+        except ServiceException as e:
+            raise e.to_http()
+        except Exception as e:
+            logger.error(f"Критическая ошибка: {str(e)}")
+            raise ServiceException("Сервис временно недоступен", 503).to_http()
+
+    async def _load_tag_feed(
+        self,
+        tag_ids: List[int],
+        match_all: bool,
+        limit: int,
+        before: Optional[int]
+    ) -> str:
+        """
+        Загружает страницу статей с тегами и сериализует её для кэша.
+
+        ID статей каждого тега читаются пачками по индексу (tag_id, article_id)
+        начиная с курсора, после чего списки пересекаются (все теги) или
+        объединяются (любой тег). Страница загружается ещё двумя запросами.
+        """
+        usage_counts = await self.article_repo.get_tag_usage_counts(tag_ids)
+        for tag_id in tag_ids:
+            if tag_id not in usage_counts:
+                raise TagNotFoundException(tag_id)
+
+        # Пересечение быстрее, если первым идёт самый редкий тег.
+        ordered_ids = sorted(tag_ids, key=lambda tag_id: usage_counts[tag_id])
+        batch_size = max(limit + 1, 100)
+        postings = [
+            PostingList(
+                lambda after, size, tag_id=tag_id: self.article_repo.get_tag_article_ids(
+                    tag_id, after, size
+                ),
+                before,
+                batch_size
+            )
+            for tag_id in ordered_ids
+        ]
+        merge = intersect if match_all else union
+        article_ids = await merge(postings, limit + 1)
+
+        next_cursor = None
+        if len(article_ids) > limit:
+            article_ids = article_ids[:limit]
+            next_cursor = encode_cursor(article_ids[-1])
+
+        rows = {
+            row["id"]: row
+            for row in await self.article_repo.get_articles_by_ids(article_ids)
+        }
+        articles = [rows[article_id] for article_id in article_ids if article_id in rows]
+
+        result = ArticleFeed(items=await self._hydrate(articles), next_cursor=next_cursor)
+        return result.model_dump_json()
+
+    async def get_articles_by_tags(
+        self,
+        tag_ids: Sequence[int],
+        match_all: bool = True,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> ArticleFeed:
+        """
+        Получить статьи с тегами от новых к старым.
+
+        Статьи упорядочены по убыванию ID (порядок создания) и выбираются
+        по курсору next_cursor предыдущей страницы.
+        """
+        try:
+            validated_limit = min(limit, 100)
+            unique_ids = sorted(set(tag_ids))
+
+            before = None
+            if cursor:
+                before = decode_cursor(cursor, int)[0]
+
+            version = await self._get_list_version()
+            mode = "all" if match_all or len(unique_ids) == 1 else "any"
+            cache_key = await self._get_cache_key(
+                f"feed:v{version}:{mode}:{','.join(map(str, unique_ids))}:"
+                f"{validated_limit}:{before}"
+            )
+
+            cached_data = await self.cache.get_or_set(
+                cache_key,
+                lambda: self._load_tag_feed(unique_ids, match_all, validated_limit, before),
+                self.cache_ttl,
+                self.cache_soft_ttl
+            )
+
+            try:
+                return ArticleFeed.model_validate_json(cached_data)
+            except Exception as e:
+                logger.warning(f"Невалидные данные в кэше: {str(e)}")
+                await self.cache.delete(cache_key)
+
+            cached_data = await self._load_tag_feed(unique_ids, match_all, validated_limit, before)
+            return ArticleFeed.model_validate_json(cached_data)
+
+        except ServiceException as e:
+            raise e.to_http()
+        except Exception as e:
+            logger.error(f"Ошибка при получении статей по тегам: {str(e)}")
+            raise ServiceException("Сервис временно недоступен", 503).to_http()
+
+    async def _load_search_results(self, query: str, limit: int, offset: int) -> str:
+        """
+        Ищет статьи и сериализует страницу результатов для кэша.
+
+        При ARTICLE_SEARCH_BACKEND="memory" и построенном индексе статьи
+        ранжируются индексом BM25 воркера, иначе — индексом FULLTEXT MySQL.
+        """
+        if settings.ARTICLE_SEARCH_BACKEND == "memory" and self.search_index.ready:
+            article_ids, total = self.search_index.search(query, limit, offset)
+            rows = {
+                row["id"]: row
+                for row in await self.article_repo.get_articles_by_ids(article_ids)
+            }
+            # Удалённые статьи не видны по updated_at и убираются при поиске.
+            for article_id in article_ids:
+                if article_id not in rows:
+                    self.search_index.remove(article_id)
+                    total -= 1
+            articles = [rows[article_id] for article_id in article_ids if article_id in rows]
+        else:
+            articles, total = await self.article_repo.search_articles(query, limit, offset)
+            if total is None:
+                total = await self.article_repo.search_articles_count(query) if offset else 0
+
+        result = ArticleList(items=await self._hydrate(articles), total=total)
+        return result.model_dump_json()
+
+    async def search_articles(self, query: str, limit: int = 20, offset: int = 0) -> ArticleList:
+        """Найти статьи по словам из заголовка и текста по убыванию релевантности."""
+        try:
+            validated_limit = min(limit, 100)
+            normalized_query = " ".join(query.lower().split())
+
+            version = await self._get_list_version()
+            search_version = await self._get_search_version()
+            cache_key = await self._get_cache_key(
+                f"search:v{version}.{search_version}:{normalized_query}:{validated_limit}:{offset}"
+            )
+
+            cached_data = await self.cache.get_or_set(
+                cache_key,
+                lambda: self._load_search_results(normalized_query, validated_limit, offset),
+                self.cache_ttl,
+                self.cache_soft_ttl
+            )
+
+            try:
+                return ArticleList.model_validate_json(cached_data)
+            except Exception as e:
+                logger.warning(f"Невалидные данные в кэше: {str(e)}")
+                await self.cache.delete(cache_key)
+
+            cached_data = await self._load_search_results(normalized_query, validated_limit, offset)
+            return ArticleList.model_validate_json(cached_data)
+
+        except ServiceException as e:
+            raise e.to_http()
+        except Exception as e:
+            logger.error(f"Ошибка при поиске статей: {str(e)}")
+            raise ServiceException("Сервис временно недоступен", 503).to_http()
+
+    async def sync_search_index(self) -> int:
+        """
+        Переиндексирует статьи, изменённые с момента прошлой синхронизации.
+
+        При первом вызове индекс строится по всем статьям. Статьи с отметкой,
+        равной прошлой, читаются повторно (updated_at хранит секунды), но
+        учитываются, только если их слова изменились. Если индекс изменился,
+        увеличивается версия результатов поиска, и закэшированные страницы
+        поиска перестают использоваться.
+
+        Returns:
+            int: Количество статей, изменившихся в индексе.
+        """
+        index = self.search_index
+        watermark = index.watermark
+        changed = 0
+
+        async for rows in self.article_repo.stream_articles_updated_since(watermark):
+            for row in rows:
+                changed += index.add(row["id"], row["title"], row["content"])
+                if watermark is None or row["updated_at"] > watermark:
+                    watermark = row["updated_at"]
+
+        index.watermark = watermark or datetime.min
+        if changed:
+            await self._bump_version(ARTICLE_SEARCH_VERSION_KEY)
+        return changed
+
+    async def sync_list_version(self) -> bool:
+        """
+        Увеличивает версию списков статей, если изменились строки статей.
+
+        Статьи создаются, изменяются и удаляются другими сервисами, поэтому
+        их изменения обнаруживаются по отметке строк (количество, наибольший
+        ID и updated_at), которую периодически читает фоновая задача.
+        Запросы к спискам читают только версию из Redis.
+
+        Returns:
+            bool: True, если отметка изменилась и версия увеличена.
+        """
+        row = await self.article_repo.get_articles_watermark()
+        updated_at = row["updated_at"]
+        watermark = (
+            f"{row['count']}.{row['max_id'] or 0}."
+            f"{updated_at.strftime('%Y%m%d%H%M%S') if updated_at else 0}"
+        )
+        if await self.cache.get(ARTICLE_ROWS_WATERMARK_KEY) == watermark:
+            return False
+
+        # Отсутствующая версия начинается с текущего времени в мс,
+        # чтобы не повторять уже выданные значения.
+        initial_version = time.time_ns() // 1_000_000
+        keys = [ARTICLE_ROWS_WATERMARK_KEY, ARTICLE_LIST_VERSION_KEY]
+        async with self.cache.pipeline(keys=keys) as pipe:
+            pipe.set(ARTICLE_ROWS_WATERMARK_KEY, watermark)
+            pipe.set(ARTICLE_LIST_VERSION_KEY, initial_version, nx=True)
+            pipe.incr(ARTICLE_LIST_VERSION_KEY)
+            pipe.mark_invalidated()
+        return True
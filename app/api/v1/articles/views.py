@@ -1,3 +1,141 @@
-from fastapi import APIRouter, Depends
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+
+from app.api.v1.articles.services import ArticleService
+from app.api.v1.articles.search_index import MIN_TOKEN_SIZE
+
+from app.core.dependencies.services import get_article_service
+from app.api.security.rate_limiter import get_rate_limiter
+from app.api.v1.conditional import conditional_response
+
+from app.api.v1.articles.schemas import ArticleList, ArticleFeed
 
 articles_router = APIRouter(prefix="/api/v1/articles", tags=["Articles"])
+
+
+@articles_router.get(
+    "",
+    response_model=ArticleList,
+    status_code=status.HTTP_200_OK,
+    summary="Получить список статей",
+    description="Возвращает статьи от новых к старым вместе с их тегами.",
+    responses={
+        200: {"description": "Успешный запрос"},
+        304: {"description": "Список не изменился (If-None-Match)"},
+        429: {"description": "Слишком много запросов"},
+        503: {"description": "Сервис временно недоступен"}
+    },
+    dependencies=[Depends(get_rate_limiter().limit("60/minute"))]
+)
+async def get_articles_endpoint(
+    response: Response,
+    limit: int = Query(
+        20,
+        ge=1,
+        le=100,
+        description="Ограничение количества статей (максимум 100)"
+    ),
+    offset: int = Query(
+        0,
+        ge=0,
+        description="Смещение для пагинации"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    article_service: ArticleService = Depends(get_article_service),
+):
+    """Получить список статей."""
+    etag = await article_service.get_list_etag("list", min(limit, 100), offset)
+    if not_modified := conditional_response(etag, if_none_match, response):
+        return not_modified
+    return await article_service.get_articles(limit, offset)
+
+
+@articles_router.get(
+    "/search",
+    response_model=ArticleList,
+    status_code=status.HTTP_200_OK,
+    summary="Поиск статей",
+    description="Ищет статьи по словам из заголовка и текста, результаты упорядочены по релевантности.",
+    responses={
+        200: {"description": "Успешный запрос"},
+        429: {"description": "Слишком много запросов"},
+        503: {"description": "Сервис временно недоступен"}
+    },
+    dependencies=[Depends(get_rate_limiter().limit("60/minute"))]
+)
+async def search_articles_endpoint(
+    q: str = Query(
+        ...,
+        min_length=MIN_TOKEN_SIZE,
+        max_length=100,
+        description=f"Строка поиска (минимум {MIN_TOKEN_SIZE} символа)"
+    ),
+    limit: int = Query(
+        20,
+        ge=1,
+        le=100,
+        description="Ограничение количества статей (максимум 100)"
+    ),
+    offset: int = Query(
+        0,
+        ge=0,
+        description="Смещение для пагинации"
+    ),
+    article_service: ArticleService = Depends(get_article_service),
+):
+    """Найти статьи."""
+    return await article_service.search_articles(q, limit, offset)
+
+
+@articles_router.get(
+    "/by-tags",
+    response_model=ArticleFeed,
+    status_code=status.HTTP_200_OK,
+    summary="Получить статьи по тегам",
+    description=(
+        "Возвращает статьи со всеми (match=all) или любым (match=any) из тегов "
+        "от новых к старым с пагинацией по курсору."
+    ),
+    responses={
+        200: {"description": "Успешный запрос"},
+        304: {"description": "Лента не изменилась (If-None-Match)"},
+        400: {"description": "Некорректный курсор"},
+        404: {"description": "Тег не найден"},
+        429: {"description": "Слишком много запросов"},
+        503: {"description": "Сервис временно недоступен"}
+    },
+    dependencies=[Depends(get_rate_limiter().limit("60/minute"))]
+)
+async def get_articles_by_tags_endpoint(
+    response: Response,
+    tag_ids: List[int] = Query(
+        ...,
+        min_length=1,
+        max_length=10,
+        description="ID тегов (от 1 до 10)"
+    ),
+    match: Literal["all", "any"] = Query(
+        "all",
+        description="all — статьи со всеми тегами, any — с любым из тегов"
+    ),
+    limit: int = Query(
+        20,
+        ge=1,
+        le=100,
+        description="Ограничение количества статей (максимум 100)"
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Курсор следующей страницы из next_cursor"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    article_service: ArticleService = Depends(get_article_service),
+):
+    """Получить статьи по тегам."""
+    unique_ids = sorted(set(tag_ids))
+    mode = "all" if match == "all" or len(unique_ids) == 1 else "any"
+    etag = await article_service.get_list_etag("feed", unique_ids, mode, min(limit, 100), cursor)
+    if not_modified := conditional_response(etag, if_none_match, response):
+        return not_modified
+    return await article_service.get_articles_by_tags(tag_ids, match == "all", limit, cursor)
@@ -0,0 +1,95 @@
+import json
+import hashlib
+from typing import Any, Dict, Optional
+
+from fastapi import Response, status
+
+from app.core.settings import settings
+
+
+def make_etag(namespace: str, version: int, *params: Any) -> str:
+    """
+    Строит сильный ETag страницы списка.
+
+    Содержимое страницы определяется версией пространства ключей списков
+    и параметрами запроса, поэтому ETag вычисляется без загрузки страницы.
+
+    Args:
+        namespace (str): Пространство ключей ("tags", "articles").
+        version (int): Версия пространства ключей.
+        *params (Any): Нормализованные параметры запроса.
+
+    Returns:
+        str: ETag в кавычках.
+    """
+    payload = json.dumps(params, separators=(",", ":"), default=str)
+    digest = hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+    return f'"{namespace}-v{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Проверяет заголовок If-None-Match.
+
+    Сравнение слабое (префикс W/ игнорируется), как требует RFC 9110
+    для If-None-Match: CDN может ослабить ETag при сжатии ответа.
+    Значение "*" не поддерживается: ETag вычисляется до проверки
+    параметров, и "*" вернул бы 304 для несуществующего ресурса.
+
+    Args:
+        if_none_match (Optional[str]): Значение заголовка If-None-Match.
+        etag (str): Текущий ETag.
+
+    Returns:
+        bool: True, если у клиента актуальная копия.
+    """
+    if not if_none_match:
+        return False
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    """
+    Заголовки кэширования ответа со списком.
+
+    Args:
+        etag (str): ETag ответа.
+
+    Returns:
+        Dict[str, str]: Заголовки ETag и Cache-Control.
+    """
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, must-revalidate",
+    }
+
+
+def conditional_response(
+    etag: Optional[str],
+    if_none_match: Optional[str],
+    response: Response
+) -> Optional[Response]:
+    """
+    Обрабатывает условный GET-запрос до загрузки страницы.
+
+    Args:
+        etag (Optional[str]): ETag страницы или None, если он неизвестен.
+        if_none_match (Optional[str]): Значение заголовка If-None-Match.
+        response (Response): Ответ эндпоинта для установки заголовков.
+
+    Returns:
+        Optional[Response]: Ответ 304 Not Modified, если у клиента актуальная
+            копия, иначе None (заголовки кэширования уже добавлены в response).
+    """
+    if etag is None:
+        return None
+
+    headers = cache_headers(etag)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -31,6 +31,13 @@ class TooManyRequestsException(ServiceException):
         return http_exception
 
 
+class InvalidCursorException(ServiceException):
+    """Исключение для некорректного курсора пагинации."""
+
+    def __init__(self, cursor: str):
+        super().__init__(f"Некорректный курсор пагинации: {cursor}", 400)
+
+
 # Исключения для статей
 class ArticleNotFoundException(ServiceException):
     """Исключение для ситуации, когда статья не найдена."""
@@ -93,7 +100,12 @@ class TagInUseException(ServiceException):
 
 
 class TagDeletionException(ServiceException):
-    """Исключение для ошибки удаления тега."""
+    """
+    Исключение для непредвиденной ошибки удаления тега.
+
+    Отсутствующий и используемый тег обрабатываются отдельно
+    (TagNotFoundException и TagInUseException).
+    """
 
     def __init__(self, tag_id: int):
-        super().__init__(f"Ошибка при удалении тега с ID {tag_id}.", 500)
+        super().__init__(f"Непредвиденная ошибка при удалении тега с ID {tag_id}.", 500)
@@ -0,0 +1,48 @@
+import json
+import base64
+from typing import Any, List
+
+from app.api.v1.exceptions import InvalidCursorException
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Кодирует позицию keyset-пагинации в непрозрачный курсор.
+
+    Args:
+        *values (Any): Значения ключа сортировки последней записи страницы.
+
+    Returns:
+        str: Курсор для следующей страницы.
+    """
+    payload = json.dumps(values, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> List[Any]:
+    """
+    Декодирует курсор и проверяет типы значений.
+
+    Args:
+        cursor (str): Курсор, полученный от encode_cursor.
+        *types (type): Ожидаемые типы значений.
+
+    Returns:
+        List[Any]: Значения ключа сортировки.
+
+    Raises:
+        InvalidCursorException: Если курсор повреждён или не подходит.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidCursorException(cursor)
+
+    if (
+        not isinstance(values, list)
+        or len(values) != len(types)
+        or not all(isinstance(value, type_) for value, type_ in zip(values, types))
+    ):
+        raise InvalidCursorException(cursor)
+    return values
@@ -0,0 +1,38 @@
+from typing import Any, Optional
+
+import anyio
+from fastapi.responses import StreamingResponse
+from starlette.types import Send
+
+from app.core.logging import logger
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    Потоковый ответ, который всегда закрывает генератор содержимого.
+
+    StreamingResponse прекращает чтение генератора при отключении клиента,
+    но не закрывает его, поэтому ресурсы генератора (например соединение
+    с базой данных) освобождаются только сборщиком мусора. Здесь генератор
+    закрывается при любом завершении ответа, а длительность выгрузки
+    ограничена timeout: медленный клиент не удерживает ресурсы бесконечно.
+
+    Attributes:
+        timeout (Optional[float]): Максимальная длительность выгрузки в секундах.
+    """
+
+    def __init__(self, content: Any, *args, timeout: Optional[float] = None, **kwargs):
+        super().__init__(content, *args, **kwargs)
+        self.timeout = timeout
+
+    async def stream_response(self, send: Send) -> None:
+        try:
+            with anyio.fail_after(self.timeout):
+                await super().stream_response(send)
+        except TimeoutError:
+            logger.warning(f"Потоковый ответ прерван: выгрузка дольше {self.timeout} сек.")
+            raise
+        finally:
+            aclose = getattr(self.body_iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
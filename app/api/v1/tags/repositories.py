@@ -1,95 +1,252 @@
-from typing import Optional, List, Tuple
+from enum import Enum
+from typing import AsyncIterator, Optional, List, Tuple, Sequence
+
+from pymysql.constants import ER
+from pymysql.err import IntegrityError
 
 from app.api.storage.database import Database
 
 
+class TagDeleteStatus(Enum):
+    """Результат удаления тега."""
+
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
+    IN_USE = "in_use"
+
+
 class TagRepository:
     """Репозиторий для работы с тегами в базе данных."""
 
     def __init__(self, db: Database):
         self.db = db
 
-    async def get_tag_by_id(self, tag_id: int) -> Optional[dict]:
-        """Получить тег по ID."""
-        query = """
-        SELECT 
-            t.id, 
-            t.name, 
-            t.created_at, 
-            t.updated_at,
-            COUNT(at.article_id) as usage_count
-        FROM tags t
-        LEFT JOIN article_tags at ON t.id = at.tag_id
-        WHERE t.id = %s
-        GROUP BY t.id, t.name, t.created_at, t.updated_at
-        """
-        tags = await self.db.fetch(query, tag_id)
-        return tags[0] if tags else None
-
-    async def get_tag_by_name(self, name: str) -> Optional[dict]:
-        """Получить тег по имени."""
+    async def get_tags_by_ids(self, tag_ids: Sequence[int]) -> List[dict]:
+        """Получить теги по списку ID одним запросом."""
+        if not tag_ids:
+            return []
+        query = f"""
+        SELECT id, name, created_at, updated_at, usage_count
+        FROM tags
+        WHERE id IN ({", ".join(["%s"] * len(tag_ids))})
+        """
+        return await self.db.fetch(query, *tag_ids, name="tags.get_tags_by_ids")
+
+    async def get_tags_by_names(self, names: Sequence[str]) -> List[dict]:
+        """Получить теги по списку имён одним запросом."""
+        if not names:
+            return []
+        query = f"""
+        SELECT id, name, created_at, updated_at, usage_count
+        FROM tags
+        WHERE name IN ({", ".join(["%s"] * len(names))})
+        """
+        return await self.db.fetch(
+            query,
+            *[name.lower() for name in names],
+            name="tags.get_tags_by_names"
+        )
+
+    async def create_tag(self, name: str) -> Optional[dict]:
+        """
+        Создать новый тег.
+
+        Уникальность имени обеспечивает ограничение UNIQUE, поэтому
+        предварительная проверка не нужна. Время создания задаёт сервер БД;
+        вставленная строка читается на том же соединении, поэтому чтение
+        не зависит от отставания реплик.
+
+        Returns:
+            Optional[dict]: Созданный тег или None, если тег с таким именем
+                уже существует.
+        """
+        async with self.db.transaction() as tx:
+            try:
+                tag_id = await tx.execute(
+                    "INSERT INTO tags (name) VALUES (%s)",
+                    name.lower(),
+                    name="tags.create_tag"
+                )
+            except IntegrityError as e:
+                if e.args and e.args[0] == ER.DUP_ENTRY:
+                    return None
+                raise
+            rows = await tx.fetch(
+                """
+                SELECT id, name, created_at, updated_at, usage_count
+                FROM tags
+                WHERE id = %s
+                """,
+                tag_id,
+                name="tags.create_tag.read"
+            )
+        return rows[0]
+
+    async def create_tags(self, names: Sequence[str]) -> Tuple[List[dict], List[dict]]:
+        """
+        Создать теги пакетом в одной транзакции.
+
+        Новые имена вставляются одним запросом INSERT ... VALUES
+        с ON DUPLICATE KEY UPDATE id = id: совпадение имени не меняет строку,
+        а остальные ошибки (в отличие от INSERT IGNORE) не подавляются.
+        Имена, которые параллельный запрос успел вставить раньше, попадают
+        в существовавшие теги.
+
+        Returns:
+            Tuple[List[dict], List[dict]]: Созданные и уже существовавшие теги.
+        """
+        names = list(dict.fromkeys(name.lower() for name in names))
+        if not names:
+            return [], []
+
+        select = """
+            SELECT id, name, created_at, updated_at, usage_count
+            FROM tags
+            WHERE name IN ({placeholders})
+            ORDER BY name
+        """
+
+        async with self.db.transaction() as tx:
+            existing = await tx.fetch(
+                select.format(placeholders=", ".join(["%s"] * len(names))),
+                *names,
+                name="tags.create_tags.existing"
+            )
+            existing_names = {tag["name"] for tag in existing}
+            new_names = [name for name in names if name not in existing_names]
+            if not new_names:
+                return [], existing
+
+            # Для совпавшего имени ON DUPLICATE KEY UPDATE id = id не меняет
+            # строку и не входит в число затронутых строк.
+            inserted = await tx.executemany(
+                "INSERT INTO tags (name) VALUES (%s) ON DUPLICATE KEY UPDATE id = id",
+                [(name,) for name in new_names],
+                name="tags.create_tags.insert"
+            )
+            new_select = select.format(placeholders=", ".join(["%s"] * len(new_names)))
+            # Обычное чтение идёт по снимку транзакции (REPEATABLE READ,
+            # уровень MySQL по умолчанию) и видит только вставленные ею теги.
+            created = await tx.fetch(new_select, *new_names, name="tags.create_tags.created")
+            if inserted == len(new_names):
+                return created, existing
+
+            # Часть имён вставлена параллельным запросом: такие теги видит
+            # только блокирующее чтение, и они уже существовали.
+            created_ids = {tag["id"] for tag in created}
+            concurrent = [
+                tag for tag in await tx.fetch(
+                    new_select + " FOR SHARE",
+                    *new_names,
+                    name="tags.create_tags.concurrent"
+                )
+                if tag["id"] not in created_ids
+            ]
+        return created, sorted(existing + concurrent, key=lambda tag: tag["name"])
+
+    async def delete_tag(self, tag_id: int) -> TagDeleteStatus:
+        """
+        Удалить тег, если он не используется в статьях.
+
+        Проверка использования и удаление выполняются одним запросом,
+        поэтому между ними не может появиться связь со статьёй. Причина
+        неудачи уточняется вторым запросом, только если тег не удалён.
+        """
         query = """
-        SELECT 
-            t.id, 
-            t.name, 
-            t.created_at, 
-            t.updated_at,
-            COUNT(at.article_id) as usage_count
-        FROM tags t
-        LEFT JOIN article_tags at ON t.id = at.tag_id
-        WHERE t.name = %s
-        GROUP BY t.id, t.name, t.created_at, t.updated_at
-        """
-        tags = await self.db.fetch(query, name.lower())
-        return tags[0] if tags else None
-
-    async def create_tag(self, name: str) -> int:
-        """Создать новый тег и вернуть его ID."""
-        query = "INSERT INTO tags (name) VALUES (%s)"
-        last_id = await self.db.execute(query, name.lower())
-        return last_id
-
-    async def delete_tag(self, tag_id: int) -> bool:
-        """Удалить тег."""
-        query = "DELETE FROM tags WHERE id = %s"
-        affected_rows = await self.db.execute(query, tag_id)
-        return affected_rows > 0
+        DELETE FROM tags
+        WHERE id = %s
+          AND NOT EXISTS (SELECT 1 FROM article_tags WHERE tag_id = %s)
+        """
+        deleted = await self.db.execute_rowcount(query, tag_id, tag_id, name="tags.delete_tag")
+        if deleted:
+            return TagDeleteStatus.DELETED
+
+        exists = await self.db.fetch(
+            "SELECT 1 FROM tags WHERE id = %s", tag_id, name="tags.delete_tag.exists"
+        )
+        return TagDeleteStatus.IN_USE if exists else TagDeleteStatus.NOT_FOUND
 
     async def get_tags(
         self,
         search: Optional[str] = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[Tuple[str, int]] = None
     ) -> List[dict]:
-        """Получить список тегов."""
+        """
+        Получить список тегов.
+
+        Если передан after (имя и ID последнего тега предыдущей страницы),
+        страница выбирается по ключу (name, id) диапазонным чтением индекса,
+        и offset не используется.
+        """
         base_query = """
-            SELECT
-                t.id,
-                t.name,
-                t.created_at,
-                t.updated_at,
-                COUNT(at.article_id) AS usage_count
-            FROM tags t
-            LEFT JOIN article_tags at ON t.id = at.tag_id
+            SELECT id, name, created_at, updated_at, usage_count
+            FROM tags
+        """
+
+        conditions = []
+        params: List = []
+        if search:
+            conditions.append("name LIKE %s")
+            params.append(f"%{search}%")
+        if after:
+            conditions.append("(name > %s OR (name = %s AND id > %s))")
+            params.extend([after[0], after[0], after[1]])
+
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        order = "ORDER BY name, id"
+        pagination = "LIMIT %s" if after else "LIMIT %s OFFSET %s"
+        params.extend([limit] if after else [limit, offset])
+
+        query = " ".join([base_query, where_clause, order, pagination])
+
+        return await self.db.fetch(query, *params, name="tags.get_tags")
+
+    async def get_tags_page(
+        self,
+        search: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> Tuple[List[dict], Optional[int]]:
         """
+        Получить страницу тегов вместе с общим количеством одним запросом.
 
-        where_clause = "WHERE t.name LIKE %s" if search else ""
-        group_order = """
-            GROUP BY t.id, t.name, t.created_at, t.updated_at
-            ORDER BY t.name
+        Количество считается оконной функцией по всем подходящим строкам.
+        Если страница пуста (offset за пределами списка), количество
+        неизвестно и возвращается None.
         """
+        base_query = """
+            SELECT id, name, created_at, updated_at, usage_count,
+                COUNT(*) OVER () AS total
+            FROM tags
+        """
+
+        where_clause = "WHERE name LIKE %s" if search else ""
+        order = "ORDER BY name, id"
         pagination = "LIMIT %s OFFSET %s"
 
-        query = " ".join([base_query, where_clause, group_order, pagination])
+        query = " ".join([base_query, where_clause, order, pagination])
+        params = (f"%{search}%", limit, offset) if search else (limit, offset)
 
-        params: Tuple = ()
-        if search:
-            search_pattern = f"%{search}%"
-            params = (search_pattern, limit, offset)
-        else:
-            params = (limit, offset)
+        rows = await self.db.fetch(query, *params, name="tags.get_tags_page")
+        total = rows[0]["total"] if rows else None
+        for row in rows:
+            del row["total"]
+        return rows, total
+
+    async def get_tag_names(self) -> List[dict]:
+        """Получить ID и имена всех тегов."""
+        return await self.db.fetch("SELECT id, name FROM tags", name="tags.get_tag_names")
 
-        return await self.db.fetch(query, *params)
+    def stream_tags(self, batch_size: int = 1000) -> AsyncIterator[List[dict]]:
+        """Потоково получить все теги пачками в порядке ID."""
+        query = """
+        SELECT id, name, created_at, updated_at, usage_count
+        FROM tags
+        ORDER BY id
+        """
+        return self.db.stream(query, batch_size=batch_size, name="tags.stream_tags")
 
     async def get_tags_count(self, search: Optional[str] = None) -> int:
         """Получить общее количество тегов."""
@@ -99,15 +256,47 @@ class TagRepository:
         query = " ".join([base_query, where_clause])
         params = (f"%{search}%",) if search else ()
 
-        result = await self.db.fetch(query, *params)
+        result = await self.db.fetch(query, *params, name="tags.get_tags_count")
         return result[0]["count"] if result else 0
 
-    async def is_tag_used(self, tag_id: int) -> bool:
-        """Проверить, используется ли тег в статьях."""
-        query = """
-        SELECT COUNT(at.article_id) > 0 as is_used
-        FROM article_tags at
-        WHERE at.tag_id = %s
+    async def reconcile_usage_counts(self) -> List[int]:
+        """
+        Исправить расхождения счётчиков использования с article_tags.
+
+        Связи статей с тегами меняются в обход счётчиков (другими сервисами,
+        каскадным удалением статей), поэтому счётчики поддерживаются сверкой.
+        Счётчики меняются без изменения updated_at тегов.
+
+        Returns:
+            List[int]: ID тегов, счётчики которых были исправлены.
         """
-        result = await self.db.fetch(query, tag_id)
-        return result[0]["is_used"] if result else False
\ No newline at end of file
+        actual_counts = """
+            SELECT tag_id, COUNT(*) AS usage_count
+            FROM article_tags
+            GROUP BY tag_id
+        """
+        drifted = await self.db.fetch(
+            f"""
+            SELECT t.id
+            FROM tags t
+            LEFT JOIN ({actual_counts}) c ON c.tag_id = t.id
+            WHERE t.usage_count <> COALESCE(c.usage_count, 0)
+            """,
+            name="tags.reconcile_usage_counts.drifted"
+        )
+        drifted_ids = [row["id"] for row in drifted]
+        if not drifted_ids:
+            return []
+
+        placeholders = ", ".join(["%s"] * len(drifted_ids))
+        await self.db.execute(
+            f"""
+            UPDATE tags t
+            LEFT JOIN ({actual_counts}) c ON c.tag_id = t.id
+            SET t.usage_count = COALESCE(c.usage_count, 0), t.updated_at = t.updated_at
+            WHERE t.id IN ({placeholders})
+            """,
+            *drifted_ids,
+            name="tags.reconcile_usage_counts.update"
+        )
+        return drifted_ids
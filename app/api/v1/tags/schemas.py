@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Optional
 from datetime import datetime
 
 from pydantic.functional_serializers import PlainSerializer
@@ -36,6 +36,17 @@ class TagCreate(TagBase):
     pass
 
 
+class TagBulkCreate(BaseModel):
+    """Схема для пакетного создания тегов."""
+
+    items: list[TagCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Создаваемые теги (от 1 до 100)"
+    )
+
+
 class TagUpdate(BaseModel):
     """Схема для обновления тега."""
 
@@ -92,6 +103,10 @@ class TagList(BaseModel):
 
     items: list[Tag] = Field(..., description="Список тегов")
     total: int = Field(..., description="Общее количество тегов")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Курсор следующей страницы (null, если страница последняя)"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -105,7 +120,67 @@ class TagList(BaseModel):
                         "usage_count": 42
                     }
                 ],
-                "total": 1
+                "total": 1,
+                "next_cursor": None
+            }
+        }
+    )
+
+
+class TagBulkCreateResult(BaseModel):
+    """Схема результата пакетного создания тегов."""
+
+    created: list[Tag] = Field(..., description="Созданные теги")
+    existing: list[Tag] = Field(..., description="Теги, которые уже существовали")
+
+
+class TagResolve(BaseModel):
+    """Схема запроса на получение тегов по ID и именам."""
+
+    ids: list[int] = Field(
+        default_factory=list,
+        max_length=100,
+        description="ID тегов (не более 100)"
+    )
+    names: list[str] = Field(
+        default_factory=list,
+        max_length=100,
+        description="Названия тегов (не более 100)"
+    )
+
+    @field_validator('names')
+    def normalize_names(cls, v: list[str]) -> list[str]:
+        """Приведение названий к нижнему регистру."""
+        return [name.strip().lower() for name in v]
+
+
+class TagResolveResult(BaseModel):
+    """Схема результата получения тегов по ID и именам."""
+
+    items: list[Tag] = Field(..., description="Найденные теги")
+    missing_ids: list[int] = Field(..., description="ID, для которых тег не найден")
+    missing_names: list[str] = Field(..., description="Названия, для которых тег не найден")
+
+
+class TagSuggestion(BaseModel):
+    """Схема подсказки тега."""
+
+    id: int = Field(..., description="Уникальный идентификатор тега")
+    name: str = Field(..., description="Название тега")
+
+
+class TagSuggestionList(BaseModel):
+    """Схема списка подсказок тегов."""
+
+    items: list[TagSuggestion] = Field(..., description="Подходящие теги")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {"id": 1, "name": "python"},
+                    {"id": 2, "name": "cpython"}
+                ]
             }
         }
     )
\ No newline at end of file
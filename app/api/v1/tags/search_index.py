@@ -0,0 +1,118 @@
+import asyncio
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set
+
+
+def bigrams(text: str) -> Set[str]:
+    """Возвращает множество биграмм строки."""
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class TagSearchIndex:
+    """
+    Индекс тегов в памяти воркера для автодополнения.
+
+    Префиксные совпадения ищутся бинарным поиском по отсортированному
+    массиву имён, совпадения по подстроке — пересечением списков биграмм.
+
+    Attributes:
+        version (Optional[int]): Версия каталога тегов, по которой построен индекс.
+        lock (asyncio.Lock): Блокировка перестроения индекса.
+        rebuild_task (Optional[asyncio.Task]): Выполняющееся фоновое перестроение.
+    """
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self.lock = asyncio.Lock()
+        self.rebuild_task: Optional[asyncio.Task] = None
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._names_by_id: Dict[int, str] = {}
+        self._grams: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def build(self, tags: Iterable[dict], version: Optional[int]):
+        """
+        Перестраивает индекс по полному списку тегов.
+
+        Args:
+            tags (Iterable[dict]): Теги с полями id и name.
+            version (Optional[int]): Версия каталога тегов.
+        """
+        ids = {tag["name"]: tag["id"] for tag in tags}
+        grams: Dict[str, Set[str]] = {}
+        for name in ids:
+            for gram in bigrams(name):
+                grams.setdefault(gram, set()).add(name)
+
+        self._names = sorted(ids)
+        self._ids = ids
+        self._names_by_id = {tag_id: name for name, tag_id in ids.items()}
+        self._grams = grams
+        self.version = version
+
+    def clear(self):
+        """Очищает индекс: следующий запрос подсказок построит его заново."""
+        self.build([], None)
+
+    def add(self, tag_id: int, name: str):
+        """Добавляет тег в индекс."""
+        if name in self._ids:
+            return
+        self._names.insert(bisect_left(self._names, name), name)
+        self._ids[name] = tag_id
+        self._names_by_id[tag_id] = name
+        for gram in bigrams(name):
+            self._grams.setdefault(gram, set()).add(name)
+
+    def remove(self, tag_id: int):
+        """Удаляет тег из индекса."""
+        name = self._names_by_id.pop(tag_id, None)
+        if name is None:
+            return
+        del self._ids[name]
+        del self._names[bisect_left(self._names, name)]
+        for gram in bigrams(name):
+            names = self._grams.get(gram)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._grams[gram]
+
+    def suggest(self, query: str, limit: int) -> List[dict]:
+        """
+        Ищет теги для автодополнения.
+
+        Сначала возвращаются теги, начинающиеся с query, затем теги,
+        содержащие query в середине имени; внутри групп — по алфавиту.
+
+        Args:
+            query (str): Строка поиска (не короче 2 символов).
+            limit (int): Максимальное количество результатов.
+
+        Returns:
+            List[dict]: Теги с полями id и name.
+        """
+        result: List[str] = []
+
+        start = bisect_left(self._names, query)
+        for name in self._names[start:start + limit]:
+            if not name.startswith(query):
+                break
+            result.append(name)
+
+        if len(result) < limit:
+            postings = sorted(
+                (self._grams.get(gram, set()) for gram in bigrams(query)),
+                key=len
+            )
+            candidates = set.intersection(*postings) if postings else set()
+            infix = sorted(
+                name for name in candidates
+                if query in name and not name.startswith(query)
+            )
+            result.extend(infix[:limit - len(result)])
+
+        return [{"id": self._ids[name], "name": name} for name in result]
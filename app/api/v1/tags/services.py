@@ -1,12 +1,24 @@
-from typing import Optional
+import time
+import asyncio
+from contextlib import aclosing
+from typing import AsyncIterator, Optional, List, Tuple, Dict, Sequence, Callable
 
-from app.api.v1.tags.repositories import TagRepository
+from app.api.v1.tags.repositories import TagRepository, TagDeleteStatus
+from app.api.v1.articles.services import ARTICLE_LIST_VERSION_KEY
+from app.api.v1.tags.search_index import TagSearchIndex
+from app.api.v1.pagination import encode_cursor, decode_cursor
+from app.api.v1.conditional import make_etag
 from app.api.storage.redis import RedisManager
 
 from app.api.v1.tags.schemas import (
     TagCreate,
+    TagBulkCreate,
+    TagBulkCreateResult,
+    TagResolveResult,
     Tag,
     TagList,
+    TagSuggestion,
+    TagSuggestionList,
 )
 
 from app.api.v1.exceptions import (
@@ -24,42 +36,261 @@ from app.core.logging import logger
 class TagService:
     """Сервис для управления тегами с кэшированием."""
 
-    def __init__(self, tag_repo: TagRepository, cache: RedisManager):
+    def __init__(
+        self,
+        tag_repo: TagRepository,
+        cache: RedisManager,
+        search_index: TagSearchIndex
+    ):
         self.tag_repo = tag_repo
         self.cache = cache
+        self.search_index = search_index
         self.cache_prefix = "tag:"
         self.cache_ttl = 3600 # 1 час
+        self.cache_soft_ttl = 300 # 5 минут
+        self.negative_cache_ttl = 60 # 1 минута
+        self.negative_marker = "null"
 
     async def _get_cache_key(self, key: str) -> str:
         """Генерирует ключ для кэша."""
         return f"{self.cache_prefix}{key}"
 
-    async def _invalidate_tag_cache(self, tag_id: int, tag_name: str) -> None:
-        """Инвалидирует кэш для тега."""
-        await self.cache.delete(await self._get_cache_key(f"id:{tag_id}"))
-        await self.cache.delete(await self._get_cache_key(f"name:{tag_name}"))
-        await self.cache.delete(await self._get_cache_key("list:all"))
+    async def _get_list_version(self) -> int:
+        """
+        Возвращает текущую версию пространства ключей списков тегов.
+
+        Версия входит в ключ каждой страницы списка, поэтому её увеличение
+        делает недоступными сразу все закэшированные страницы и результаты
+        поиска без перебора ключей.
+        """
+        version = await self.cache.get(await self._get_cache_key("list:version"))
+        return int(version) if version else 0
+
+    async def _get_catalog_version(self) -> int:
+        """
+        Возвращает версию каталога тегов.
+
+        В отличие от версии списков, меняется только при создании и удалении
+        тегов, а не при изменении счётчиков использования.
+        """
+        version = await self.cache.get(await self._get_cache_key("catalog:version"))
+        return int(version) if version else 0
+
+    async def _invalidate(
+        self,
+        keys: List[str],
+        catalog_changed: bool = False,
+        articles_changed: bool = False
+    ) -> Optional[int]:
+        """
+        Удаляет ключи и увеличивает версию списков тегов за один запрос к Redis.
+
+        Args:
+            keys (List[str]): Ключи кэша для удаления.
+            catalog_changed (bool): Теги были созданы или удалены — увеличить
+                также версию каталога.
+            articles_changed (bool): Изменились теги статей — увеличить также
+                версию списков статей.
+
+        Returns:
+            Optional[int]: Новая версия каталога, если она увеличивалась.
+        """
+        versions = [await self._get_cache_key("list:version")]
+        if catalog_changed:
+            versions.append(await self._get_cache_key("catalog:version"))
+        if articles_changed:
+            versions.append(ARTICLE_LIST_VERSION_KEY)
+
+        # Отсутствующая версия (после сброса или вытеснения Redis) начинается
+        # с текущего времени в мс, чтобы не повторять уже выданные значения.
+        initial_version = time.time_ns() // 1_000_000
+
+        try:
+            async with self.cache.pipeline(keys=[*keys, *versions]) as pipe:
+                if keys:
+                    pipe.delete(*keys)
+                for version_key in versions:
+                    pipe.set(version_key, initial_version, nx=True)
+                    pipe.incr(version_key)
+                pipe.mark_invalidated()
+            if catalog_changed:
+                # Результаты: [DELETE], SET NX и INCR версии списков,
+                # SET NX и INCR версии каталога.
+                return pipe.results[(1 if keys else 0) + 3]
+        except Exception as e:
+            logger.error(f"Ошибка инвалидации кэша тегов: {str(e)}")
+        return None
+
+    async def _invalidate_tag_cache(self, tag_id: int) -> None:
+        """
+        Инвалидирует кэш удалённого тега.
+
+        Достаточно удалить ключ по ID: ссылка по имени на удалённый тег
+        будет обнаружена при чтении.
+        """
+        catalog_version = await self._invalidate(
+            [await self._get_cache_key(f"id:{tag_id}")],
+            catalog_changed=True
+        )
+        self._update_search_index(catalog_version, lambda: self.search_index.remove(tag_id))
+
+    async def _invalidate_tags(self, tag_ids: List[int], articles_changed: bool = False) -> None:
+        """Инвалидирует кэш тегов по ID и все списки тегов."""
+        await self._invalidate(
+            [await self._get_cache_key(f"id:{tag_id}") for tag_id in tag_ids],
+            articles_changed=articles_changed
+        )
+
+    def _update_search_index(self, catalog_version: Optional[int], update: Callable) -> None:
+        """
+        Применяет изменение каталога к индексу поиска воркера.
+
+        Изменение применяется, только если индекс построен по предыдущей
+        версии каталога, то есть других изменений с момента построения не было.
+        Иначе индекс будет перестроен в фоне при следующем запросе подсказок.
+        """
+        index = self.search_index
+        if catalog_version is not None and index.version == catalog_version - 1:
+            update()
+            index.version = catalog_version
+
+    async def _cache_tags(self, tags: List[Tag], missing_keys: Sequence[str] = ()) -> None:
+        """
+        Сохраняет теги в кэш по ID и по имени одним запросом.
+
+        Ключи из missing_keys кэшируются как отсутствующие на negative_cache_ttl.
+        """
+        mapping = {}
+        expire = {}
+        for tag in tags:
+            for key, value in (
+                (await self._get_cache_key(f"id:{tag.id}"), tag.model_dump_json()),
+                (await self._get_cache_key(f"name:{tag.name}"), str(tag.id)),
+            ):
+                mapping[key] = value
+                expire[key] = self.cache_ttl
+        for key in missing_keys:
+            mapping[key] = self.negative_marker
+            expire[key] = self.negative_cache_ttl
+        await self.cache.mset(mapping, expire)
+
+    async def resolve_tags(self, ids: List[int], names: List[str]) -> TagResolveResult:
+        """
+        Получить теги по спискам ID и имён.
+
+        Теги ищутся в кэше двумя запросами MGET (имя → ID, ID → тег),
+        в базу данных уходят только промахи кэша.
+        """
+        try:
+            ids = list(dict.fromkeys(ids))
+            names = list(dict.fromkeys(names))
+            found: Dict[int, Tag] = {}
+            negative_ids = set()
+            negative_names = set()
+
+            name_keys = [await self._get_cache_key(f"name:{name}") for name in names]
+            name_ids: Dict[str, int] = {}
+            for name, cached_id in zip(names, await self.cache.mget(name_keys)):
+                if cached_id == self.negative_marker:
+                    negative_names.add(name)
+                elif cached_id:
+                    name_ids[name] = int(cached_id)
+
+            lookup_ids = list(dict.fromkeys([*ids, *name_ids.values()]))
+            id_keys = [await self._get_cache_key(f"id:{tag_id}") for tag_id in lookup_ids]
+            for tag_id, cached_data in zip(lookup_ids, await self.cache.mget(id_keys)):
+                if cached_data == self.negative_marker:
+                    negative_ids.add(tag_id)
+                elif cached_data:
+                    try:
+                        found[tag_id] = Tag.model_validate_json(cached_data)
+                    except Exception as e:
+                        logger.warning(f"Невалидные данные в кэше: {str(e)}")
+
+            id_misses = [
+                tag_id for tag_id in ids
+                if tag_id not in found and tag_id not in negative_ids
+            ]
+            # Ссылка по имени на удалённый тег считается промахом.
+            name_misses = [
+                name for name in names
+                if name not in negative_names
+                and not (name in name_ids and name_ids[name] in found
+                         and found[name_ids[name]].name == name)
+            ]
+
+            if id_misses or name_misses:
+                rows_by_id, rows_by_name = await asyncio.gather(
+                    self.tag_repo.get_tags_by_ids(id_misses),
+                    self.tag_repo.get_tags_by_names(name_misses)
+                )
+                loaded = {row["id"]: Tag(**row) for row in [*rows_by_id, *rows_by_name]}
+                found.update(loaded)
+
+                loaded_names = {tag.name for tag in loaded.values()}
+                missing_keys = [
+                    await self._get_cache_key(f"id:{tag_id}")
+                    for tag_id in id_misses if tag_id not in loaded
+                ] + [
+                    await self._get_cache_key(f"name:{name}")
+                    for name in name_misses if name not in loaded_names
+                ]
+                await self._cache_tags(list(loaded.values()), missing_keys)
+                logger.info(
+                    f"Теги из базы данных: запрошено {len(id_misses)} ID "
+                    f"и {len(name_misses)} имён, найдено {len(loaded)}"
+                )
+
+            by_name = {tag.name: tag for tag in found.values()}
+            items: Dict[int, Tag] = {}
+            missing_ids = []
+            missing_names = []
+            for tag_id in ids:
+                if tag_id in found:
+                    items[tag_id] = found[tag_id]
+                else:
+                    missing_ids.append(tag_id)
+            for name in names:
+                if tag := by_name.get(name):
+                    items[tag.id] = tag
+                else:
+                    missing_names.append(name)
+
+            return TagResolveResult(
+                items=list(items.values()),
+                missing_ids=missing_ids,
+                missing_names=missing_names
+            )
+
+        except ServiceException as e:
+            raise e.to_http()
+        except Exception as e:
+            logger.error(f"Ошибка при получении тегов по ID и именам: {str(e)}")
+            raise ServiceException("Ошибка при получении тегов", 500).to_http()
 
     async def create_tag(self, tag_data: TagCreate) -> Tag:
-        """Создать новый тег."""
+        """
+        Создать новый тег.
+
+        Дубликаты отсекаются ограничением UNIQUE при вставке, без
+        предварительной проверки, поэтому одновременные запросы не создадут
+        два тега с одним именем.
+        """
         try:
-            existing_tag = await self.tag_repo.get_tag_by_name(tag_data.name)
-            if existing_tag:
+            tag = await self.tag_repo.create_tag(tag_data.name)
+            if tag is None:
                 logger.warning(f"Попытка создания дубликата тега: {tag_data.name}")
                 raise TagAlreadyExistsException(tag_data.name)
 
-            tag_id = await self.tag_repo.create_tag(tag_data.name)
-            if not tag_id:
-                logger.error("Не удалось создать тег: не получен ID")
-                raise TagValidationException("Не удалось создать тег")
-
-            tag = await self.tag_repo.get_tag_by_id(tag_id)
-            if not tag:
-                logger.error(f"Созданный тег не найден: ID {tag_id}")
-                raise TagNotFoundException(tag_id)
-
-            logger.info(f"Создан новый тег: {tag['name']} (ID: {tag_id})")
-            return Tag(**tag)
+            result = Tag(**tag)
+            await self._cache_tags([result])
+            catalog_version = await self._invalidate([], catalog_changed=True)
+            self._update_search_index(
+                catalog_version,
+                lambda: self.search_index.add(result.id, result.name)
+            )
+            logger.info(f"Создан новый тег: {result.name} (ID: {result.id})")
+            return result
 
         except ValueError as e:
             logger.error(f"Ошибка валидации тега: {str(e)}")
@@ -70,31 +301,60 @@ class TagService:
             logger.error(f"Неожиданная ошибка при создании тега: {str(e)}")
             raise TagValidationException("Внутренняя ошибка сервера при создании тега")
 
+    async def create_tags(self, tags_data: TagBulkCreate) -> TagBulkCreateResult:
+        """
+        Создать теги пакетом.
+
+        Теги вставляются одним запросом, кэш инвалидируется один раз на пакет.
+        """
+        try:
+            created, existing = await self.tag_repo.create_tags(
+                [tag.name for tag in tags_data.items]
+            )
+            result = TagBulkCreateResult(
+                created=[Tag(**tag) for tag in created],
+                existing=[Tag(**tag) for tag in existing]
+            )
+
+            await self._cache_tags(result.created + result.existing)
+            if result.created:
+                catalog_version = await self._invalidate([], catalog_changed=True)
+
+                def add_to_index():
+                    for tag in result.created:
+                        self.search_index.add(tag.id, tag.name)
+
+                self._update_search_index(catalog_version, add_to_index)
+
+            logger.info(
+                f"Пакетное создание тегов: создано {len(result.created)}, "
+                f"уже существовало {len(result.existing)}"
+            )
+            return result
+
+        except ServiceException as e:
+            raise e.to_http()
+        except Exception as e:
+            logger.error(f"Неожиданная ошибка при пакетном создании тегов: {str(e)}")
+            raise ServiceException("Ошибка при пакетном создании тегов", 500).to_http()
+
     async def delete_tag(self, tag_id: int) -> None:
-        """Удалить тег."""
+        """
+        Удалить тег.
+
+        Тег удаляется одним условным запросом, только если он не используется в статьях.
+        """
         try:
-            tag = await self.tag_repo.get_tag_by_id(tag_id)
-            if not tag:
+            status = await self.tag_repo.delete_tag(tag_id)
+            if status is TagDeleteStatus.NOT_FOUND:
                 logger.warning(f"Попытка удаления несуществующего тега: ID {tag_id}")
                 raise TagNotFoundException(tag_id)
-
-            is_used = await self.tag_repo.is_tag_used(tag_id)
-            logger.info(f"Проверка использования тега {tag_id}: {is_used}")
-
-            if is_used:
-                logger.warning(
-                    f"Попытка удаления используемого тега: ID {tag_id}. "
-                    f"Используется в {tag['usage_count']} статьях"
-                )
+            if status is TagDeleteStatus.IN_USE:
+                logger.warning(f"Попытка удаления используемого тега: ID {tag_id}")
                 raise TagInUseException(tag_id)
 
-            deleted = await self.tag_repo.delete_tag(tag_id)
-            if deleted:
-                logger.error(f"Ошибка при удалении тега: ID {tag_id}")
-                raise TagDeletionException(tag_id)
-
-            await self._invalidate_tag_cache(tag_id, tag["name"])
-            logger.info(f"Тег удалён: {tag['name']} (ID: {tag_id})")
+            await self._invalidate_tag_cache(tag_id)
+            logger.info(f"Тег удалён: ID {tag_id}")
 
         except ServiceException as e:
             raise e.to_http()
@@ -102,49 +362,201 @@ class TagService:
             logger.error(f"Неожиданная ошибка при удалении тега {tag_id}: {str(e)}")
             raise TagDeletionException(tag_id).to_http()
 
+    async def reconcile_usage_counts(self) -> List[int]:
+        """
+        Исправить расхождения счётчиков использования тегов.
+
+        Расхождение означает, что изменились связи статей с тегами,
+        поэтому вместе с тегами инвалидируются и списки статей.
+        """
+        repaired = await self.tag_repo.reconcile_usage_counts()
+        if repaired:
+            await self._invalidate_tags(repaired, articles_changed=True)
+            logger.warning(f"Исправлены счётчики использования тегов: {repaired}")
+        return repaired
+
+    async def export_tags(self) -> AsyncIterator[str]:
+        """
+        Выгрузить все теги в формате NDJSON.
+
+        Теги читаются из базы данных потоково, каждая пачка строк
+        отдаётся клиенту одним фрагментом ответа. При закрытии генератора
+        (отключение клиента) сразу закрывается и чтение из базы данных.
+        """
+        exported = 0
+        async with aclosing(self.tag_repo.stream_tags()) as batches:
+            async for rows in batches:
+                exported += len(rows)
+                yield "".join(Tag(**row).model_dump_json() + "\n" for row in rows)
+        logger.info(f"Выгружено тегов: {exported}")
+
+    async def _rebuild_search_index(self, version: int) -> None:
+        """Перестраивает индекс поиска воркера по полному списку тегов."""
+        async with self.search_index.lock:
+            if self.search_index.version == version:
+                return
+            tags = await self.tag_repo.get_tag_names()
+            self.search_index.build(tags, version)
+            logger.info(f"Индекс поиска тегов перестроен: {len(tags)} тегов (версия {version})")
+
+    def _schedule_search_index_rebuild(self, version: int) -> None:
+        """Запускает фоновое перестроение индекса, если оно ещё не выполняется."""
+        task = self.search_index.rebuild_task
+        if task is not None and not task.done():
+            return
+
+        async def rebuild():
+            try:
+                await self._rebuild_search_index(version)
+            except Exception as e:
+                logger.error(f"Ошибка перестроения индекса поиска тегов: {e}")
+
+        self.search_index.rebuild_task = asyncio.create_task(rebuild())
+
+    async def suggest_tags(self, query: str, limit: int = 10) -> TagSuggestionList:
+        """
+        Подсказать теги по началу или части имени.
+
+        Поиск выполняется по индексу в памяти воркера. Если версия каталога
+        тегов изменилась, индекс перестраивается в фоне, а до окончания
+        перестроения подсказки отдаются по прежнему индексу. Ожидание
+        построения возможно только при первом запросе воркера.
+        """
+        try:
+            normalized_query = query.strip().lower()
+            version = await self._get_catalog_version()
+
+            if self.search_index.version is None:
+                await self._rebuild_search_index(version)
+            elif self.search_index.version != version:
+                self._schedule_search_index_rebuild(version)
+
+            items = self.search_index.suggest(normalized_query, min(limit, 50))
+            return TagSuggestionList(items=[TagSuggestion(**item) for item in items])
+
+        except ServiceException as e:
+            raise e.to_http()
+        except Exception as e:
+            logger.error(f"Ошибка при подборе подсказок тегов: {str(e)}")
+            raise ServiceException("Сервис временно недоступен", 503).to_http()
+
+    async def _load_tag_list(
+        self,
+        search: Optional[str],
+        limit: int,
+        offset: int,
+        after: Optional[Tuple[str, int]] = None
+    ) -> str:
+        """
+        Загружает страницу тегов из БД и сериализует её для кэша.
+
+        Общее количество кэшируется для строки поиска до изменения каталога
+        тегов (изменение счётчиков использования его не сбрасывает), поэтому
+        остальные страницы того же поиска выбирают только строки без оконной
+        функции. Без него страница со смещением и количество читаются одним
+        запросом, а страница по курсору и количество — параллельно.
+        """
+        catalog_version = await self._get_catalog_version()
+        count_key = await self._get_cache_key(f"count:c{catalog_version}:{search}")
+
+        total_count = None
+        if cached_count := await self.cache.get(count_key):
+            total_count = int(cached_count)
+            tags = await self.tag_repo.get_tags(search, limit + 1, offset, after)
+        elif after:
+            tags, total_count = await asyncio.gather(
+                self.tag_repo.get_tags(search, limit + 1, offset, after),
+                self.tag_repo.get_tags_count(search)
+            )
+        else:
+            tags, total_count = await self.tag_repo.get_tags_page(search, limit + 1, offset)
+            if total_count is None:
+                total_count = await self.tag_repo.get_tags_count(search)
+
+        if not cached_count:
+            await self.cache.set(count_key, str(total_count), self.cache_ttl)
+
+        next_cursor = None
+        if len(tags) > limit:
+            tags = tags[:limit]
+            next_cursor = encode_cursor(tags[-1]["name"], tags[-1]["id"])
+
+        result = TagList(
+            items=[Tag(**tag) for tag in tags],
+            total=total_count,
+            next_cursor=next_cursor
+        )
+        return result.model_dump_json()
+
+    async def get_tags_etag(
+        self,
+        search: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Получить ETag страницы списка тегов без загрузки самой страницы.
+
+        Возвращает None, если версия списков неизвестна (ещё не создана
+        или недоступен Redis): тогда ETag нельзя связать с содержимым.
+        """
+        version = await self._get_list_version()
+        if not version:
+            return None
+        normalized_search = search.strip().lower() if search else None
+        return make_etag(
+            "tags", version, normalized_search, min(limit, 100), 0 if cursor else offset, cursor
+        )
+
     async def get_tags(
         self,
         search: Optional[str] = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> TagList:
-        """Получить список тегов."""
+        """
+        Получить список тегов.
+
+        При указании cursor страница выбирается по ключу (name, id),
+        а offset игнорируется.
+        """
         try:
             validated_limit = min(limit, 100)
             normalized_search = search.strip().lower() if search else None
 
+            after = None
+            if cursor:
+                after = tuple(decode_cursor(cursor, str, int))
+                cursor = encode_cursor(*after)
+                offset = 0
+
+            version = await self._get_list_version()
             cache_key = await self._get_cache_key(
-                f"list:{normalized_search}:{validated_limit}:{offset}"
+                f"list:v{version}:{normalized_search}:{validated_limit}:{offset}:{cursor}"
             )
 
-            if cached_data := await self.cache.get(cache_key):
-                try:
-                    return TagList.model_validate_json(cached_data)
-                except Exception as e:
-                    logger.warning(f"Невалидные данные в кэше: {str(e)}")
-                    await self.cache.delete(cache_key)
-
-            tags = await self.tag_repo.get_tags(normalized_search, validated_limit, offset)
-            total_count = await self.tag_repo.get_tags_count(normalized_search)
-
-            result = TagList(
-                items=[Tag(**tag) for tag in tags],
-                total=total_count
+            cached_data = await self.cache.get_or_set(
+                cache_key,
+                lambda: self._load_tag_list(normalized_search, validated_limit, offset, after),
+                self.cache_ttl,
+                self.cache_soft_ttl
             )
 
             try:
-                await self.cache.set(
-                    cache_key,
-                    result.model_dump_json(),
-                    self.cache_ttl
-                )
+                return TagList.model_validate_json(cached_data)
             except Exception as e:
-                logger.error(f"Ошибка записи в кэш: {str(e)}")
+                logger.warning(f"Невалидные данные в кэше: {str(e)}")
+                await self.cache.delete(cache_key)
 
-            return result
+            cached_data = await self._load_tag_list(
+                normalized_search, validated_limit, offset, after
+            )
+            return TagList.model_validate_json(cached_data)
 
         except ServiceException as e:
             raise e.to_http()
         except Exception as e:
             logger.error(f"Критическая ошибка: {str(e)}")
-            raise ServiceException("Сервис временно недоступен", 503)
\ No newline at end of file
+            raise ServiceException("Сервис временно недоступен", 503)
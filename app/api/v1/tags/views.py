@@ -1,17 +1,27 @@
 from typing import Optional
 
-from fastapi import APIRouter, Response, Depends, Query, status
+from fastapi import APIRouter, Response, Depends, Header, Query, status
 
 from app.api.v1.tags.services import TagService
+from app.api.v1.articles.services import ArticleService
 
-from app.core.dependencies.services import get_tag_service
-# from app.api.security.rate_limiter import get_rate_limiter
+from app.core.dependencies.services import get_tag_service, get_article_service
+from app.api.security.rate_limiter import get_rate_limiter
+from app.api.v1.conditional import conditional_response
+from app.api.v1.streaming import ClosingStreamingResponse
+from app.core.settings import settings
 
 from app.api.v1.tags.schemas import (
     TagCreate,
+    TagBulkCreate,
+    TagBulkCreateResult,
+    TagResolve,
+    TagResolveResult,
     Tag,
     TagList,
+    TagSuggestionList,
 )
+from app.api.v1.articles.schemas import ArticleFeed
 
 tags_router = APIRouter(prefix="/api/v1/tags", tags=["Tags"])
 
@@ -25,10 +35,11 @@ tags_router = APIRouter(prefix="/api/v1/tags", tags=["Tags"])
     responses={
         400: {"description": "Тег с таким именем уже существует"},
         422: {"description": "Ошибка валидации данных"},
+        429: {"description": "Слишком много запросов"},
         500: {"description": "Ошибка при создании тега"}
-    }
+    },
+    dependencies=[Depends(get_rate_limiter().limit("10/minute"))]
 )
-# @get_rate_limiter().limit("10/minute")
 async def create_tag_endpoint(
     tag_data: TagCreate,
     tag_service: TagService = Depends(get_tag_service),
@@ -37,6 +48,54 @@ async def create_tag_endpoint(
     return await tag_service.create_tag(tag_data)
 
 
+@tags_router.post(
+    "/bulk",
+    response_model=TagBulkCreateResult,
+    status_code=status.HTTP_200_OK,
+    summary="Создать теги пакетом",
+    description=(
+        "Создает до 100 тегов одним запросом. Возвращает созданные теги "
+        "и теги, которые уже существовали. Доступно только администраторам."
+    ),
+    responses={
+        422: {"description": "Ошибка валидации данных"},
+        429: {"description": "Слишком много запросов"},
+        500: {"description": "Ошибка при создании тегов"}
+    },
+    dependencies=[Depends(get_rate_limiter().limit("10/minute"))]
+)
+async def create_tags_bulk_endpoint(
+    tags_data: TagBulkCreate,
+    tag_service: TagService = Depends(get_tag_service),
+):
+    """Создать теги пакетом."""
+    return await tag_service.create_tags(tags_data)
+
+
+@tags_router.post(
+    "/resolve",
+    response_model=TagResolveResult,
+    status_code=status.HTTP_200_OK,
+    summary="Получить теги по ID и названиям",
+    description=(
+        "Возвращает теги по спискам ID и названий (до 100 каждого) "
+        "и перечисляет ID и названия, для которых теги не найдены."
+    ),
+    responses={
+        422: {"description": "Ошибка валидации данных"},
+        429: {"description": "Слишком много запросов"},
+        500: {"description": "Ошибка при получении тегов"}
+    },
+    dependencies=[Depends(get_rate_limiter().limit("60/minute"))]
+)
+async def resolve_tags_endpoint(
+    resolve_data: TagResolve,
+    tag_service: TagService = Depends(get_tag_service),
+):
+    """Получить теги по ID и названиям."""
+    return await tag_service.resolve_tags(resolve_data.ids, resolve_data.names)
+
+
 @tags_router.delete(
     "/{tag_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -45,10 +104,11 @@ async def create_tag_endpoint(
     responses={
         404: {"description": "Тег не найден"},
         400: {"description": "Тег используется в статьях"},
+        429: {"description": "Слишком много запросов"},
         500: {"description": "Ошибка при удалении тега"}
-    }
+    },
+    dependencies=[Depends(get_rate_limiter().limit("10/minute"))]
 )
-# @get_rate_limiter().limit("10/minute")
 async def delete_tag_endpoint(
     tag_id: int,
     tag_service: TagService = Depends(get_tag_service),
@@ -58,6 +118,45 @@ async def delete_tag_endpoint(
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
+@tags_router.get(
+    "/{tag_id}/articles",
+    response_model=ArticleFeed,
+    status_code=status.HTTP_200_OK,
+    summary="Получить статьи с тегом",
+    description="Возвращает статьи с тегом от новых к старым с пагинацией по курсору.",
+    responses={
+        200: {"description": "Успешный запрос"},
+        304: {"description": "Лента не изменилась (If-None-Match)"},
+        400: {"description": "Некорректный курсор"},
+        404: {"description": "Тег не найден"},
+        429: {"description": "Слишком много запросов"},
+        503: {"description": "Сервис временно недоступен"}
+    },
+    dependencies=[Depends(get_rate_limiter().limit("60/minute"))]
+)
+async def get_tag_articles_endpoint(
+    tag_id: int,
+    response: Response,
+    limit: int = Query(
+        20,
+        ge=1,
+        le=100,
+        description="Ограничение количества статей (максимум 100)"
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Курсор следующей страницы из next_cursor"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    article_service: ArticleService = Depends(get_article_service),
+):
+    """Получить статьи с тегом."""
+    etag = await article_service.get_list_etag("feed", [tag_id], "all", min(limit, 100), cursor)
+    if not_modified := conditional_response(etag, if_none_match, response):
+        return not_modified
+    return await article_service.get_articles_by_tags([tag_id], True, limit, cursor)
+
+
 @tags_router.get(
     "",
     response_model=TagList,
@@ -66,11 +165,15 @@ async def delete_tag_endpoint(
     description="Возвращает список всех тегов с возможностью поиска и пагинации.",
     responses={
         200: {"description": "Успешный запрос"},
+        304: {"description": "Список не изменился (If-None-Match)"},
+        400: {"description": "Некорректный курсор пагинации"},
+        429: {"description": "Слишком много запросов"},
         500: {"description": "Ошибка при получении списка тегов"}
-    }
+    },
+    dependencies=[Depends(get_rate_limiter().limit("60/minute"))]
 )
-# @get_rate_limiter().limit("60/minute")
 async def get_tags_endpoint(
+    response: Response,
     search: Optional[str] = Query(
         None, 
         min_length=2,
@@ -87,7 +190,76 @@ async def get_tags_endpoint(
         ge=0, 
         description="Смещение для пагинации"
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="Курсор следующей страницы из next_cursor (offset при этом игнорируется)"
+    ),
+    if_none_match: Optional[str] = Header(None),
     tag_service: TagService = Depends(get_tag_service),
 ):
     """Получить список тегов."""
-    return await tag_service.get_tags(search, limit, offset)
+    etag = await tag_service.get_tags_etag(search, limit, offset, cursor)
+    if not_modified := conditional_response(etag, if_none_match, response):
+        return not_modified
+    return await tag_service.get_tags(search, limit, offset, cursor)
+
+
+@tags_router.get(
+    "/suggest",
+    response_model=TagSuggestionList,
+    status_code=status.HTTP_200_OK,
+    summary="Подсказки тегов",
+    description="Возвращает теги, начинающиеся с запроса или содержащие его, для автодополнения.",
+    responses={
+        200: {"description": "Успешный запрос"},
+        429: {"description": "Слишком много запросов"},
+        503: {"description": "Сервис временно недоступен"}
+    },
+    dependencies=[Depends(get_rate_limiter().limit("120/minute"))]
+)
+async def suggest_tags_endpoint(
+    q: str = Query(
+        ...,
+        min_length=2,
+        max_length=50,
+        description="Начало или часть названия тега (минимум 2 символа)"
+    ),
+    limit: int = Query(
+        10,
+        ge=1,
+        le=50,
+        description="Ограничение количества подсказок (максимум 50)"
+    ),
+    tag_service: TagService = Depends(get_tag_service),
+):
+    """Получить подсказки тегов."""
+    return await tag_service.suggest_tags(q, limit)
+
+
+@tags_router.get(
+    "/export",
+    response_class=ClosingStreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Выгрузить все теги",
+    description=(
+        "Потоково выгружает весь каталог тегов в формате NDJSON "
+        "(один тег в формате JSON на строку) в порядке ID."
+    ),
+    responses={
+        200: {
+            "description": "Успешный запрос",
+            "content": {"application/x-ndjson": {}}
+        },
+        429: {"description": "Слишком много запросов"}
+    },
+    dependencies=[Depends(get_rate_limiter().limit("5/minute"))]
+)
+async def export_tags_endpoint(
+    tag_service: TagService = Depends(get_tag_service),
+):
+    """Выгрузить все теги в формате NDJSON."""
+    return ClosingStreamingResponse(
+        tag_service.export_tags(),
+        media_type="application/x-ndjson",
+        timeout=settings.EXPORT_TIMEOUT
+    )
@@ -1,11 +1,23 @@
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from app.api.storage.database import Database
 from app.api.storage.redis import RedisManager
+from app.api.v1.tags.search_index import TagSearchIndex
+from app.api.v1.articles.search_index import ArticleSearchIndex
+from app.core.settings import settings
+from app.core.logging import logger
+from app.core.tasks import (
+    reconcile_tag_usage_counts,
+    sync_article_search_index,
+    sync_article_list_version,
+)
 
 db = Database()
 cache = RedisManager()
+tag_search_index = TagSearchIndex()
+article_search_index = ArticleSearchIndex()
 
 
 async def get_database() -> Database:
@@ -32,6 +44,26 @@ async def get_cache() -> RedisManager:
     return cache
 
 
+async def get_tag_search_index() -> TagSearchIndex:
+    """
+    Dependency для получения индекса поиска тегов воркера.
+
+    Returns:
+        TagSearchIndex: Индекс поиска тегов.
+    """
+    return tag_search_index
+
+
+async def get_article_search_index() -> ArticleSearchIndex:
+    """
+    Dependency для получения индекса поиска статей воркера.
+
+    Returns:
+        ArticleSearchIndex: Индекс поиска статей.
+    """
+    return article_search_index
+
+
 @asynccontextmanager
 async def lifespan(app) -> AsyncGenerator[None, None]:
     """
@@ -46,7 +78,21 @@ async def lifespan(app) -> AsyncGenerator[None, None]:
     await db.connect()
     await cache.connect()
 
+    tasks = []
+    if settings.TAG_USAGE_RECONCILE_INTERVAL > 0:
+        tasks.append(asyncio.create_task(reconcile_tag_usage_counts(db, cache, tag_search_index)))
+    if settings.ARTICLE_SEARCH_BACKEND == "memory":
+        tasks.append(asyncio.create_task(sync_article_search_index(db, cache, article_search_index)))
+    if settings.ARTICLE_ROWS_SYNC_INTERVAL > 0:
+        tasks.append(asyncio.create_task(sync_article_list_version(db, cache, article_search_index)))
+
     yield
 
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
     await db.close()
-    await cache.close()
\ No newline at end of file
+    await cache.close()
+    # Дождаться записи сообщений из очереди логгера.
+    await logger.complete()
\ No newline at end of file
@@ -2,6 +2,7 @@ from fastapi import Depends
 
 from app.api.storage.database import Database
 from app.api.v1.tags.repositories import TagRepository
+from app.api.v1.articles.repositories import ArticleRepository
 
 from app.core.dependencies.common import get_database
 
@@ -19,3 +20,18 @@ async def get_tag_repository(
         TagRepository: Репозиторий тегов.
     """
     return TagRepository(db)
+
+
+async def get_article_repository(
+    db: Database = Depends(get_database),
+) -> ArticleRepository:
+    """
+    Dependency для получения репозитория статей.
+
+    Args:
+        db (Database): Объект базы данных.
+
+    Returns:
+        ArticleRepository: Репозиторий статей.
+    """
+    return ArticleRepository(db)
@@ -3,14 +3,23 @@ from fastapi import Depends
 from app.api.storage.redis import RedisManager
 from app.api.v1.tags.repositories import TagRepository
 from app.api.v1.tags.services import TagService
+from app.api.v1.tags.search_index import TagSearchIndex
+from app.api.v1.articles.repositories import ArticleRepository
+from app.api.v1.articles.services import ArticleService
+from app.api.v1.articles.search_index import ArticleSearchIndex
 
-from app.core.dependencies.repositories import get_tag_repository
-from app.core.dependencies.common import get_cache
+from app.core.dependencies.repositories import get_tag_repository, get_article_repository
+from app.core.dependencies.common import (
+    get_cache,
+    get_tag_search_index,
+    get_article_search_index,
+)
 
 
 async def get_tag_service(
     tag_repo: TagRepository = Depends(get_tag_repository),
     cache: RedisManager = Depends(get_cache),
+    search_index: TagSearchIndex = Depends(get_tag_search_index),
 ) -> TagService:
     """
     Dependency для получения сервиса тегов.
@@ -18,8 +27,28 @@ async def get_tag_service(
     Args:
         tag_repo (TagRepository): Репозиторий тегов.
         cache (RedisManager): Объект кэша.
+        search_index (TagSearchIndex): Индекс поиска тегов.
 
     Returns:
         TagService: Сервис тегов.
     """
-    return TagService(tag_repo, cache)
+    return TagService(tag_repo, cache, search_index)
+
+
+async def get_article_service(
+    article_repo: ArticleRepository = Depends(get_article_repository),
+    cache: RedisManager = Depends(get_cache),
+    search_index: ArticleSearchIndex = Depends(get_article_search_index),
+) -> ArticleService:
+    """
+    Dependency для получения сервиса статей.
+
+    Args:
+        article_repo (ArticleRepository): Репозиторий статей.
+        cache (RedisManager): Объект кэша.
+        search_index (ArticleSearchIndex): Индекс поиска статей.
+
+    Returns:
+        ArticleService: Сервис статей.
+    """
+    return ArticleService(article_repo, cache, search_index)
@@ -1,4 +1,5 @@
 import os
+import random
 from sys import stdout
 
 from loguru import logger
@@ -12,6 +13,8 @@ LOG_FORMAT_TERMINAL = (
     "<level>{message}</level>"
 )
 
+DEBUG_LEVEL_NO = logger.level("DEBUG").no
+
 LOG_FORMAT_FILE = (
     "{time:YYYY-MM-DD at HH:mm:ss} | {level} | "
     "{name}:{function}:{line} - {message}"
@@ -25,6 +28,9 @@ def configure_logger():
     - Удаляет стандартный логгер.
     - Создаёт директорию для логов, если она не существует.
     - Настраивает логирование в файл с ротацией и вывод в консоль с цветами.
+
+    При LOG_ENQUEUE сообщения пишутся в синки из фонового потока,
+    и запись в файл не блокирует цикл событий.
     """
     logger.remove()
 
@@ -40,7 +46,8 @@ def configure_logger():
         level=settings.LOG_LEVEL,
         format=LOG_FORMAT_FILE,
         backtrace=True,
-        diagnose=True,
+        diagnose=settings.LOG_DIAGNOSE,
+        enqueue=settings.LOG_ENQUEUE,
     )
 
     logger.add(
@@ -48,13 +55,46 @@ def configure_logger():
         level=settings.LOG_LEVEL,
         format=LOG_FORMAT_TERMINAL,
         backtrace=True,
-        diagnose=True,
+        diagnose=settings.LOG_DIAGNOSE,
+        enqueue=settings.LOG_ENQUEUE,
         colorize=True,
     )
 
     logger.info("Logger has been configured successfully.")
 
 
+class SampledLogger:
+    """
+    Логгер горячего пути с выборкой сообщений.
+
+    Сообщения форматируются лениво: аргументы подставляются в "{}" только
+    при записи. Сообщения ниже min_level отбрасываются сразу, без выборки;
+    из остальных до loguru доходит лишь доля sample_rate, поэтому частые
+    вызовы почти ничего не стоят.
+
+    Attributes:
+        sample_rate (float): Доля записываемых сообщений от 0 до 1.
+        min_level (int): Номер минимального записываемого уровня.
+    """
+
+    def __init__(self, sample_rate: float, min_level: str = settings.LOG_LEVEL):
+        self.sample_rate = sample_rate
+        self.min_level = logger.level(min_level).no
+
+    def _sampled(self, level_no: int) -> bool:
+        if level_no < self.min_level:
+            return False
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def debug(self, message: str, *args):
+        """Записывает сообщение уровня DEBUG с учётом выборки."""
+        if self._sampled(DEBUG_LEVEL_NO):
+            logger.opt(depth=1).debug(message, *args)
+
+
 configure_logger()
 
-__all__ = ["logger"]
\ No newline at end of file
+db_logger = SampledLogger(settings.LOG_SAMPLE_RATE_DB)
+cache_logger = SampledLogger(settings.LOG_SAMPLE_RATE_CACHE)
+
+__all__ = ["logger", "db_logger", "cache_logger"]
\ No newline at end of file
@@ -0,0 +1,226 @@
+import time
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+
+# Границы корзин гистограмм задержек в секундах.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def key_prefix(key: str) -> str:
+    """
+    Префикс ключа кэша для меток метрик.
+
+    Берутся первые две части ключа ("tag:list:v3:..." → "tag:list"),
+    чтобы число наборов меток не зависело от числа ключей.
+    """
+    return ":".join(key.split(":", 2)[:2])
+
+
+class Metric:
+    """
+    Базовый класс метрики.
+
+    Значения хранятся в словаре по кортежу значений меток. Приложение
+    работает в одном потоке цикла событий, поэтому блокировки не нужны.
+
+    Attributes:
+        name (str): Имя метрики.
+        documentation (str): Описание метрики.
+        labelnames (Tuple[str, ...]): Имена меток.
+    """
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def collect(self) -> Iterator[str]:
+        """Строки значений в текстовом формате Prometheus."""
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {value}"
+
+
+class Counter(Metric):
+    """Монотонно растущий счётчик."""
+
+    type = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        """Увеличивает счётчик для набора меток."""
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+
+class Gauge(Metric):
+    """Текущее значение, которое может как расти, так и уменьшаться."""
+
+    type = "gauge"
+
+    def set(self, value: float, *labels: str):
+        """Устанавливает значение для набора меток."""
+        self._values[labels] = value
+
+
+class Histogram(Metric):
+    """
+    Гистограмма с фиксированными корзинами.
+
+    Для каждого набора меток один раз выделяется список счётчиков корзин,
+    суммы и количества наблюдений; наблюдение только увеличивает
+    элементы этого списка.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *labels: str):
+        """Добавляет наблюдение для набора меток."""
+        series = self._series.get(labels)
+        if series is None:
+            # Корзины, +Inf, сумма и количество наблюдений.
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def collect(self) -> Iterator[str]:
+        labelnames = (*self.labelnames, "le")
+        for labels, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), series):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket"
+                    f"{_format_labels(labelnames, (*labels, str(bound)))} {cumulative}"
+                )
+            suffix = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{suffix} {series[-2]}"
+            yield f"{self.name}_count{suffix} {series[-1]}"
+
+
+class MetricsRegistry:
+    """Реестр метрик процесса."""
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """Регистрирует метрику и возвращает её."""
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Все метрики в текстовом формате Prometheus."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "Длительность обработки HTTP-запросов",
+    ("method", "route", "status"),
+))
+db_query_duration = registry.register(Histogram(
+    "db_query_duration_seconds",
+    "Длительность запросов к MySQL",
+    ("query",),
+))
+db_pool_acquire_wait = registry.register(Histogram(
+    "db_pool_acquire_wait_seconds",
+    "Время ожидания соединения из пула MySQL",
+    ("pool",),
+))
+db_pool_connections = registry.register(Gauge(
+    "db_pool_connections",
+    "Соединения пула MySQL",
+    ("pool", "state"),
+))
+cache_requests = registry.register(Counter(
+    "cache_requests_total",
+    "Обращения к кэшу по результату: local_hit, hit, miss",
+    ("prefix", "result"),
+))
+cache_operation_duration = registry.register(Histogram(
+    "cache_operation_duration_seconds",
+    "Длительность запросов к Redis",
+    ("operation", "prefix"),
+))
+rate_limit_redis_failures = registry.register(Counter(
+    "rate_limit_redis_failures_total",
+    "Проверки ограничителя запросов без ответа Redis: skipped (таймаут), local (нет соединения)",
+    ("result",),
+))
+cache_events = registry.register(Gauge(
+    "cache_events",
+    "Счётчики RedisManager.stats: попадания, промахи, фоновые обновления",
+    ("event",),
+))
+
+
+class MetricsMiddleware:
+    """
+    ASGI-middleware, измеряющее длительность HTTP-запросов.
+
+    Метка route — шаблон пути маршрута ("/api/v1/tags/{tag_id}"),
+    а не фактический путь, чтобы число наборов меток было ограничено.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status_code),
+            )
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 
@@ -10,6 +12,15 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LOG_ROTATION: str = "100 MB"
     LOG_RETENTION: str = "5 days"
+    # Запись в синки из фонового потока, без блокировки цикла событий
+    LOG_ENQUEUE: bool = True
+    # Значения переменных в трассировках исключений (дорого, только для отладки)
+    LOG_DIAGNOSE: bool = False
+    # Доля логируемых сообщений горячего пути (от 0 до 1)
+    LOG_SAMPLE_RATE_DB: float = 1.0
+    LOG_SAMPLE_RATE_CACHE: float = 1.0
+    # Порог медленного запроса к MySQL в мс (0 — отключить)
+    LOG_SLOW_QUERY_MS: float = 200.0
 
     # MySQL
     MYSQL_HOST: str = "127.0.0.1"
@@ -18,12 +29,63 @@ class Settings(BaseSettings):
     MYSQL_PASSWORD: str
     MYSQL_DATABASE: str
 
+    # Пул соединений MySQL (на каждый воркер)
+    MYSQL_POOL_MINSIZE: int = 2
+    MYSQL_POOL_MAXSIZE: int = 10
+    MYSQL_POOL_RECYCLE: int = 3600
+    MYSQL_POOL_ACQUIRE_TIMEOUT: float = 5.0
+    MYSQL_CONNECT_TIMEOUT: int = 10
+
+    # Реплики MySQL для чтения ("host:port" через запятую, пусто — отключено)
+    MYSQL_REPLICA_HOSTS: str = ""
+    MYSQL_REPLICA_HEALTH_CHECK_INTERVAL: float = 5.0
+    # Сколько секунд после записи чтения в том же запросе, а также загрузки
+    # в кэш после инвалидации его версий идут на основной сервер
+    MYSQL_READ_YOUR_WRITES_WINDOW: float = 2.0
+
     # Redis
     REDIS_HOST: str = "127.0.0.1"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str | None = None
 
+    # Локальный кэш воркера (выключен, включается LOCAL_CACHE_ENABLED=true)
+    LOCAL_CACHE_ENABLED: bool = False
+    LOCAL_CACHE_MAXSIZE: int = 1024
+    LOCAL_CACHE_TTL: float = 5.0
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+
+    # Защита от одновременного пересчёта ключей кэша
+    CACHE_LOCK_TTL: float = 5.0
+    CACHE_LOCK_POLL_INTERVAL: float = 0.05
+    CACHE_REFRESH_CONCURRENCY: int = 4
+
+    # Сверка счётчиков использования тегов с article_tags: при запуске
+    # и далее с этим интервалом (сек., 0 — отключить)
+    TAG_USAGE_RECONCILE_INTERVAL: int = 300
+
+    # Поиск статей: "mysql" (FULLTEXT) или "memory" (индекс BM25 в воркере).
+    # Оба индекса отбрасывают слова короче 3 символов и стоп-слова InnoDB.
+    ARTICLE_SEARCH_BACKEND: Literal["mysql", "memory"] = "mysql"
+    ARTICLE_SEARCH_SYNC_INTERVAL: float = 5.0
+
+    # Проверка изменений строк статей для инвалидации списков (сек., 0 — отключить)
+    ARTICLE_ROWS_SYNC_INTERVAL: float = 5.0
+
+    # Максимальная длительность потоковой выгрузки (сек.)
+    EXPORT_TIMEOUT: float = 300.0
+
+    # max-age в Cache-Control списков с ETag (сек., 0 — проверять при каждом запросе)
+    HTTP_CACHE_MAX_AGE: int = 0
+
+    # Ограничение частоты запросов
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_REDIS_TIMEOUT: float = 0.05
+    RATE_LIMIT_LOCAL_MAXSIZE: int = 10000
+
+    # Метрики Prometheus (/metrics)
+    METRICS_ENABLED: bool = True
+
     model_config = ConfigDict(env_file=".env", extra="ignore")
 
 
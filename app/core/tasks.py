@@ -0,0 +1,94 @@
+import asyncio
+from uuid import uuid4
+
+from app.api.storage.database import Database
+from app.api.storage.redis import RedisManager
+from app.api.v1.tags.repositories import TagRepository
+from app.api.v1.tags.search_index import TagSearchIndex
+from app.api.v1.tags.services import TagService
+from app.api.v1.articles.repositories import ArticleRepository
+from app.api.v1.articles.search_index import ArticleSearchIndex
+from app.api.v1.articles.services import ArticleService
+from app.core.settings import settings
+from app.core.logging import logger
+
+
+async def reconcile_tag_usage_counts(
+    db: Database,
+    cache: RedisManager,
+    search_index: TagSearchIndex
+):
+    """
+    Исправляет расхождения счётчиков использования тегов при запуске
+    и далее периодически.
+
+    Запуск согласуется между воркерами через блокировку в Redis, поэтому
+    за интервал сверку выполняет только один экземпляр.
+
+    Args:
+        db (Database): Объект базы данных.
+        cache (RedisManager): Объект кэша.
+        search_index (TagSearchIndex): Индекс поиска тегов.
+    """
+    interval = settings.TAG_USAGE_RECONCILE_INTERVAL
+    service = TagService(TagRepository(db), cache, search_index)
+
+    while True:
+        try:
+            if await cache.acquire_lock("lock:tag:usage:reconcile", uuid4().hex, interval):
+                await service.reconcile_usage_counts()
+        except Exception as e:
+            logger.error(f"Ошибка сверки счётчиков использования тегов: {e}")
+        await asyncio.sleep(interval)
+
+
+async def sync_article_search_index(
+    db: Database,
+    cache: RedisManager,
+    search_index: ArticleSearchIndex
+):
+    """
+    Строит индекс поиска статей воркера и периодически дополняет его
+    статьями, изменёнными с прошлой синхронизации.
+
+    Args:
+        db (Database): Объект базы данных.
+        cache (RedisManager): Объект кэша.
+        search_index (ArticleSearchIndex): Индекс поиска статей.
+    """
+    service = ArticleService(ArticleRepository(db), cache, search_index)
+
+    while True:
+        try:
+            indexed = await service.sync_search_index()
+            if indexed:
+                logger.info(f"Индекс поиска статей обновлён: {indexed} статей, всего {len(search_index)}")
+        except Exception as e:
+            logger.error(f"Ошибка синхронизации индекса поиска статей: {e}")
+        await asyncio.sleep(settings.ARTICLE_SEARCH_SYNC_INTERVAL)
+
+
+async def sync_article_list_version(db: Database, cache: RedisManager, search_index: ArticleSearchIndex):
+    """
+    Периодически сверяет отметку строк статей и увеличивает версию списков
+    статей при её изменении.
+
+    Запуск согласуется между воркерами через блокировку в Redis, поэтому
+    за интервал отметку читает только один экземпляр.
+
+    Args:
+        db (Database): Объект базы данных.
+        cache (RedisManager): Объект кэша.
+        search_index (ArticleSearchIndex): Индекс поиска статей.
+    """
+    interval = settings.ARTICLE_ROWS_SYNC_INTERVAL
+    service = ArticleService(ArticleRepository(db), cache, search_index)
+
+    while True:
+        try:
+            if await cache.acquire_lock("lock:article:rows:sync", uuid4().hex, interval):
+                if await service.sync_list_version():
+                    logger.info("Статьи изменились: версия списков статей увеличена")
+        except Exception as e:
+            logger.error(f"Ошибка сверки отметки строк статей: {e}")
+        await asyncio.sleep(interval)
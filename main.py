@@ -1,9 +1,12 @@
 import uvicorn
 from fastapi import FastAPI
 
+from app.api.metrics import metrics_router
 from app.api.v1.articles.views import articles_router
 from app.api.v1.tags.views import tags_router
 from app.core.dependencies.common import lifespan
+from app.core.metrics import MetricsMiddleware
+from app.core.settings import settings
 
 
 def create_application() -> FastAPI:
@@ -20,6 +23,10 @@ def create_application() -> FastAPI:
     app.include_router(articles_router)
     app.include_router(tags_router)
 
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics_router)
+
     return app
 
 
@@ -16,13 +16,23 @@ CREATE TABLE articles (
     title VARCHAR(255) NOT NULL,
     content TEXT NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    -- Полнотекстовый поиск по заголовку и тексту статьи. Слова короче
+    -- innodb_ft_min_token_size (3) и стоп-слова InnoDB не индексируются;
+    -- индекс поиска в памяти (search_index.py) использует те же правила.
+    FULLTEXT INDEX ft_articles_title_content (title, content),
+    -- Лента статей (ORDER BY created_at DESC, id DESC) без сортировки
+    INDEX idx_articles_created_at (created_at, id),
+    -- Инкрементальная синхронизация индекса поиска по времени изменения
+    INDEX idx_articles_updated_at (updated_at, id)
 );
 
 -- Таблица для тегов
 CREATE TABLE tags (
     id INT AUTO_INCREMENT PRIMARY KEY,
     name VARCHAR(50) NOT NULL UNIQUE,
+    -- Количество статей с тегом, поддерживается при привязке/отвязке тегов
+    usage_count INT NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
@@ -32,6 +42,8 @@ CREATE TABLE article_tags (
     article_id INT NOT NULL,
     tag_id INT NOT NULL,
     PRIMARY KEY (article_id, tag_id),
+    -- Обратный индекс: статьи тега по убыванию ID без сортировки
+    INDEX idx_article_tags_tag_article (tag_id, article_id),
     FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE,
     FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
 );
@@ -5,7 +5,9 @@ from httpx import AsyncClient, ASGITransport
 
 from app.api.v1.articles.views import articles_router
 from app.api.v1.tags.views import tags_router
-from app.core.dependencies.common import db, cache, lifespan
+from app.api.v1.tags.repositories import TagRepository
+from app.api.v1.tags.services import TagService
+from app.core.dependencies.common import db, cache, tag_search_index, lifespan
 
 
 @pytest.fixture
@@ -45,9 +47,10 @@ async def setup_database():
 
 @pytest_asyncio.fixture(scope="function", autouse=True)
 async def setup_cache():
-    """Очищает кэш перед каждым тестом."""
+    """Очищает кэш и индекс поиска тегов перед каждым тестом."""
     await cache.connect()
     await cache.clear_cache()
+    tag_search_index.clear()
 
     yield
     await cache.close()
@@ -63,6 +66,18 @@ async def create_test_tag(client: AsyncClient):
     return _create_tag
 
 
+@pytest_asyncio.fixture
+async def attach_test_tags():
+    """Привязывает теги к статье напрямую в базе данных и сверяет счётчики использования."""
+    async def _attach_tags(article_id: int, tag_ids: list[int]):
+        for tag_id in dict.fromkeys(tag_ids):
+            await db.execute(
+                "INSERT INTO article_tags (article_id, tag_id) VALUES (%s, %s)", article_id, tag_id
+            )
+        await TagService(TagRepository(db), cache, tag_search_index).reconcile_usage_counts()
+    return _attach_tags
+
+
 @pytest_asyncio.fixture
 async def create_test_article(client: AsyncClient):
     """Создаёт тестовую статью с указанными параметрами."""
@@ -0,0 +1,63 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+from app.core.dependencies.common import db
+
+
+async def insert_article(title: str) -> int:
+    """Создаёт статью напрямую в базе данных и возвращает её ID."""
+    return await db.execute(
+        "INSERT INTO articles (title, content) VALUES (%s, %s)", title, "Content"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_articles_by_tags_all_and_any(client: AsyncClient, create_test_tag, attach_test_tags):
+    """
+    Тест фильтра статей по нескольким тегам.
+    match=all должен вернуть статьи со всеми тегами, match=any — с любым из них.
+    """
+    python = await create_test_tag("python")
+    fastapi = await create_test_tag("fastapi")
+
+    only_python = await insert_article("Python")
+    both = await insert_article("Python and FastAPI")
+    only_fastapi = await insert_article("FastAPI")
+    await insert_article("Without tags")
+
+    await attach_test_tags(only_python, [python["id"]])
+    await attach_test_tags(both, [python["id"], fastapi["id"]])
+    await attach_test_tags(only_fastapi, [fastapi["id"]])
+
+    tag_ids = [python["id"], fastapi["id"]]
+
+    response = await client.get("/api/v1/articles/by-tags", params={"tag_ids": tag_ids})
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert [article["id"] for article in response.json()["items"]] == [both]
+
+    response = await client.get(
+        "/api/v1/articles/by-tags", params={"tag_ids": tag_ids, "match": "any"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [article["id"] for article in response.json()["items"]] == [
+        only_fastapi, both, only_python
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_articles_by_tags_invalid_params(client: AsyncClient, create_test_tag):
+    """
+    Тест фильтра статей по тегам с невалидными параметрами.
+    Должен вернуть 422 UNPROCESSABLE ENTITY, для несуществующего тега — 404.
+    """
+    python = await create_test_tag("python")
+
+    for params in [{}, {"tag_ids": python["id"], "match": "some"}]:
+        response = await client.get("/api/v1/articles/by-tags", params=params)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    response = await client.get(
+        "/api/v1/articles/by-tags", params={"tag_ids": [python["id"], 999]}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,201 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+from app.api.v1.articles.repositories import ArticleRepository
+from app.api.v1.articles.services import ArticleService
+from app.core.dependencies.common import db, cache, article_search_index
+
+
+async def insert_article(title: str) -> int:
+    """Создаёт статью напрямую в базе данных и возвращает её ID."""
+    return await db.execute(
+        "INSERT INTO articles (title, content) VALUES (%s, %s)", title, "Content"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_articles_empty_list(client: AsyncClient):
+    """
+    Тест получения пустого списка статей.
+    Должен вернуть 200 OK с пустым списком.
+    """
+    response = await client.get("/api/v1/articles")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"items": [], "total": 0}
+
+
+@pytest.mark.asyncio
+async def test_get_articles_empty_first_page_skips_count(client: AsyncClient, mocker):
+    """
+    Тест пустой первой страницы.
+    Должен вернуть total = 0 без отдельного запроса количества.
+    """
+    fetch = mocker.spy(db, "fetch")
+    response = await client.get("/api/v1/articles")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total"] == 0
+    assert fetch.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_articles_page_past_end(client: AsyncClient):
+    """
+    Тест страницы за концом списка.
+    Должен вернуть пустую страницу и общее количество статей.
+    """
+    await insert_article("First")
+    await insert_article("Second")
+
+    response = await client.get("/api/v1/articles", params={"offset": 10})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"items": [], "total": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_articles_with_tags(client: AsyncClient, create_test_tag, attach_test_tags):
+    """
+    Тест получения статей с тегами.
+    Каждая статья должна содержать свои теги, статьи — идти от новых к старым.
+    """
+    python = await create_test_tag("python")
+    fastapi = await create_test_tag("fastapi")
+    first = await insert_article("First")
+    second = await insert_article("Second")
+    await insert_article("Without tags")
+
+    await attach_test_tags(first, [python["id"], fastapi["id"]])
+    await attach_test_tags(second, [python["id"]])
+
+    response = await client.get("/api/v1/articles")
+    assert response.status_code == status.HTTP_200_OK
+
+    data = response.json()
+    assert data["total"] == 3
+    assert [article["title"] for article in data["items"]] == ["Without tags", "Second", "First"]
+    assert [[tag["name"] for tag in article["tags"]] for article in data["items"]] == [
+        [], ["python"], ["fastapi", "python"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_articles_uses_two_queries(client: AsyncClient, mocker):
+    """
+    Тест количества запросов к базе данных.
+    Страница из 100 статей должна загружаться двумя запросами и подсчётом
+    количества, следующие страницы — без повторного подсчёта.
+    """
+    for index in range(150):
+        await insert_article(f"Article {index}")
+
+    fetch = mocker.spy(db, "fetch")
+    response = await client.get("/api/v1/articles", params={"limit": 100})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["items"]) == 100
+    assert response.json()["total"] == 150
+    assert [call.kwargs["name"] for call in fetch.call_args_list] == [
+        "articles.get_articles_page",
+        "articles.get_articles_count",
+        "articles.get_tags_for_articles",
+    ]
+
+    fetch.reset_mock()
+    response = await client.get("/api/v1/articles", params={"limit": 20, "offset": 100})
+
+    assert response.json()["total"] == 150
+    assert [call.kwargs["name"] for call in fetch.call_args_list] == [
+        "articles.get_articles_page",
+        "articles.get_tags_for_articles",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_articles_cache_invalidation(client: AsyncClient, create_test_tag, attach_test_tags):
+    """
+    Тест инвалидации кэша списка статей.
+    Изменение тегов статьи должно сразу отражаться в списке.
+    """
+    tag = await create_test_tag("python")
+    article_id = await insert_article("First")
+
+    response = await client.get("/api/v1/articles")
+    assert response.json()["items"][0]["tags"] == []
+
+    await attach_test_tags(article_id, [tag["id"]])
+
+    response = await client.get("/api/v1/articles")
+    assert response.json()["items"][0]["tags"] == [{"id": tag["id"], "name": "python"}]
+
+
+@pytest.mark.asyncio
+async def test_get_articles_conditional_request(client: AsyncClient, create_test_tag, attach_test_tags):
+    """
+    Тест условного запроса списка статей.
+    Совпавший If-None-Match должен вернуть 304, другая страница — 200.
+    """
+    tag = await create_test_tag("python")
+    article_id = await insert_article("First")
+    await attach_test_tags(article_id, [tag["id"]])
+
+    response = await client.get("/api/v1/articles")
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+
+    response = await client.get("/api/v1/articles", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = await client.get(
+        "/api/v1/articles", params={"limit": 5}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_get_articles_etag_tracks_new_articles(client: AsyncClient):
+    """
+    Тест ETag списка статей после добавления статьи.
+    После сверки отметки строк статья, добавленная после первого запроса,
+    должна менять ETag: ответ 200 с новой статьёй.
+    """
+    article_service = ArticleService(ArticleRepository(db), cache, article_search_index)
+    await insert_article("First")
+    assert await article_service.sync_list_version() is True
+
+    response = await client.get("/api/v1/articles")
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+
+    await insert_article("Second")
+    assert await article_service.sync_list_version() is True
+
+    response = await client.get("/api/v1/articles", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert [article["title"] for article in response.json()["items"]] == ["Second", "First"]
+
+
+@pytest.mark.asyncio
+async def test_get_articles_conditional_request_skips_database(client: AsyncClient, mocker):
+    """
+    Тест условного запроса без изменений статей.
+    Ответ 304 и повторная сверка отметки не должны менять версию,
+    а сам условный запрос — обращаться к базе данных.
+    """
+    article_service = ArticleService(ArticleRepository(db), cache, article_search_index)
+    await insert_article("First")
+    await article_service.sync_list_version()
+
+    response = await client.get("/api/v1/articles")
+    etag = response.headers["ETag"]
+    assert await article_service.sync_list_version() is False
+
+    fetch = mocker.spy(db, "fetch")
+    response = await client.get("/api/v1/articles", headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert fetch.call_count == 0
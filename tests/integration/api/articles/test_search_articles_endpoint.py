@@ -0,0 +1,120 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import FastAPI, status
+
+from app.api.v1.articles.repositories import ArticleRepository
+from app.api.v1.articles.search_index import ArticleSearchIndex
+from app.api.v1.articles.services import ArticleService, ARTICLE_SEARCH_VERSION_KEY
+from app.core.dependencies.common import db, cache, get_article_search_index
+from app.core.settings import settings
+
+
+async def insert_article(title: str, content: str) -> int:
+    """Создаёт статью напрямую в базе данных и возвращает её ID."""
+    return await db.execute(
+        "INSERT INTO articles (title, content) VALUES (%s, %s)", title, content
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_articles_by_relevance(client: AsyncClient):
+    """
+    Тест полнотекстового поиска статей.
+    Должны вернуться только подходящие статьи, более релевантные — первыми.
+    """
+    await insert_article("Docker basics", "Containers and images")
+    await insert_article("Cooking pasta", "Boil water and add salt")
+    once = await insert_article("Web frameworks", "Django, Flask and fastapi compared")
+    twice = await insert_article("Fastapi tutorial", "Building APIs with fastapi")
+
+    response = await client.get("/api/v1/articles/search", params={"q": "fastapi"})
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    data = response.json()
+    assert data["total"] == 2
+    assert [article["id"] for article in data["items"]] == [twice, once]
+    assert data["items"][0]["tags"] == []
+
+
+@pytest.mark.asyncio
+async def test_search_articles_no_results(client: AsyncClient):
+    """
+    Тест поиска без совпадений.
+    Должен вернуть 200 OK с пустым списком.
+    """
+    await insert_article("Docker basics", "Containers and images")
+
+    response = await client.get("/api/v1/articles/search", params={"q": "kubernetes"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"items": [], "total": 0}
+
+
+@pytest.mark.asyncio
+async def test_search_articles_invalid_query(client: AsyncClient):
+    """
+    Тест поиска с невалидной строкой.
+    Должен вернуть 422 UNPROCESSABLE ENTITY.
+    """
+    for params in [{}, {"q": "a"}, {"q": "ab"}, {"q": "python", "limit": 0}]:
+        response = await client.get("/api/v1/articles/search", params=params)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_search_articles_memory_backend(client: AsyncClient, app: FastAPI, monkeypatch):
+    """
+    Тест поиска по индексу в памяти.
+    Должен ранжировать статьи индексом воркера и находить новые статьи
+    сразу после синхронизации индекса, несмотря на кэш.
+    """
+    monkeypatch.setattr(settings, "ARTICLE_SEARCH_BACKEND", "memory")
+    index = ArticleSearchIndex()
+    app.dependency_overrides[get_article_search_index] = lambda: index
+    service = ArticleService(ArticleRepository(db), cache, index)
+
+    await insert_article("Docker basics", "Containers and images")
+    once = await insert_article("Web frameworks", "Django, Flask and fastapi compared")
+    twice = await insert_article("Fastapi tutorial", "Building APIs with fastapi")
+    assert await service.sync_search_index() == 3
+
+    response = await client.get("/api/v1/articles/search", params={"q": "fastapi"})
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+    assert [article["id"] for article in response.json()["items"]] == [twice, once]
+
+    newest = await insert_article("Fastapi fastapi fastapi", "All about fastapi")
+    assert await service.sync_search_index() == 1
+
+    response = await client.get("/api/v1/articles/search", params={"q": "fastapi"})
+    assert [article["id"] for article in response.json()["items"]] == [newest, twice, once]
+
+
+@pytest.mark.asyncio
+async def test_sync_search_index_without_changes():
+    """
+    Тест повторной синхронизации индекса поиска.
+    Без изменений статей версия результатов поиска не должна меняться.
+    """
+    service = ArticleService(ArticleRepository(db), cache, ArticleSearchIndex())
+    await insert_article("Docker basics", "Containers and images")
+
+    assert await service.sync_search_index() == 1
+    version = await cache.get(ARTICLE_SEARCH_VERSION_KEY)
+    assert version is not None
+
+    assert await service.sync_search_index() == 0
+    assert await cache.get(ARTICLE_SEARCH_VERSION_KEY) == version
+
+
+@pytest.mark.asyncio
+async def test_search_articles_stopwords(client: AsyncClient):
+    """
+    Тест поиска по стоп-слову.
+    Стоп-слова InnoDB не индексируются: поиск должен вернуть пустой список.
+    """
+    await insert_article("The basics", "What is the Docker")
+
+    response = await client.get("/api/v1/articles/search", params={"q": "the"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"items": [], "total": 0}
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_tags_success(client: AsyncClient):
+    """
+    Тест пакетного создания тегов.
+    Должен вернуть созданные теги и теги, которые уже существовали.
+    """
+    response = await client.post("/api/v1/tags", json={"name": "python"})
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = await client.post(
+        "/api/v1/tags/bulk",
+        json={"items": [{"name": "python"}, {"name": "FastAPI"}, {"name": "mysql"}]}
+    )
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    data = response.json()
+    assert sorted(tag["name"] for tag in data["created"]) == ["fastapi", "mysql"]
+    assert [tag["name"] for tag in data["existing"]] == ["python"]
+    assert all(tag["usage_count"] == 0 for tag in data["created"])
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_tags_deduplicates_names(client: AsyncClient):
+    """
+    Тест пакетного создания с повторяющимися именами.
+    Каждый тег должен быть создан один раз.
+    """
+    response = await client.post(
+        "/api/v1/tags/bulk",
+        json={"items": [{"name": "python"}, {"name": "Python"}]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    data = response.json()
+    assert [tag["name"] for tag in data["created"]] == ["python"]
+    assert data["existing"] == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_tags_concurrent_requests(client: AsyncClient):
+    """
+    Тест параллельного пакетного создания пересекающихся тегов.
+    Каждый тег должен попасть в created ровно одного ответа,
+    а в другом — в existing.
+    """
+    names = ["python", "fastapi", "mysql", "redis"]
+    responses = await asyncio.gather(*(
+        client.post("/api/v1/tags/bulk", json={"items": [{"name": name} for name in names]})
+        for _ in range(4)
+    ))
+    assert all(response.status_code == status.HTTP_200_OK for response in responses)
+
+    created = [tag["name"] for response in responses for tag in response.json()["created"]]
+    assert sorted(created) == sorted(names)
+    for response in responses:
+        data = response.json()
+        assert sorted(tag["name"] for tag in data["created"] + data["existing"]) == sorted(names)
+
+@pytest.mark.asyncio
+async def test_bulk_create_tags_invalidates_list_cache(client: AsyncClient):
+    """
+    Тест инвалидации кэша списка тегов после пакетного создания.
+    Новые теги должны сразу появиться в списке.
+    """
+    response = await client.get("/api/v1/tags")
+    assert response.json()["total"] == 0
+
+    response = await client.post(
+        "/api/v1/tags/bulk",
+        json={"items": [{"name": "python"}, {"name": "redis"}]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await client.get("/api/v1/tags")
+    assert response.json()["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_tags_invalid_payload(client: AsyncClient):
+    """
+    Тест пакетного создания с невалидными данными.
+    Должен вернуть 422 UNPROCESSABLE ENTITY.
+    """
+    test_cases = [
+        {"items": []},
+        {"items": [{"name": f"tag{i}"} for i in range(101)]},
+        {"items": [{"name": "python!"}]},
+    ]
+
+    for data in test_cases:
+        response = await client.post("/api/v1/tags/bulk", json=data)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -1,8 +1,11 @@
+import asyncio
+
 import pytest
 from httpx import AsyncClient
 from fastapi import status
 
 from app.api.v1.exceptions import TagAlreadyExistsException
+from app.core.dependencies.common import db, cache
 
 
 @pytest.mark.asyncio
@@ -98,3 +101,87 @@ async def test_create_tag_missing_name(client: AsyncClient):
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     assert any(error["type"] == "missing"
               for error in response.json()["detail"])
+
+
+@pytest.mark.asyncio
+async def test_create_tag_after_delete(client: AsyncClient):
+    """
+    Тест повторного создания удалённого тега.
+    Закэшированный тег не должен мешать созданию тега с тем же именем.
+    """
+    response = await client.post("/api/v1/tags", json={"name": "python"})
+    assert response.status_code == status.HTTP_201_CREATED
+    tag_id = response.json()["id"]
+
+    response = await client.delete(f"/api/v1/tags/{tag_id}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = await client.post("/api/v1/tags", json={"name": "python"})
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["id"] != tag_id
+
+
+@pytest.mark.asyncio
+async def test_create_tag_concurrent_duplicates(client: AsyncClient):
+    """
+    Тест одновременного создания тегов с одним именем.
+    Создан должен быть ровно один тег, остальные запросы — получить 400.
+    """
+    responses = await asyncio.gather(
+        *(client.post("/api/v1/tags", json={"name": "python"}) for _ in range(3))
+    )
+
+    status_codes = sorted(response.status_code for response in responses)
+    assert status_codes == [
+        status.HTTP_201_CREATED,
+        status.HTTP_400_BAD_REQUEST,
+        status.HTTP_400_BAD_REQUEST,
+    ]
+
+    response = await client.get("/api/v1/tags", params={"search": "python"})
+    assert response.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_create_tag_response_matches_stored_tag(client: AsyncClient):
+    """
+    Тест данных созданного тега.
+    Ответ на создание должен совпадать с тегом, прочитанным из базы данных.
+    """
+    response = await client.post("/api/v1/tags", json={"name": "python"})
+    created = response.json()
+    await cache.clear_cache()
+
+    response = await client.post("/api/v1/tags/resolve", json={"ids": [created["id"]]})
+    assert response.json()["items"] == [created]
+
+
+@pytest.mark.asyncio
+async def test_create_tag_rate_limit(client: AsyncClient):
+    """
+    Тест ограничения частоты создания тегов.
+    После 10 запросов в минуту должен вернуть 429 TOO MANY REQUESTS
+    с заголовком Retry-After.
+    """
+    for i in range(10):
+        response = await client.post("/api/v1/tags", json={"name": f"tag{i}"})
+        assert response.status_code == status.HTTP_201_CREATED
+
+    response = await client.post("/api/v1/tags", json={"name": "tag10"})
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_create_tag_timestamps_from_database(client: AsyncClient):
+    """
+    Тест времени создания тега.
+    Должен вернуть время, записанное сервером БД.
+    """
+    response = await client.post("/api/v1/tags", json={"name": "python"})
+    assert response.status_code == status.HTTP_201_CREATED
+    created = response.json()
+
+    rows = await db.fetch("SELECT created_at, updated_at FROM tags WHERE id = %s", created["id"])
+    assert created["created_at"] == rows[0]["created_at"].isoformat()
+    assert created["updated_at"] == rows[0]["updated_at"].isoformat()
@@ -7,6 +7,7 @@ from app.api.v1.exceptions import (
     TagInUseException,
     TagDeletionException,
 )
+from app.core.dependencies.common import db
 
 
 @pytest.mark.asyncio
@@ -67,4 +68,42 @@ async def test_delete_tag_server_error(client: AsyncClient, create_test_tag, moc
     response = await client.delete(f"/api/v1/tags/{tag['id']}")
 
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-    assert response.json()["detail"] == TagDeletionException(tag_id=tag["id"]).message
\ No newline at end of file
+    assert response.json()["detail"] == TagDeletionException(tag_id=tag["id"]).message
+
+
+@pytest.mark.asyncio
+async def test_delete_tag_twice(client: AsyncClient, create_test_tag):
+    """
+    Тест повторного удаления тега.
+    Второй запрос должен вернуть 404 NOT FOUND, несмотря на кэш тега.
+    """
+    tag = await create_test_tag("python")
+
+    response = await client.delete(f"/api/v1/tags/{tag['id']}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = await client.delete(f"/api/v1/tags/{tag['id']}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == TagNotFoundException(tag_id=tag["id"]).message
+
+
+@pytest.mark.asyncio
+async def test_delete_tag_linked_to_article(client: AsyncClient, create_test_tag):
+    """
+    Тест удаления тега, привязанного к статье.
+    Должен вернуть 400 BAD REQUEST, тег должен остаться в списке.
+    """
+    tag = await create_test_tag("python")
+    article_id = await db.execute(
+        "INSERT INTO articles (title, content) VALUES (%s, %s)", "Test Article", "Content"
+    )
+    await db.execute(
+        "INSERT INTO article_tags (article_id, tag_id) VALUES (%s, %s)", article_id, tag["id"]
+    )
+
+    response = await client.delete(f"/api/v1/tags/{tag['id']}")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == TagInUseException(tag_id=tag["id"]).message
+
+    response = await client.get("/api/v1/tags")
+    assert [item["id"] for item in response.json()["items"]] == [tag["id"]]
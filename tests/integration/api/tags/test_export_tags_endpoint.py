@@ -0,0 +1,39 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+
+@pytest.mark.asyncio
+async def test_export_tags(client: AsyncClient):
+    """
+    Тест выгрузки каталога тегов.
+    Должен вернуть все теги в формате NDJSON в порядке ID.
+    """
+    names = ["python", "fastapi", "mysql"]
+    response = await client.post(
+        "/api/v1/tags/bulk",
+        json={"items": [{"name": name} for name in names]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await client.get("/api/v1/tags/export")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    tags = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(tag["name"] for tag in tags) == sorted(names)
+    assert [tag["id"] for tag in tags] == sorted(tag["id"] for tag in tags)
+    assert all(tag["usage_count"] == 0 for tag in tags)
+
+
+@pytest.mark.asyncio
+async def test_export_tags_empty(client: AsyncClient):
+    """
+    Тест выгрузки пустого каталога.
+    Должен вернуть пустой ответ.
+    """
+    response = await client.get("/api/v1/tags/export")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text == ""
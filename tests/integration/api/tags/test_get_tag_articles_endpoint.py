@@ -0,0 +1,124 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+from app.api.v1.articles.repositories import ArticleRepository
+from app.api.v1.articles.services import ArticleService
+from app.core.dependencies.common import db, cache, article_search_index
+
+
+async def insert_article(title: str) -> int:
+    """Создаёт статью напрямую в базе данных и возвращает её ID."""
+    return await db.execute(
+        "INSERT INTO articles (title, content) VALUES (%s, %s)", title, "Content"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_tag_articles_pagination(client: AsyncClient, create_test_tag, attach_test_tags):
+    """
+    Тест ленты статей тега с пагинацией по курсору.
+    Статьи с тегом должны идти от новых к старым без пропусков и повторов.
+    """
+    python = await create_test_tag("python")
+
+    tagged = []
+    for i in range(5):
+        article_id = await insert_article(f"Article {i}")
+        await insert_article(f"Untagged {i}")
+        await attach_test_tags(article_id, [python["id"]])
+        tagged.append(article_id)
+
+    response = await client.get(f"/api/v1/tags/{python['id']}/articles", params={"limit": 2})
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    ids = []
+    data = response.json()
+    while True:
+        ids.extend(article["id"] for article in data["items"])
+        assert all(
+            article["tags"] == [{"id": python["id"], "name": "python"}]
+            for article in data["items"]
+        )
+        if data["next_cursor"] is None:
+            break
+        response = await client.get(
+            f"/api/v1/tags/{python['id']}/articles",
+            params={"limit": 2, "cursor": data["next_cursor"]}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+
+    assert ids == list(reversed(tagged))
+
+
+@pytest.mark.asyncio
+async def test_get_tag_articles_not_found(client: AsyncClient):
+    """
+    Тест ленты статей несуществующего тега.
+    Должен вернуть 404 NOT FOUND.
+    """
+    response = await client.get("/api/v1/tags/999/articles")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_get_tag_articles_invalid_cursor(client: AsyncClient, create_test_tag):
+    """
+    Тест ленты статей с повреждённым курсором.
+    Должен вернуть 400 BAD REQUEST.
+    """
+    python = await create_test_tag("python")
+
+    response = await client.get(
+        f"/api/v1/tags/{python['id']}/articles", params={"cursor": "not-a-cursor"}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_tag_articles_if_none_match_any(client: AsyncClient, create_test_tag, attach_test_tags):
+    """
+    Тест условного запроса с If-None-Match: *.
+    Несуществующий тег и повреждённый курсор должны проверяться, а не давать 304.
+    """
+    python = await create_test_tag("python")
+    article_id = await insert_article("First")
+    await attach_test_tags(article_id, [python["id"]])
+
+    response = await client.get("/api/v1/tags/999/articles", headers={"If-None-Match": "*"})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await client.get(
+        f"/api/v1/tags/{python['id']}/articles",
+        params={"cursor": "not-a-cursor"},
+        headers={"If-None-Match": "*"}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_tag_articles_etag_tracks_articles(client: AsyncClient, create_test_tag, attach_test_tags):
+    """
+    Тест ETag ленты статей тега после удаления статьи.
+    После сверки отметки строк прежний ETag не должен давать 304.
+    """
+    python = await create_test_tag("python")
+    article_id = await insert_article("First")
+    await attach_test_tags(article_id, [python["id"]])
+
+    response = await client.get(f"/api/v1/tags/{python['id']}/articles")
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+
+    await db.execute("DELETE FROM articles WHERE id = %s", article_id)
+    article_service = ArticleService(ArticleRepository(db), cache, article_search_index)
+    assert await article_service.sync_list_version() is True
+
+    response = await client.get(
+        f"/api/v1/tags/{python['id']}/articles", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"] == []
@@ -2,6 +2,10 @@ import pytest
 from httpx import AsyncClient
 from fastapi import status
 
+from app.api.v1.tags.repositories import TagRepository
+from app.api.v1.tags.services import TagService
+from app.core.dependencies.common import db, cache, tag_search_index
+
 
 @pytest.mark.asyncio
 async def test_get_tags_empty_list(client: AsyncClient):
@@ -139,3 +143,177 @@ async def test_get_tags_sorting(
     assert response.status_code == status.HTTP_200_OK
     data = response.json()
     assert [tag["name"] for tag in data["items"]] == tags_order
+
+
+@pytest.mark.asyncio
+async def test_get_tags_cache_invalidation(
+    client: AsyncClient,
+    create_test_tag
+):
+    """
+    Тест инвалидации закэшированных списков тегов.
+    После создания и удаления тега все страницы и результаты поиска
+    должны возвращать актуальные данные.
+    """
+    python_tag = await create_test_tag("python")
+
+    response = await client.get("/api/v1/tags?search=py&limit=5")
+    assert response.json()["total"] == 1
+    response = await client.get("/api/v1/tags?limit=1&offset=1")
+    assert response.json()["items"] == []
+
+    await create_test_tag("pytest")
+
+    response = await client.get("/api/v1/tags?search=py&limit=5")
+    assert response.json()["total"] == 2
+    response = await client.get("/api/v1/tags?limit=1&offset=1")
+    assert [tag["name"] for tag in response.json()["items"]] == ["pytest"]
+
+    response = await client.delete(f"/api/v1/tags/{python_tag['id']}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = await client.get("/api/v1/tags?search=py&limit=5")
+    assert [tag["name"] for tag in response.json()["items"]] == ["pytest"]
+
+
+@pytest.mark.asyncio
+async def test_get_tags_usage_count(
+    client: AsyncClient,
+    create_test_tag,
+    attach_test_tags
+):
+    """
+    Тест счётчика использования тегов.
+    Сверка должна приводить usage_count к числу связей в article_tags,
+    в том числе после каскадного удаления статьи.
+    """
+    tag = await create_test_tag("python")
+    service = TagService(TagRepository(db), cache, tag_search_index)
+    first_article = await db.execute(
+        "INSERT INTO articles (title, content) VALUES (%s, %s)", "First", "Content"
+    )
+    second_article = await db.execute(
+        "INSERT INTO articles (title, content) VALUES (%s, %s)", "Second", "Content"
+    )
+
+    await attach_test_tags(first_article, [tag["id"]])
+    await attach_test_tags(second_article, [tag["id"], tag["id"]])
+    response = await client.get("/api/v1/tags")
+    assert response.json()["items"][0]["usage_count"] == 2
+
+    await db.execute(
+        "DELETE FROM article_tags WHERE article_id = %s AND tag_id = %s", first_article, tag["id"]
+    )
+    assert await service.reconcile_usage_counts() == [tag["id"]]
+    response = await client.get("/api/v1/tags")
+    assert response.json()["items"][0]["usage_count"] == 1
+
+    await db.execute("DELETE FROM articles WHERE id = %s", second_article)
+    assert await service.reconcile_usage_counts() == [tag["id"]]
+    response = await client.get("/api/v1/tags")
+    assert response.json()["items"][0]["usage_count"] == 0
+
+    assert await service.reconcile_usage_counts() == []
+
+
+@pytest.mark.asyncio
+async def test_get_tags_cursor_pagination(
+    client: AsyncClient,
+    create_test_tag
+):
+    """
+    Тест курсорной пагинации.
+    Переход по next_cursor должен последовательно вернуть все теги.
+    """
+    for name in ["django", "fastapi", "flask", "python", "rust"]:
+        await create_test_tag(name)
+
+    names = []
+    cursor = None
+    for _ in range(3):
+        url = "/api/v1/tags?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        response = await client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 5
+        names.extend(tag["name"] for tag in data["items"])
+        cursor = data["next_cursor"]
+
+    assert names == ["django", "fastapi", "flask", "python", "rust"]
+    assert cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_tags_invalid_cursor(client: AsyncClient):
+    """
+    Тест некорректного курсора.
+    Должен вернуть 400 BAD REQUEST.
+    """
+    response = await client.get("/api/v1/tags?cursor=invalid")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_tags_conditional_request(client: AsyncClient, create_test_tag, mocker):
+    """
+    Тест условного запроса списка тегов.
+    Совпавший If-None-Match должен вернуть 304 без обращения к БД,
+    а изменение тегов — новую страницу с новым ETag.
+    """
+    await create_test_tag("python")
+
+    response = await client.get("/api/v1/tags")
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+    assert "must-revalidate" in response.headers["Cache-Control"]
+
+    fetch = mocker.spy(db, "fetch")
+    response = await client.get("/api/v1/tags", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    assert fetch.call_count == 0
+
+    await create_test_tag("fastapi")
+
+    response = await client.get("/api/v1/tags", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert response.json()["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_tags_reuses_cached_total(
+    client: AsyncClient,
+    create_test_tag,
+    mocker,
+    attach_test_tags
+):
+    """
+    Тест кэширования общего количества тегов.
+    После изменения счётчиков использования страницы должны читаться
+    без повторного подсчёта, а после создания тега — с новым количеством.
+    """
+    tag = await create_test_tag("python")
+    await create_test_tag("pytest")
+    article_id = await db.execute(
+        "INSERT INTO articles (title, content) VALUES (%s, %s)", "First", "Content"
+    )
+
+    response = await client.get("/api/v1/tags?search=py")
+    assert response.json()["total"] == 2
+
+    await attach_test_tags(article_id, [tag["id"]])
+
+    get_tags_page = mocker.spy(TagRepository, "get_tags_page")
+    get_tags_count = mocker.spy(TagRepository, "get_tags_count")
+
+    response = await client.get("/api/v1/tags?search=py")
+    assert response.json()["total"] == 2
+    assert get_tags_page.call_count == 0
+    assert get_tags_count.call_count == 0
+
+    await create_test_tag("pydantic")
+
+    response = await client.get("/api/v1/tags?search=py")
+    assert response.json()["total"] == 3
@@ -0,0 +1,74 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+
+@pytest.mark.asyncio
+async def test_resolve_tags_by_ids_and_names(client: AsyncClient):
+    """
+    Тест получения тегов по ID и названиям.
+    Должен вернуть найденные теги и перечислить ненайденные ID и названия.
+    """
+    python = (await client.post("/api/v1/tags", json={"name": "python"})).json()
+    await client.post("/api/v1/tags", json={"name": "redis"})
+
+    response = await client.post(
+        "/api/v1/tags/resolve",
+        json={"ids": [python["id"], 999999], "names": ["Redis", "unknown"]}
+    )
+    assert response.status_code == status.HTTP_200_OK, f"Ошибка: {response.text}"
+
+    data = response.json()
+    assert sorted(tag["name"] for tag in data["items"]) == ["python", "redis"]
+    assert data["missing_ids"] == [999999]
+    assert data["missing_names"] == ["unknown"]
+
+
+@pytest.mark.asyncio
+async def test_resolve_tags_deduplicates_results(client: AsyncClient):
+    """
+    Тест получения одного тега по ID и по названию.
+    Тег должен встречаться в ответе один раз.
+    """
+    python = (await client.post("/api/v1/tags", json={"name": "python"})).json()
+
+    for _ in range(2):
+        response = await client.post(
+            "/api/v1/tags/resolve",
+            json={"ids": [python["id"]], "names": ["python"]}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        data = response.json()
+        assert [tag["id"] for tag in data["items"]] == [python["id"]]
+        assert data["missing_ids"] == []
+        assert data["missing_names"] == []
+
+
+@pytest.mark.asyncio
+async def test_resolve_tags_after_delete(client: AsyncClient):
+    """
+    Тест получения удалённого тега.
+    Удалённый тег не должен возвращаться из кэша.
+    """
+    python = (await client.post("/api/v1/tags", json={"name": "python"})).json()
+
+    response = await client.post("/api/v1/tags/resolve", json={"names": ["python"]})
+    assert len(response.json()["items"]) == 1
+
+    response = await client.delete(f"/api/v1/tags/{python['id']}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = await client.post("/api/v1/tags/resolve", json={"names": ["python"]})
+    assert response.json()["items"] == []
+    assert response.json()["missing_names"] == ["python"]
+
+
+@pytest.mark.asyncio
+async def test_resolve_tags_too_many(client: AsyncClient):
+    """
+    Тест получения более 100 тегов за запрос.
+    Должен вернуть 422 UNPROCESSABLE ENTITY.
+    """
+    response = await client.post("/api/v1/tags/resolve", json={"ids": list(range(101))})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
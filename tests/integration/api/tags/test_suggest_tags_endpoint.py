@@ -0,0 +1,86 @@
+import pytest
+from httpx import AsyncClient
+from fastapi import status
+
+from app.core.dependencies.common import db, cache, tag_search_index
+
+
+@pytest.mark.asyncio
+async def test_suggest_tags_prefix_and_infix(
+    client: AsyncClient,
+    create_test_tag
+):
+    """
+    Тест подсказок тегов.
+    Сначала должны идти теги, начинающиеся с запроса, затем содержащие его.
+    """
+    for name in ["python", "cpython", "pytest", "django"]:
+        await create_test_tag(name)
+
+    response = await client.get("/api/v1/tags/suggest?q=PY")
+    assert response.status_code == status.HTTP_200_OK
+    assert [tag["name"] for tag in response.json()["items"]] == [
+        "pytest", "python", "cpython"
+    ]
+
+    response = await client.get("/api/v1/tags/suggest?q=py&limit=1")
+    assert [tag["name"] for tag in response.json()["items"]] == ["pytest"]
+
+
+@pytest.mark.asyncio
+async def test_suggest_tags_follows_tag_changes(
+    client: AsyncClient,
+    create_test_tag
+):
+    """
+    Тест синхронизации подсказок с изменениями тегов.
+    Созданные теги должны появляться, а удалённые — пропадать.
+    """
+    python_tag = await create_test_tag("python")
+
+    response = await client.get("/api/v1/tags/suggest?q=th")
+    assert [tag["name"] for tag in response.json()["items"]] == ["python"]
+
+    await create_test_tag("pythonic")
+    await client.delete(f"/api/v1/tags/{python_tag['id']}")
+
+    response = await client.get("/api/v1/tags/suggest?q=th")
+    assert [tag["name"] for tag in response.json()["items"]] == ["pythonic"]
+
+
+@pytest.mark.asyncio
+async def test_suggest_tags_rebuilds_index_in_background(
+    client: AsyncClient,
+    create_test_tag
+):
+    """
+    Тест перестроения индекса после изменения каталога другим воркером.
+    Запрос должен сразу получить подсказки по прежнему индексу, а новый
+    тег — появиться после фонового перестроения.
+    """
+    await create_test_tag("python")
+
+    response = await client.get("/api/v1/tags/suggest?q=py")
+    assert [tag["name"] for tag in response.json()["items"]] == ["python"]
+
+    # Изменение другим воркером: тег в БД и новая версия каталога без
+    # инкрементального обновления индекса этого воркера.
+    await db.execute("INSERT INTO tags (name) VALUES (%s)", "pytest")
+    await cache.increment("tag:catalog:version", expire=None)
+
+    response = await client.get("/api/v1/tags/suggest?q=py")
+    assert [tag["name"] for tag in response.json()["items"]] == ["python"]
+
+    await tag_search_index.rebuild_task
+
+    response = await client.get("/api/v1/tags/suggest?q=py")
+    assert [tag["name"] for tag in response.json()["items"]] == ["pytest", "python"]
+
+@pytest.mark.asyncio
+async def test_suggest_tags_query_validation(client: AsyncClient):
+    """
+    Тест валидации строки поиска.
+    Должен возвращать 422 UNPROCESSABLE ENTITY для запроса короче 2 символов.
+    """
+    response = await client.get("/api/v1/tags/suggest?q=p")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,45 @@
+import pytest
+
+from app.api.v1.articles.postings import PostingList, intersect, union
+
+
+def posting_list(ids, before=None, batch_size=2):
+    """Создаёт PostingList поверх списка ID в памяти и считает запросы пачек."""
+    ordered = sorted(ids, reverse=True)
+    calls = []
+
+    async def fetch(after, limit):
+        calls.append(after)
+        return [i for i in ordered if after is None or i < after][:limit]
+
+    posting = PostingList(fetch, before, batch_size)
+    posting.calls = calls
+    return posting
+
+
+@pytest.mark.asyncio
+async def test_intersect_and_union():
+    """
+    Тест пересечения и объединения списков ID.
+    Результаты должны идти по убыванию ID без повторов и с учётом курсора.
+    """
+    first = [1, 3, 5, 7, 9, 11]
+    second = [2, 3, 4, 7, 8, 11]
+
+    assert await intersect([posting_list(first), posting_list(second)], 10) == [11, 7, 3]
+    assert await intersect([posting_list(first, 11), posting_list(second, 11)], 1) == [7]
+    assert await union([posting_list(first), posting_list(second)], 5) == [11, 9, 8, 7, 5]
+    assert await intersect([posting_list(first), posting_list([])], 10) == []
+
+
+@pytest.mark.asyncio
+async def test_intersect_seeks_over_long_list():
+    """
+    Тест пропуска длинного списка при пересечении.
+    Чтение длинного списка должно начинаться сразу с ID кандидата.
+    """
+    rare = posting_list([10, 500_000], batch_size=100)
+    common = posting_list(range(1, 1_000_000), batch_size=100)
+
+    assert await intersect([rare, common], 10) == [500_000, 10]
+    assert common.calls == [500_001, 11]
@@ -0,0 +1,54 @@
+from app.api.v1.articles.search_index import ArticleSearchIndex, tokenize
+
+
+def test_search_ranks_by_relevance():
+    """
+    Тест ранжирования BM25.
+    Статья с большим числом вхождений слова запроса должна идти первой.
+    """
+    index = ArticleSearchIndex()
+    index.add(1, "Docker basics", "Containers and images")
+    index.add(2, "Web frameworks", "Django, Flask and FastAPI compared")
+    index.add(3, "FastAPI tutorial", "Building APIs with FastAPI")
+
+    assert index.search("fastapi", limit=10) == ([3, 2], 2)
+    assert index.search("fastapi", limit=1, offset=1) == ([2], 2)
+    assert index.search("kubernetes", limit=10) == ([], 0)
+
+
+def test_reindex_and_remove():
+    """
+    Тест переиндексации и удаления статьи.
+    После изменения статья должна находиться только по новым словам.
+    """
+    index = ArticleSearchIndex()
+    index.add(1, "Python", "Asyncio")
+    index.add(1, "Rust", "Tokio")
+
+    assert index.search("python", limit=10) == ([], 0)
+    assert index.search("tokio", limit=10) == ([1], 1)
+
+    index.remove(1)
+    assert len(index) == 0
+    assert index.search("tokio", limit=10) == ([], 0)
+
+
+def test_tokenize_matches_innodb_fulltext():
+    """
+    Тест разбиения текста на слова.
+    Должен отбрасывать слова короче 3 символов и стоп-слова InnoDB, как индекс FULLTEXT.
+    """
+    assert tokenize("The Go way: what is FastAPI, and asyncio?") == ["way", "fastapi", "and", "asyncio"]
+
+
+def test_add_reports_changes():
+    """
+    Тест повторного добавления статьи.
+    Должен сообщать об изменении, только если изменились слова статьи.
+    """
+    index = ArticleSearchIndex()
+
+    assert index.add(1, "Python", "Asyncio") is True
+    assert index.add(1, "Python", "Asyncio!") is False
+    assert index.add(1, "Python", "Trio") is True
+    assert index.search("trio", limit=10) == ([1], 1)
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from app.core.logging import logger, SampledLogger
+from app.core.settings import settings
+from app.api.storage.database import record_query
+
+
+@pytest.fixture
+def messages():
+    """Собирает сообщения loguru уровня DEBUG и выше."""
+    records = []
+    sink_id = logger.add(lambda message: records.append(message.record), level="DEBUG", format="{message}")
+    yield records
+    logger.remove(sink_id)
+
+
+def test_sampled_logger_skips_disabled_level(messages, mocker):
+    """
+    Тест логгера с выборкой при уровне выше DEBUG.
+    Должен отбрасывать сообщение без розыгрыша выборки.
+    """
+    rand = mocker.patch("app.core.logging.random.random", return_value=0.0)
+    sampled = SampledLogger(0.5, "INFO")
+
+    sampled.debug("Запрос {}", 1)
+
+    assert messages == []
+    rand.assert_not_called()
+
+
+def test_sampled_logger_sample_rate(messages, mocker):
+    """
+    Тест доли записываемых сообщений.
+    Должен записывать сообщение, только если случайное число меньше sample_rate.
+    """
+    mocker.patch("app.core.logging.random.random", side_effect=[0.1, 0.9, 0.4])
+    sampled = SampledLogger(0.5, "DEBUG")
+
+    for i in range(3):
+        sampled.debug("Запрос {}", i)
+
+    assert [record["message"] for record in messages] == ["Запрос 0", "Запрос 2"]
+
+
+def test_sampled_logger_full_rate(messages, mocker):
+    """
+    Тест логгера с sample_rate = 1.
+    Должен записывать все сообщения без розыгрыша выборки.
+    """
+    rand = mocker.patch("app.core.logging.random.random")
+    sampled = SampledLogger(1.0, "DEBUG")
+
+    sampled.debug("Запрос {}", 1)
+    sampled.debug("Запрос {}", 2)
+
+    assert len(messages) == 2
+    rand.assert_not_called()
+
+
+def test_record_query_logs_slow_query(messages, monkeypatch):
+    """
+    Тест учёта медленного запроса.
+    Должен логировать запрос дольше LOG_SLOW_QUERY_MS с предупреждением.
+    """
+    monkeypatch.setattr(settings, "LOG_SLOW_QUERY_MS", 50.0)
+
+    record_query(time.perf_counter() - 0.1, "tags.get_tags", "SELECT * FROM tags WHERE id = %s", (1,))
+
+    assert len(messages) == 1
+    assert messages[0]["level"].name == "WARNING"
+    assert "SELECT * FROM tags WHERE id = %s" in messages[0]["message"]
+
+
+def test_record_query_skips_fast_query(messages, monkeypatch):
+    """
+    Тест учёта быстрого запроса.
+    Должен учитывать запрос только в метриках, без записи в лог.
+    """
+    monkeypatch.setattr(settings, "LOG_SLOW_QUERY_MS", 50.0)
+
+    record_query(time.perf_counter(), "tags.get_tags", "SELECT 1", ())
+
+    assert messages == []
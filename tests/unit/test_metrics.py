@@ -0,0 +1,63 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.core.metrics import Counter, Histogram, MetricsMiddleware, http_request_duration, key_prefix
+
+
+def test_histogram_buckets_are_cumulative():
+    """
+    Тест гистограммы.
+    Корзины должны быть накопительными, значение на границе —
+    попадать в эту корзину.
+    """
+    histogram = Histogram("test_seconds", "Тест", ("query",), buckets=(0.1, 1.0))
+    for value in (0.1, 0.5, 2.0):
+        histogram.observe(value, "tags.get_tags")
+
+    lines = list(histogram.collect())
+    assert lines == [
+        'test_seconds_bucket{query="tags.get_tags",le="0.1"} 1',
+        'test_seconds_bucket{query="tags.get_tags",le="1.0"} 2',
+        'test_seconds_bucket{query="tags.get_tags",le="+Inf"} 3',
+        'test_seconds_sum{query="tags.get_tags"} 2.6',
+        'test_seconds_count{query="tags.get_tags"} 3',
+    ]
+
+
+def test_counter_and_key_prefix():
+    """
+    Тест счётчика с префиксом ключа кэша в метке.
+    Ключи одного пространства должны попадать в один набор меток.
+    """
+    counter = Counter("test_total", "Тест", ("prefix",))
+    counter.inc(key_prefix("tag:id:1"))
+    counter.inc(key_prefix("tag:id:2"))
+    counter.inc(key_prefix("tag:list:v3:python:20:0:"))
+
+    assert list(counter.collect()) == [
+        'test_total{prefix="tag:id"} 2.0',
+        'test_total{prefix="tag:list"} 1.0',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_middleware_uses_route_template():
+    """
+    Тест middleware метрик.
+    Запросы должны учитываться по шаблону маршрута, а не по пути.
+    """
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        await client.get("/items/1")
+        await client.get("/items/2")
+
+    rendered = "\n".join(http_request_duration.collect())
+    assert 'http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"} 2' in rendered
+    assert "/items/1" not in rendered
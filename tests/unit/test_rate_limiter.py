@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.api.security.rate_limiter import RateLimiter
+from app.core.metrics import rate_limit_redis_failures
+
+
+def make_limiter(mocker, script) -> RateLimiter:
+    """Создаёт ограничитель, скрипт Redis которого заменён на script."""
+    cache = mocker.Mock()
+    cache.client.register_script.return_value = mocker.Mock(
+        side_effect=script, registered_client=cache.client
+    )
+    return RateLimiter(cache)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_skips_check_on_redis_timeout(mocker, monkeypatch):
+    """
+    Тест ограничителя при медленном Redis.
+    Должен пропустить запрос без локальной корзины и учесть таймаут в метрике.
+    """
+    monkeypatch.setattr(rate_limit_redis_failures, "_values", {})
+
+    async def script(keys, args):
+        await asyncio.sleep(1)
+
+    limiter = make_limiter(mocker, script)
+    fallback = mocker.spy(limiter._fallback, "hit")
+
+    for _ in range(3):
+        assert await limiter.hit("ratelimit:test", 1, 60) == 0
+
+    fallback.assert_not_called()
+    assert rate_limit_redis_failures._values == {("skipped",): 3.0}
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_falls_back_on_connection_error(mocker, monkeypatch):
+    """
+    Тест ограничителя при недоступном Redis.
+    Должен проверять запросы по локальной корзине токенов воркера.
+    """
+    monkeypatch.setattr(rate_limit_redis_failures, "_values", {})
+
+    async def script(keys, args):
+        raise RedisConnectionError("Connection refused")
+
+    limiter = make_limiter(mocker, script)
+
+    assert await limiter.hit("ratelimit:test", 1, 60) == 0
+    assert await limiter.hit("ratelimit:test", 1, 60) > 0
+    assert rate_limit_redis_failures._values == {("local",): 2.0}
@@ -0,0 +1,180 @@
+import asyncio
+
+import aiomysql
+import pytest
+
+from app.core.dependencies.common import db
+from app.core.settings import settings
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_acquires():
+    """
+    Тест статистики пула соединений.
+    Каждое получение соединения должно учитываться, а после запроса
+    соединение должно вернуться в пул.
+    """
+    acquire_count = db.stats["acquire_count"]
+
+    await db.fetch("SELECT 1 AS value")
+
+    stats = db.get_pool_stats()
+    assert stats["acquire_count"] == acquire_count + 1
+    assert stats["in_use"] == 0
+    assert stats["maxsize"] == settings.MYSQL_POOL_MAXSIZE
+
+
+@pytest.mark.asyncio
+async def test_pool_acquire_timeout(monkeypatch):
+    """
+    Тест таймаута ожидания соединения.
+    При исчерпанном пуле запрос должен завершиться TimeoutError,
+    таймаут — попасть в статистику, а соединения — не теряться.
+    """
+    monkeypatch.setattr(settings, "MYSQL_POOL_ACQUIRE_TIMEOUT", 0.1)
+    connections = [await db.pool.acquire() for _ in range(db.pool.maxsize)]
+    timeouts = db.stats["acquire_timeouts"]
+
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await db.fetch("SELECT 1 AS value")
+        assert db.stats["acquire_timeouts"] == timeouts + 1
+        assert db.get_pool_stats()["idle"] == 0
+    finally:
+        for connection in connections:
+            await db.pool.release(connection)
+
+    await asyncio.sleep(0.05)
+    assert db.get_pool_stats()["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_transaction_commit_and_rollback():
+    """
+    Тест транзакций.
+    Изменения должны фиксироваться при успешном выходе из блока
+    и откатываться при исключении.
+    """
+    async with db.transaction() as tx:
+        await tx.executemany(
+            "INSERT INTO tags (name) VALUES (%s)",
+            [("python",), ("django",)]
+        )
+        rows = await tx.fetch("SELECT COUNT(*) AS count FROM tags")
+        assert rows[0]["count"] == 2
+
+    with pytest.raises(RuntimeError):
+        async with db.transaction() as tx:
+            await tx.execute("INSERT INTO tags (name) VALUES (%s)", "flask")
+            raise RuntimeError("rollback")
+
+    rows = await db.fetch("SELECT name FROM tags ORDER BY name")
+    assert [row["name"] for row in rows] == ["django", "python"]
+    assert db.get_pool_stats()["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_transactions_use_separate_connections():
+    """
+    Тест конкурентных транзакций.
+    Откат одной транзакции не должен затрагивать другую.
+    """
+    async def insert(name: str, fail: bool):
+        async with db.transaction() as tx:
+            await tx.execute("INSERT INTO tags (name) VALUES (%s)", name)
+            await asyncio.sleep(0.05)
+            if fail:
+                raise RuntimeError("rollback")
+
+    results = await asyncio.gather(
+        insert("python", fail=False),
+        insert("django", fail=True),
+        return_exceptions=True
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], RuntimeError)
+    rows = await db.fetch("SELECT name FROM tags")
+    assert [row["name"] for row in rows] == ["python"]
+
+
+@pytest.mark.asyncio
+async def test_reads_are_routed_to_replicas(monkeypatch):
+    """
+    Тест распределения чтений по репликам.
+    Чтения должны идти на реплику, а после записи в том же контексте —
+    на основной сервер.
+    """
+    monkeypatch.setattr(db, "replica_pools", [db.pool])
+    monkeypatch.setattr(db, "replica_healthy", [True])
+    monkeypatch.setattr(db, "replicas", [("replica", 3306)])
+
+    async def read_then_write():
+        reads = db.stats["replica_reads"]
+        await db.fetch("SELECT 1 AS value")
+        assert db.stats["replica_reads"] == reads + 1
+
+        await db.execute("INSERT INTO tags (name) VALUES (%s)", "python")
+        rows = await db.fetch("SELECT name FROM tags")
+        assert [row["name"] for row in rows] == ["python"]
+        assert db.stats["replica_reads"] == reads + 1
+
+    # Отдельная задача — отдельный контекст, как у отдельного HTTP-запроса.
+    await asyncio.create_task(read_then_write())
+
+
+@pytest.mark.asyncio
+async def test_failing_replica_is_taken_out_of_rotation(monkeypatch):
+    """
+    Тест отказа реплики.
+    Запрос должен быть выполнен на основном сервере, а реплика —
+    выведена из ротации.
+    """
+    monkeypatch.setattr(settings, "MYSQL_CONNECT_TIMEOUT", 1)
+    replica = await db._create_pool("127.0.0.1", 1, 0)
+    monkeypatch.setattr(db, "replica_pools", [replica])
+    monkeypatch.setattr(db, "replica_healthy", [True])
+    monkeypatch.setattr(db, "replicas", [("127.0.0.1", 1)])
+
+    try:
+        rows = await db.fetch("SELECT 1 AS value")
+        assert rows == [{"value": 1}]
+        assert db.replica_healthy == [False]
+        assert db.stats["replica_failovers"] >= 1
+    finally:
+        replica.close()
+        await replica.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_busy_replica_stays_in_rotation(monkeypatch):
+    """
+    Тест таймаута ожидания соединения реплики.
+    Запрос должен быть выполнен на основном сервере, а реплика —
+    остаться в ротации.
+    """
+    monkeypatch.setattr(settings, "MYSQL_POOL_ACQUIRE_TIMEOUT", 0.1)
+    replica = await aiomysql.create_pool(
+        host=settings.MYSQL_HOST,
+        port=settings.MYSQL_PORT,
+        user=settings.MYSQL_USER,
+        password=settings.MYSQL_PASSWORD,
+        db=settings.MYSQL_DATABASE,
+        minsize=1,
+        maxsize=1
+    )
+    monkeypatch.setattr(db, "replica_pools", [replica])
+    monkeypatch.setattr(db, "replica_healthy", [True])
+    monkeypatch.setattr(db, "replicas", [("replica", 3306)])
+
+    connection = await replica.acquire()
+    timeouts = db.stats["replica_acquire_timeouts"]
+    try:
+        rows = await db.fetch("SELECT 1 AS value")
+        assert rows == [{"value": 1}]
+        assert db.replica_healthy == [True]
+        assert db.stats["replica_acquire_timeouts"] == timeouts + 1
+    finally:
+        await replica.release(connection)
+        replica.close()
+        await replica.wait_closed()
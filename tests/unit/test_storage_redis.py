@@ -0,0 +1,212 @@
+import asyncio
+
+import pytest
+
+from app.api.storage.local_cache import LocalCache
+from app.api.storage.database import Database
+from app.api.storage.redis import RedisManager
+from app.core.dependencies.common import cache
+from app.core.settings import settings
+
+
+def test_local_cache_evicts_least_recently_used():
+    """
+    Тест вытеснения из локального кэша.
+    При переполнении должен удаляться давно не использованный ключ.
+    """
+    local = LocalCache(maxsize=2, ttl=60)
+    local.set("a", "1")
+    local.set("b", "2")
+    local.get("a")
+    local.set("c", "3")
+
+    assert local.get("a") == "1"
+    assert local.get("b") is None
+    assert local.get("c") == "3"
+
+
+def test_local_cache_expires_entries():
+    """
+    Тест истечения TTL в локальном кэше.
+    Устаревшая запись не должна возвращаться.
+    """
+    local = LocalCache(maxsize=10, ttl=60)
+    local.set("a", "1", ttl=0)
+
+    assert local.get("a") is None
+    assert len(local) == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_manager_invalidates_other_instances(monkeypatch):
+    """
+    Тест инвалидации локального кэша между экземплярами.
+    Изменение ключа в одном экземпляре должно сбрасывать копию в другом.
+    """
+    monkeypatch.setattr(settings, "LOCAL_CACHE_ENABLED", True)
+    first = RedisManager()
+    other = RedisManager()
+    await first.connect()
+    await other.connect()
+    try:
+        await first.set("tag:test", "old")
+        assert await other.get("tag:test") == "old"
+
+        await first.set("tag:test", "new")
+        await asyncio.sleep(0.1)
+        assert await other.get("tag:test") == "new"
+
+        await first.delete("tag:test")
+        await asyncio.sleep(0.1)
+        assert await other.get("tag:test") is None
+    finally:
+        await first.close()
+        await other.close()
+
+
+def test_redis_manager_local_cache_disabled_by_default():
+    """
+    Тест локального кэша по умолчанию.
+    Локальный кэш воркера должен включаться только явно.
+    """
+    assert type(settings).model_fields["LOCAL_CACHE_ENABLED"].default is False
+    assert RedisManager().local is None
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_coalesces_concurrent_misses():
+    """
+    Тест объединения одновременных промахов.
+    Конкурентные запросы одного ключа должны вызвать загрузку один раз.
+    """
+    calls = 0
+
+    async def loader() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "value"
+
+    results = await asyncio.gather(
+        *(cache.get_or_set("tag:coalesce", loader, 60) for _ in range(10))
+    )
+
+    assert results == ["value"] * 10
+    assert calls == 1
+    assert await cache.get("tag:coalesce") == "value"
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_serves_stale_and_refreshes():
+    """
+    Тест режима stale-while-revalidate.
+    После soft TTL должно возвращаться старое значение, а новое
+    загружаться в фоне.
+    """
+    version = 0
+
+    async def loader() -> str:
+        nonlocal version
+        version += 1
+        return f"v{version}"
+
+    assert await cache.get_or_set("tag:swr", loader, 60, soft_expire=0) == "v1"
+
+    stale_hits = cache.stats["stale_hits"]
+    assert await cache.get_or_set("tag:swr", loader, 60, soft_expire=0) == "v1"
+    assert cache.stats["stale_hits"] == stale_hits + 1
+
+    await asyncio.sleep(0.1)
+    assert await cache.get_or_set("tag:swr", loader, 60, soft_expire=60) == "v2"
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_loads_after_failed_refresh():
+    """
+    Тест промаха во время неудачного фонового обновления.
+    Промах должен дождаться обновления и загрузить значение сам,
+    а не получить пустую строку.
+    """
+    async def loader() -> str:
+        return "v1"
+
+    async def failing_loader() -> str:
+        await asyncio.sleep(0.05)
+        raise RuntimeError("Database error")
+
+    assert await cache.get_or_set("tag:refresh_error", loader, 60, soft_expire=0) == "v1"
+    assert await cache.get_or_set("tag:refresh_error", failing_loader, 60, soft_expire=0) == "v1"
+
+    await cache.delete("tag:refresh_error")
+
+    async def new_loader() -> str:
+        return "v2"
+
+    assert await cache.get_or_set("tag:refresh_error", new_loader, 60, soft_expire=60) == "v2"
+
+
+@pytest.mark.asyncio
+async def test_refresh_returns_none_when_locked_read_fails(mocker):
+    """
+    Тест обновления ключа, который обновляет другой экземпляр.
+    Ошибка чтения ключа из Redis должна давать None, а не исключение.
+    """
+    async def loader() -> str:
+        return "value"
+
+    mocker.patch.object(cache, "acquire_lock", mocker.AsyncMock(return_value=False))
+    mocker.patch.object(cache.client, "get", side_effect=ConnectionError("Connection lost"))
+
+    assert await cache._refresh("tag:locked", loader, 60, 30) is None
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_reads_primary_after_invalidation(monkeypatch):
+    """
+    Тест загрузки в кэш сразу после инвалидации.
+    В окне MYSQL_READ_YOUR_WRITES_WINDOW загрузка должна читать основной
+    сервер, после него — реплики.
+    """
+    monkeypatch.setattr(settings, "MYSQL_REPLICA_HOSTS", "replica:3306")
+    database = Database()
+    database.replica_pools = [object()]
+    database.replica_healthy = [True]
+    replicas = []
+
+    async def loader() -> str:
+        replicas.append(database._read_replica())
+        return "value"
+
+    async with cache.pipeline() as pipe:
+        pipe.mark_invalidated()
+    await cache.get_or_set("tag:after_invalidation", loader, 60)
+
+    await cache.client.delete("cache:invalidated")
+    await cache.delete("tag:after_invalidation")
+    await cache.get_or_set("tag:after_invalidation", loader, 60)
+
+    assert replicas == [None, 0]
+
+
+@pytest.mark.asyncio
+async def test_batch_operations():
+    """
+    Тест пакетных операций.
+    mset/mget/delete должны работать с несколькими ключами сразу,
+    а increment — выставлять TTL в той же транзакции.
+    """
+    await cache.mset({"tag:a": "1", "tag:b": "2"}, {"tag:a": 60, "tag:b": 120})
+    assert await cache.mget(["tag:a", "tag:b", "tag:c"]) == ["1", "2", None]
+    assert 60 < await cache.client.ttl("tag:b") <= 120
+
+    await cache.delete("tag:a", "tag:b")
+    assert await cache.mget(["tag:a", "tag:b"]) == [None, None]
+
+    assert await cache.increment("tag:counter", expire=30) == 1
+    assert await cache.increment("tag:counter", expire=30) == 2
+    assert 0 < await cache.client.ttl("tag:counter") <= 30
+
+    async with cache.pipeline(keys=["tag:counter"]) as pipe:
+        pipe.incr("tag:counter")
+        pipe.get("tag:counter")
+    assert pipe.results[:2] == [3, "3"]
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from app.api.v1.streaming import ClosingStreamingResponse
+
+
+def make_content(events: list):
+    """Создаёт генератор содержимого, отмечающий своё закрытие в events."""
+    async def content():
+        try:
+            for i in range(1000):
+                yield f"{i}\n"
+                await asyncio.sleep(0)
+        finally:
+            events.append("closed")
+    return content()
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_closes_content_on_disconnect():
+    """
+    Тест отключения клиента во время выгрузки.
+    Генератор содержимого должен быть закрыт сразу, а не сборщиком мусора.
+    """
+    events = []
+    disconnected = asyncio.Event()
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+        if len(sent) == 3:
+            disconnected.set()
+        await asyncio.sleep(0)
+
+    response = ClosingStreamingResponse(make_content(events), media_type="text/plain")
+    await response({"type": "http"}, receive, send)
+
+    assert events == ["closed"]
+    assert {"type": "http.response.body", "body": b"", "more_body": False} not in sent
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_timeout():
+    """
+    Тест ограничения длительности выгрузки.
+    Медленный клиент должен получить прерванный ответ, а генератор — закрыться.
+    """
+    events = []
+
+    async def receive():
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            await asyncio.sleep(1)
+
+    response = ClosingStreamingResponse(
+        make_content(events), media_type="text/plain", timeout=0.05
+    )
+    with pytest.raises(ExceptionGroup) as exc_info:
+        await response({"type": "http"}, receive, send)
+
+    assert exc_info.group_contains(TimeoutError)
+    assert events == ["closed"]
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+from app.api.v1.tags.services import TagService
+from app.core import tasks
+from app.core.tasks import reconcile_tag_usage_counts
+
+
+@pytest.mark.asyncio
+async def test_reconcile_tag_usage_counts_runs_at_startup(mocker):
+    """
+    Тест запуска сверки счётчиков использования тегов.
+    Должен выполнить сверку сразу, не дожидаясь первого интервала.
+    """
+    events = []
+    cache = mocker.Mock()
+    cache.acquire_lock = mocker.AsyncMock(return_value=True)
+
+    async def reconcile(self):
+        events.append("reconcile")
+        return []
+
+    async def sleep(delay):
+        events.append("sleep")
+        raise asyncio.CancelledError
+
+    mocker.patch.object(TagService, "reconcile_usage_counts", reconcile)
+    mocker.patch.object(tasks.asyncio, "sleep", sleep)
+
+    with pytest.raises(asyncio.CancelledError):
+        await reconcile_tag_usage_counts(mocker.Mock(), cache, mocker.Mock())
+
+    assert events == ["reconcile", "sleep"]